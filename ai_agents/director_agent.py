@@ -17,13 +17,13 @@ The Director:
 
 import os
 import sys
-import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Add parent directory to path for api.py import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from dotenv import load_dotenv
-from openai import OpenAI
 from termcolor import cprint
 
 # Load environment variables
@@ -31,6 +31,10 @@ load_dotenv()
 
 # Import after path setup
 from api import MoonDevAPI
+from ai_agents.plan import api_signatures, build_plan
+from ai_agents.summarize import summarize_results
+from ai_agents.llm_cache import cache_key, default_llm_cache
+from ai_agents.openrouter import get_client
 from ai_agents.swarm_agent import SwarmAgent
 
 # ============================================
@@ -155,6 +159,19 @@ AVAILABLE HYPERLIQUID API ENDPOINTS (Moon Dev's Data Layer):
 
 # Director model (Grok 4 Fast via OpenRouter for SPEED!)
 DIRECTOR_MODEL = "x-ai/grok-4-fast"  # Fast reasoning model via OpenRouter
+DIRECTOR_MAX_TOKENS = 1024
+DIRECTOR_TEMPERATURE = 0.7
+LLM_CACHE = None  # True (or a directory) reuses answers to repeated prompts for 30s - see ai_agents/llm_cache.py
+
+# ============================================
+# 🎯 PLAN EXECUTION - Moon Dev
+# ============================================
+FETCH_WORKERS = 16      # API calls from one plan run concurrently (up to this many at once)
+CALL_TIMEOUT = 20       # Seconds a call may run before the Director stops waiting for it
+MIN_SWARM_DATA = None   # Start the swarm once this many calls succeeded (None = wait for every call)
+DATA_TOKEN_BUDGET = 6000  # Approximate tokens of API data in the swarm prompt (shared by all calls)
+
+API_SIGNATURES = api_signatures()
 
 
 class DirectorAgent:
@@ -165,20 +182,18 @@ class DirectorAgent:
     executes with AI swarm for multi-perspective insights.
     """
 
-    def __init__(self):
+    def __init__(self, cache=LLM_CACHE):
+        """
+        Args:
+            cache: Reuse Director and Swarm answers to repeated prompts - True, a directory or an LLMCache
+        """
         cprint("\n" + "=" * 60, "cyan")
         cprint("🌙 Moon Dev's Director Agent", "cyan", attrs=['bold'])
         cprint("=" * 60, "cyan")
 
-        openrouter_key = os.getenv("OPENROUTER_API_KEY")
-        if not openrouter_key:
-            raise ValueError("OPENROUTER_API_KEY not found in environment!")
-
-        # OpenRouter client for Director (Grok 4 Fast - SPEED!)
-        self.client = OpenAI(
-            api_key=openrouter_key,
-            base_url="https://openrouter.ai/api/v1"
-        )
+        # OpenRouter client for Director (Grok 4 Fast - SPEED!), shared with the Swarm
+        self.client = get_client()
+        self.cache = default_llm_cache(cache)
 
         # MoonDevAPI for data fetching
         cprint("\n📡 Connecting to Moon Dev API...", "yellow")
@@ -190,7 +205,7 @@ class DirectorAgent:
             cprint("✅ Moon Dev API connected", "green")
 
         # Swarm for multi-model analysis
-        self.swarm = SwarmAgent()
+        self.swarm = SwarmAgent(cache=self.cache)
 
         cprint("\n✅ Director ready!", "green")
         cprint("\n" + "-" * 60, "cyan")
@@ -205,55 +220,95 @@ class DirectorAgent:
 
 {API_KNOWLEDGE}
 
+EXACT METHOD SIGNATURES (plans must match these):
+{API_SIGNATURES}
+
 INSTRUCTIONS:
 1. Help users understand what they can analyze with these APIs
 2. When they ask for analysis, propose which API calls to make
-3. Format your plan with [PLAN] tag when proposing API calls
-4. Be concise, direct, and helpful
-5. Use Moon Dev branding
+3. Format your plan with [PLAN] tag followed by a JSON array of tool calls
+4. Each tool call is {{"call": method name, "args": {{parameter: value}}, "why": short reason}}
+   Use the exact parameter names and value types from the signatures above
+5. Be concise, direct, and helpful
+6. Use Moon Dev branding
 
 Example plan format:
 [PLAN]
-1. get_hlp_sentiment() - Check retail positioning
-2. get_liquidations("24h") - Recent liquidation pressure
-3. get_smart_money_signals("1h") - Smart money activity
+```json
+[
+  {{"call": "get_hlp_sentiment", "args": {{}}, "why": "Check retail positioning"}},
+  {{"call": "get_liquidations", "args": {{"timeframe": "24h"}}, "why": "Recent liquidation pressure"}},
+  {{"call": "get_ticks", "args": {{"symbol": "BTC", "duration": "4h"}}, "why": "Price action"}}
+]
+```
 
 When user asks "what can I do" or similar, give a helpful overview.
 When user asks for specific analysis, propose a concrete plan with [PLAN] tag.
 """
 
+        key = None
+        if self.cache is not None:
+            key = cache_key(DIRECTOR_MODEL, system_prompt, user_message, DIRECTOR_TEMPERATURE, DIRECTOR_MAX_TOKENS)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
         response = self.client.chat.completions.create(
             model=DIRECTOR_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_message}
             ],
-            max_tokens=1024,
-            temperature=0.7
+            max_tokens=DIRECTOR_MAX_TOKENS,
+            temperature=DIRECTOR_TEMPERATURE
         )
 
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+        if key is not None and content:
+            self.cache.put(key, content, DIRECTOR_MODEL)
+        return content
+
+    def execute_plan(self, plan, original_question, min_results=MIN_SWARM_DATA, call_timeout=CALL_TIMEOUT):
+        """
+        Execute API calls from plan and send to swarm
 
-    def execute_plan(self, plan_text, original_question):
-        """Execute API calls from plan and send to swarm"""
-        # Parse API calls from plan
-        api_calls = self._parse_plan(plan_text)
+        plan is the Director's [PLAN] text or the PlanCalls from review_plan().
+        Calls run concurrently and print as they land. Repeated calls are
+        fetched once. A call still running after call_timeout seconds is
+        dropped. With min_results set, the swarm starts as soon as that many
+        calls have succeeded, without waiting for the slower ones.
+        """
+        # Parse and validate API calls from plan
+        api_calls = self.review_plan(plan) if isinstance(plan, str) else plan
 
         if not api_calls:
-            cprint("❌ No API calls found in plan", "red")
+            cprint("❌ No valid API calls in plan", "red")
             return None, None
 
+        calls = self._dedupe_calls(api_calls)
+        if len(calls) < len(api_calls):
+            cprint(f"   ♻️  Skipping {len(api_calls) - len(calls)} repeated call(s)", "grey")
+
         # Execute API calls
-        cprint("\n📡 Fetching data from Moon Dev API...", "yellow")
+        cprint(f"\n📡 Fetching {len(calls)} calls from Moon Dev API in parallel...", "yellow")
+        needed = min(min_results or len(calls), len(calls))
         data = {}
-        for call in api_calls:
-            cprint(f"   → {call}", "cyan")
-            result = self._execute_api_call(call)
-            if result is not None:
+        finished = 0
+        fetches = self._fetch_concurrently(calls, call_timeout)
+        for call, result, seconds, error in fetches:
+            finished += 1
+            if error is None:
                 data[call] = result
-                cprint(f"   ✅ {call}", "green")
+                cprint(f"   ✅ {call} ({seconds:.1f}s)", "green")
             else:
-                cprint(f"   ❌ {call} - failed", "red")
+                cprint(f"   ❌ {call} - {error} ({seconds:.1f}s)", "red")
+            if len(data) >= needed:
+                break
+        fetches.close()  # Abandon whatever is still running
+
+        if finished < len(calls):
+            cprint(f"   🚀 {len(data)} results in - starting swarm without {len(calls) - finished} "
+                   f"pending call(s)", "cyan")
 
         if not data:
             cprint("❌ No data retrieved from APIs", "red")
@@ -283,64 +338,67 @@ Focus on what the numbers mean for trading decisions."""
         results = self.swarm.query(swarm_prompt, system_prompt)
         return results, data_summary
 
-    def _parse_plan(self, plan_text):
-        """Extract API calls from plan text"""
-        calls = []
-        for line in plan_text.split('\n'):
-            if 'get_' in line:
-                # Extract method call including arguments
-                start = line.find('get_')
-                end = line.find(')', start) + 1
-                if end > start:
-                    call = line[start:end]
-                    # Handle calls without closing paren
-                    if ')' not in call:
-                        # Try to find the method name at least
-                        paren = call.find('(')
-                        if paren == -1:
-                            call = call.split()[0] + "()"
-                    calls.append(call)
+    def review_plan(self, plan_text):
+        """Validate the plan's calls against MoonDevAPI signatures and show what will run"""
+        calls, errors = build_plan(plan_text)
+        for call in calls:
+            cprint(f"   📋 {call.label}", "cyan")
+        for error in errors:
+            cprint(f"   🚫 Rejected: {error}", "red")
         return calls
 
-    def _execute_api_call(self, call):
-        """Execute a single API call dynamically"""
+    def _dedupe_calls(self, calls):
+        """Drop repeated calls (same method and arguments), keeping plan order"""
+        unique = {}
+        for call in calls:
+            unique.setdefault(call.label, call)
+        return list(unique.values())
+
+    def _fetch_concurrently(self, calls, call_timeout=CALL_TIMEOUT):
+        """
+        Run PlanCalls on a thread pool, yielding (label, result, seconds, error)
+        as each one finishes. error is None on success, otherwise "failed" or
+        "timed out". A call that is still queued for a worker is timed from
+        the start of the plan.
+        """
+        executor = ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(calls)),
+                                      thread_name_prefix="director-fetch")
+        plan_started = time.monotonic()
+        started = {}
+
+        def run(call):
+            started[call.label] = time.monotonic()
+            return self._execute_api_call(call)
+
+        pending = {executor.submit(run, call): call.label for call in calls}
         try:
-            # Parse method name and arguments
-            if '(' in call:
-                method_name = call.split('(')[0]
-                args_str = call[call.find('(')+1:call.find(')')]
-            else:
-                method_name = call.strip()
-                args_str = ""
-
-            # Get method from API
-            method = getattr(self.api, method_name, None)
-            if not method:
-                cprint(f"      ⚠️  Method {method_name} not found", "yellow")
-                return None
-
-            # Execute with or without args
-            if args_str:
-                # Clean up argument string
-                args_str = args_str.strip().strip('"').strip("'")
-                return method(args_str)
-            else:
-                return method()
+            while pending:
+                deadline = min(started.get(call, plan_started) for call in pending.values()) + call_timeout
+                done, _ = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                now = time.monotonic()
+                for future in done:
+                    call = pending.pop(future)
+                    result = future.result()
+                    yield call, result, now - started[call], None if result is not None else "failed"
+                for future, call in list(pending.items()):
+                    if now - started.get(call, plan_started) >= call_timeout:
+                        del pending[future]
+                        yield call, None, now - started.get(call, plan_started), "timed out"
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
+    def _execute_api_call(self, call):
+        """Execute a single validated PlanCall"""
+        try:
+            return getattr(self.api, call.method)(**call.kwargs)
         except Exception as e:
             cprint(f"      ⚠️  Error: {str(e)[:50]}", "yellow")
             return None
 
     def _format_data(self, data):
-        """Format API data for swarm prompt"""
-        formatted = []
-        for call, result in data.items():
-            # Truncate large responses
-            result_str = json.dumps(result, indent=2, default=str)
-            if len(result_str) > 3000:
-                result_str = result_str[:3000] + "\n... [truncated]"
-            formatted.append(f"\n=== {call} ===\n{result_str}")
-        return "\n".join(formatted)
+        """Summarize API data for swarm prompt (compact stats and top-N tables within DATA_TOKEN_BUDGET)"""
+        return summarize_results(data, token_budget=DATA_TOKEN_BUDGET)
 
     def _display_results(self, results, original_data):
         """Display swarm results beautifully - FULL responses, no truncation!"""
@@ -445,24 +503,28 @@ Be specific and actionable.
 
             # Check if response contains a plan
             if "[PLAN]" in response:
-                try:
-                    confirm = input("📋 Proceed with this plan? [y/n] > ").strip().lower()
-                except (EOFError, KeyboardInterrupt):
-                    cprint("\n\n👋 Moon Dev says goodbye!", "cyan")
-                    break
-
-                if confirm == 'y':
-                    results, data_summary = self.execute_plan(response, user_input)
-                    if results and data_summary:
-                        exit_status = self._display_results(results, data_summary)
-                        if exit_status == "exit":
-                            break
-                        # Back to Director mode
-                        cprint("\n" + "-" * 60, "cyan")
-                        cprint("🎬 DIRECTOR MODE - Ask me another question!", "cyan", attrs=['bold'])
-                        cprint("-" * 60, "cyan")
+                plan = self.review_plan(response)
+                if not plan:
+                    cprint("❌ No valid API calls in this plan - ask the Director to revise it", "red")
                 else:
-                    cprint("Plan cancelled. Ask me something else!", "grey")
+                    try:
+                        confirm = input("📋 Proceed with this plan? [y/n] > ").strip().lower()
+                    except (EOFError, KeyboardInterrupt):
+                        cprint("\n\n👋 Moon Dev says goodbye!", "cyan")
+                        break
+
+                    if confirm == 'y':
+                        results, data_summary = self.execute_plan(plan, user_input)
+                        if results and data_summary:
+                            exit_status = self._display_results(results, data_summary)
+                            if exit_status == "exit":
+                                break
+                            # Back to Director mode
+                            cprint("\n" + "-" * 60, "cyan")
+                            cprint("🎬 DIRECTOR MODE - Ask me another question!", "cyan", attrs=['bold'])
+                            cprint("-" * 60, "cyan")
+                    else:
+                        cprint("Plan cancelled. Ask me something else!", "grey")
             else:
                 # No plan in response - give clear options in a loop
                 while True:
@@ -529,25 +591,29 @@ Provide your own perspective, add insights, and highlight what's most actionable
 
                         # Check if THIS response has a plan
                         if "[PLAN]" in response:
-                            try:
-                                confirm = input("📋 Proceed with this plan? [y/n] > ").strip().lower()
-                            except (EOFError, KeyboardInterrupt):
-                                cprint("\n\n👋 Moon Dev says goodbye!", "cyan")
-                                return
-
-                            if confirm == 'y':
-                                results, data_summary = self.execute_plan(response, next_action)
-                                if results and data_summary:
-                                    exit_status = self._display_results(results, data_summary)
-                                    if exit_status == "exit":
-                                        return
-                                # Break to go back to Director mode
-                                cprint("\n" + "-" * 60, "cyan")
-                                cprint("🎬 DIRECTOR MODE - Ask me another question!", "cyan", attrs=['bold'])
-                                cprint("-" * 60, "cyan")
-                                break
+                            plan = self.review_plan(response)
+                            if not plan:
+                                cprint("❌ No valid API calls in this plan - ask the Director to revise it", "red")
                             else:
-                                cprint("Plan cancelled.", "grey")
+                                try:
+                                    confirm = input("📋 Proceed with this plan? [y/n] > ").strip().lower()
+                                except (EOFError, KeyboardInterrupt):
+                                    cprint("\n\n👋 Moon Dev says goodbye!", "cyan")
+                                    return
+
+                                if confirm == 'y':
+                                    results, data_summary = self.execute_plan(plan, next_action)
+                                    if results and data_summary:
+                                        exit_status = self._display_results(results, data_summary)
+                                        if exit_status == "exit":
+                                            return
+                                    # Break to go back to Director mode
+                                    cprint("\n" + "-" * 60, "cyan")
+                                    cprint("🎬 DIRECTOR MODE - Ask me another question!", "cyan", attrs=['bold'])
+                                    cprint("-" * 60, "cyan")
+                                    break
+                                else:
+                                    cprint("Plan cancelled.", "grey")
                         # If no plan, loop continues and shows options again
 
 
@@ -0,0 +1,171 @@
+"""
+🌙 Moon Dev's LLM Response Cache
+Persistent, content-addressed cache for Director and Swarm completions
+
+Built with love by Moon Dev 🚀
+
+Every completion is stored under the SHA-256 of what produced it: model id,
+system prompt, prompt, temperature and max_tokens. The same question asked
+again about the same data inside the TTL (default 30s, the Data Layer's
+refresh window) is answered from disk. That costs no OpenRouter latency and
+no tokens. Entries expire by TTL, and the least recently used ones are
+evicted once the cache grows past max_bytes. The cache lives on disk, so
+dashboards and scripts running in separate processes share it.
+
+Usage:
+    from ai_agents import DirectorAgent, SwarmAgent
+    from ai_agents.llm_cache import LLMCache
+
+    cache = LLMCache("~/.moondev/llm_cache", ttl=30)
+    swarm = SwarmAgent(cache=cache)
+    director = DirectorAgent(cache=cache)   # Shares the cache with its swarm
+    print(cache.stats())
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+
+# ============================================
+# 🎯 LLM CACHE CONFIGURATION - Moon Dev
+# ============================================
+DEFAULT_ROOT = "~/.moondev/llm_cache"
+DEFAULT_TTL = 30                      # Data Layer endpoints refresh every 30 seconds
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024  # 16MB of cached answers
+
+# ============================================
+
+
+def cache_key(model_id, system_prompt, prompt, temperature, max_tokens=None):
+    """SHA-256 content address of one completion request"""
+    payload = json.dumps([model_id, system_prompt, prompt, temperature, max_tokens], ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """
+    🌙 Moon Dev's LLM Response Cache
+
+    One `<sha256>.json` file per answer inside `root`. Only successful,
+    complete answers are stored. Lookups read the file, so entries written by
+    other processes are seen right away. Size-based eviction only covers the
+    entries this process knows about: files found at startup plus its own
+    writes.
+
+    Args:
+        root: Directory holding the cache (created if missing)
+        ttl: Seconds an answer stays valid (default: 30)
+        max_bytes: Upper bound on cached answer bytes (default: 16MB)
+    """
+
+    def __init__(self, root=DEFAULT_ROOT, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = os.path.expanduser(root)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(self.root, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._index = {}  # key -> (last used, size)
+        for entry in os.scandir(self.root):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                self._index[entry.name[:-5]] = (stat.st_mtime, stat.st_size)
+        self.bytes = sum(size for _, size in self._index.values())
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}.json")
+
+    def get(self, key):
+        """Cached answer for a cache_key(), or None when missing or expired"""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+
+        now = time.time()
+        if entry is None or now - entry.get("created", 0) > self.ttl:
+            with self._lock:
+                self.misses += 1
+                if entry is not None:
+                    self._remove(key)
+            return None
+
+        with self._lock:
+            self.hits += 1
+            if key in self._index:
+                self._index[key] = (now, self._index[key][1])
+        try:
+            os.utime(path, (now, now))  # Last used, for LRU eviction across restarts
+        except OSError:
+            pass
+        return entry["response"]
+
+    def put(self, key, response, model_id=None):
+        """Store an answer under its cache_key() and evict the least recently used past max_bytes"""
+        body = json.dumps({"created": time.time(), "model": model_id, "response": response},
+                          ensure_ascii=False).encode()
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(body)
+        os.replace(tmp, path)  # Readers never see a half-written answer
+
+        with self._lock:
+            if key in self._index:
+                self.bytes -= self._index[key][1]
+            self._index[key] = (time.time(), len(body))
+            self.bytes += len(body)
+            while self.bytes > self.max_bytes and len(self._index) > 1:
+                oldest = min(self._index, key=lambda k: self._index[k][0])
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key):
+        """Drop one entry (caller holds the lock)"""
+        _, size = self._index.pop(key, (None, 0))
+        self.bytes -= size
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """Delete every cached answer"""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+
+    def stats(self):
+        """Snapshot of cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._index),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+def default_llm_cache(cache):
+    """Resolve the opt-in cache argument shared by both agents
+
+    True -> LLMCache in ~/.moondev/llm_cache
+    str -> LLMCache rooted at that directory
+    None/False -> every call goes to OpenRouter
+    """
+    if cache is True:
+        return LLMCache()
+    if isinstance(cache, str):
+        return LLMCache(cache)
+    return cache or None
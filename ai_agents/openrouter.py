@@ -0,0 +1,93 @@
+"""
+🌙 Moon Dev's OpenRouter Runtime
+One keep-alive OpenRouter client and one worker pool shared by every agent
+
+Built with love by Moon Dev 🚀
+
+The Director and its Swarm used to build their own OpenAI clients, and the
+Swarm span up a fresh thread pool for every query. Now both agents share one
+client. Its connection pool keeps TLS connections to OpenRouter alive
+between rounds of the interactive loop. One long-lived pool runs every model
+call. A per-model semaphore caps how many requests one model may have in
+flight across all queries. Stragglers a query has cancelled give their slot
+back right away.
+
+Usage:
+    from ai_agents.openrouter import get_client, get_executor, model_slot
+
+    client = get_client()
+    with model_slot("deepseek/deepseek-r1"):
+        client.chat.completions.create(...)
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from dotenv import load_dotenv
+from openai import DefaultHttpxClient, OpenAI
+
+# Load environment variables
+load_dotenv()
+
+# ============================================
+# 🎯 OPENROUTER CONFIGURATION - Moon Dev
+# ============================================
+OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")  # Point at ai_agents.stub_server to work offline
+
+REQUEST_TIMEOUT = 120     # Seconds per completion (matches the swarm's MODEL_TIMEOUT)
+MAX_CONNECTIONS = 32      # Connections to OpenRouter, shared by all agents
+KEEPALIVE_EXPIRY = 300    # Keep idle connections long enough to survive reading a swarm answer
+WORKERS = 32              # Threads running model calls, shared by all agents
+
+DEFAULT_MODEL_CONCURRENCY = 4   # Requests one model may have in flight at once
+MODEL_CONCURRENCY = {           # Overrides per model id
+    "deepseek/deepseek-r1": 2,  # Slow reasoning model - don't pile up requests
+}
+
+# ============================================
+
+_lock = threading.Lock()
+_client = None
+_executor = None
+_slots = {}
+
+
+def get_client():
+    """The shared OpenAI client for OpenRouter (created on first use)"""
+    global _client
+    with _lock:
+        if _client is None:
+            api_key = os.getenv("OPENROUTER_API_KEY")
+            if not api_key:
+                raise ValueError("OPENROUTER_API_KEY not found in environment!")
+            _client = OpenAI(
+                api_key=api_key,
+                base_url=OPENROUTER_BASE_URL,
+                timeout=REQUEST_TIMEOUT,
+                http_client=DefaultHttpxClient(
+                    limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS,
+                                        keepalive_expiry=KEEPALIVE_EXPIRY),
+                ),
+            )
+        return _client
+
+
+def get_executor():
+    """The shared worker pool for model calls (created on first use, lives for the process)"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="moondev-swarm")
+        return _executor
+
+
+def model_slot(model_id):
+    """Semaphore limiting concurrent requests to one model (use as a context manager)"""
+    with _lock:
+        slot = _slots.get(model_id)
+        if slot is None:
+            slot = _slots[model_id] = threading.BoundedSemaphore(
+                MODEL_CONCURRENCY.get(model_id, DEFAULT_MODEL_CONCURRENCY))
+        return slot
@@ -0,0 +1,219 @@
+"""
+🌙 Moon Dev's Director Plans
+Turn a Director [PLAN] into validated MoonDevAPI calls
+
+Built with love by Moon Dev 🚀
+
+The Director emits its plan as JSON tool calls:
+
+    [PLAN]
+    ```json
+    [
+      {"call": "get_ticks", "args": {"symbol": "BTC", "duration": "4h"}, "why": "Recent price action"},
+      {"call": "get_position_snapshots", "args": {"symbol": "ETH", "hours": 6}}
+    ]
+    ```
+
+Every call is bound to the real MoonDevAPI signature before anything runs.
+Unknown methods, unknown or missing arguments and wrongly typed values are
+rejected up front. Plans in the older `1. get_x("a", b=2)` line format are
+still accepted; their arguments are parsed as Python literals.
+
+Usage:
+    from ai_agents.plan import build_plan
+
+    calls, errors = build_plan(director_response)
+    for call in calls:
+        result = getattr(api, call.method)(**call.kwargs)
+"""
+
+import re
+import ast
+import json
+import inspect
+from collections import namedtuple
+
+from api import MoonDevAPI
+
+# ============================================
+# 🎯 PLAN CONFIGURATION - Moon Dev
+# ============================================
+MAX_PLAN_CALLS = 12
+BLOCKED_PARAMS = {"as_frame", "as_arrays"}  # The swarm needs JSON, not DataFrames
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+PLAN_CALL_PATTERN = re.compile(r"\bget_\w+\s*\(")
+
+
+class PlanCall(namedtuple("PlanCall", ["method", "kwargs", "why"])):
+    """One validated API call: method name plus keyword arguments bound to its signature"""
+
+    __slots__ = ()
+
+    @property
+    def label(self):
+        """Canonical call text, e.g. get_ticks(symbol="BTC", duration="4h")"""
+        args = ", ".join(f"{name}={json.dumps(value)}" for name, value in self.kwargs.items())
+        return f"{self.method}({args})"
+
+
+def _plan_methods():
+    """name -> signature (without self) for every MoonDevAPI method the Director may call"""
+    methods = {}
+    for name, fn in inspect.getmembers(MoonDevAPI, inspect.isfunction):
+        if not name.startswith("get_"):
+            continue
+        signature = inspect.signature(fn)
+        params = [p for p in signature.parameters.values() if p.name != "self"]
+        if any(p.name == "addresses" for p in params):  # Bulk helpers stream generators
+            continue
+        methods[name] = signature.replace(parameters=[p for p in params if p.name not in BLOCKED_PARAMS])
+    return methods
+
+
+PLAN_METHODS = _plan_methods()
+
+
+def api_signatures():
+    """Exact call signatures for the Director's system prompt"""
+    return "\n".join(f"{name}{signature}" for name, signature in sorted(PLAN_METHODS.items()))
+
+
+def _coerce(method, param, value):
+    """Check value against the parameter's default type, coercing numeric strings"""
+    if not isinstance(value, SCALAR_TYPES):
+        raise ValueError(f"{method}: {param.name} must be a single value, got {type(value).__name__}")
+
+    default = param.default
+    if default is inspect.Parameter.empty or default is None:
+        return value
+    if isinstance(default, bool):
+        if not isinstance(value, bool):
+            raise ValueError(f"{method}: {param.name} must be true/false, got {value!r}")
+        return value
+    if isinstance(default, (int, float)):
+        if isinstance(value, str):
+            try:
+                value = type(default)(value)
+            except ValueError:
+                raise ValueError(f"{method}: {param.name} must be a number, got {value!r}") from None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{method}: {param.name} must be a number, got {value!r}")
+        if isinstance(default, int) and value != int(value):
+            raise ValueError(f"{method}: {param.name} must be a whole number, got {value!r}")
+        return type(default)(value)
+    if isinstance(default, str) and not isinstance(value, str):
+        raise ValueError(f"{method}: {param.name} must be a string, got {value!r}")
+    return value
+
+
+def validate_call(method, args=(), kwargs=None, why=None):
+    """
+    Bind one call to its MoonDevAPI signature.
+
+    Returns:
+        PlanCall with every argument as a keyword
+
+    Raises:
+        ValueError describing what is wrong with the call
+    """
+    signature = PLAN_METHODS.get(method)
+    if signature is None:
+        raise ValueError(f"unknown API method {method!r}")
+    try:
+        bound = signature.bind(*args, **(kwargs or {}))
+    except TypeError as e:
+        raise ValueError(f"{method}: {e}") from None
+    params = signature.parameters
+    return PlanCall(method, {name: _coerce(method, params[name], value)
+                             for name, value in bound.arguments.items()}, why)
+
+
+def _json_calls(text):
+    """Tool calls from a JSON array in the plan (fenced or bare), or None if there is none"""
+    fenced = re.search(r"```(?:json)?\s*(\[.*?\])\s*```", text, re.DOTALL)
+    candidates = [fenced.group(1)] if fenced else []
+    bracket = text.find("[", text.find("[PLAN]") + len("[PLAN]") if "[PLAN]" in text else 0)
+    if bracket != -1:
+        candidates.append(text[bracket:])
+    for candidate in candidates:
+        try:
+            calls, _ = json.JSONDecoder().raw_decode(candidate)
+        except ValueError:
+            continue
+        if isinstance(calls, list) and all(isinstance(call, dict) for call in calls):
+            return calls
+    return None
+
+
+def _literal_calls(text):
+    """Calls written as get_x("a", b=2) anywhere in the text, parsed as Python literals
+
+    Returns (method, ast.Call or None, call text) - None when no closing
+    paren makes the call parse, so build_plan() can reject it out loud.
+    """
+    calls = []
+    for match in PLAN_CALL_PATTERN.finditer(text):
+        start = match.start()
+        for end in (i + 1 for i, char in enumerate(text[start:], start) if char == ")"):
+            try:
+                node = ast.parse(text[start:end], mode="eval").body
+            except SyntaxError:
+                continue
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+                calls.append((node.func.id, node, text[start:end]))
+            break
+        else:
+            close = text.find(")", start)
+            line_end = text.find("\n", start)
+            end = close + 1 if close != -1 and (line_end == -1 or close < line_end) else line_end
+            snippet = text[start:end if end != -1 else len(text)].strip()
+            calls.append((match.group(0).rstrip("( \t"), None, snippet))
+    return calls
+
+
+def build_plan(text):
+    """
+    Parse and validate a Director plan.
+
+    Returns:
+        (calls, errors) - validated PlanCalls in plan order, and one message per rejected call
+    """
+    calls, errors = [], []
+
+    raw_calls = _json_calls(text)
+    if raw_calls is not None:
+        for raw in raw_calls:
+            method = raw.get("call") or raw.get("method") or raw.get("name")
+            args = raw.get("args", raw.get("kwargs", raw.get("arguments", {})))
+            try:
+                if not isinstance(method, str):
+                    raise ValueError(f"call without a method name: {raw}")
+                if isinstance(args, list):
+                    calls.append(validate_call(method, args, why=raw.get("why")))
+                elif isinstance(args, dict):
+                    calls.append(validate_call(method, kwargs=args, why=raw.get("why")))
+                else:
+                    raise ValueError(f"{method}: args must be an object, got {args!r}")
+            except ValueError as e:
+                errors.append(str(e))
+    else:
+        for method, node, source in _literal_calls(text):
+            if node is None:
+                errors.append(f"{method}: could not parse {source!r} - arguments must be plain values")
+                continue
+            try:
+                args = [ast.literal_eval(arg) for arg in node.args]
+                kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in node.keywords if kw.arg}
+            except ValueError:
+                errors.append(f"{method}: arguments must be plain values")
+                continue
+            try:
+                calls.append(validate_call(method, args, kwargs))
+            except ValueError as e:
+                errors.append(str(e))
+
+    if len(calls) > MAX_PLAN_CALLS:
+        errors.append(f"plan has {len(calls)} calls, only the first {MAX_PLAN_CALLS} will run")
+        calls = calls[:MAX_PLAN_CALLS]
+    return calls, errors
@@ -0,0 +1,227 @@
+"""
+🌙 Moon Dev's Stub LLM Server
+Local OpenAI-compatible stand-in for OpenRouter - test the agents with no keys and no cost
+
+Built with love by Moon Dev 🚀
+
+Answers POST .../chat/completions, streamed (SSE) or not, with a
+deterministic reply per (model, prompt). Model ids containing "r1" wrap a
+<think> block around their answer like real reasoning models. Latency can be
+set globally or per model, so quorum cut-offs and cache hits can be timed
+offline.
+
+Usage:
+    python -m ai_agents.stub_server --port 8766 --latency 0.5 --model-latency deepseek/deepseek-r1=8
+
+    OPENROUTER_BASE_URL=http://127.0.0.1:8766/v1 OPENROUTER_API_KEY=stub python ai_agents/run.py
+
+    # In-process
+    from ai_agents.stub_server import StubLLMServer
+
+    with StubLLMServer(latency=0.2) as server:
+        client = OpenAI(api_key="stub", base_url=server.base_url)
+"""
+
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ============================================
+# 🎯 STUB SERVER CONFIGURATION - Moon Dev
+# ============================================
+DEFAULT_PORT = 8766
+DEFAULT_WORDS = 60       # Words per answer
+WORDS_PER_CHUNK = 3      # Words per streamed chunk
+
+VOCABULARY = ("funding", "squeeze", "liquidations", "bid", "ask", "whales", "HLP", "delta", "longs", "shorts",
+              "momentum", "support", "resistance", "breakout", "risk", "leverage", "trend", "volume")
+
+# ============================================
+
+
+def stub_answer(model_id, prompt, words=DEFAULT_WORDS):
+    """Deterministic answer text for a model and prompt"""
+    digest = hashlib.sha256(f"{model_id}\n{prompt}".encode()).digest()
+    body = " ".join(VOCABULARY[digest[i % len(digest)] % len(VOCABULARY)] for i in range(words))
+    answer = f"[{model_id}] Stub analysis ({len(prompt)} chars of prompt): {body}."
+    if "r1" in model_id:
+        answer = f"<think>Weighing {len(prompt)} chars of context...</think>\n{answer}"
+    return answer
+
+
+class StubLLMServer:
+    """
+    🌙 Moon Dev's Stub LLM Server
+
+    Args:
+        latency: Seconds before the first token of every answer
+        token_delay: Seconds between streamed chunks
+        model_latency: {model_id: seconds} overriding latency per model
+        words: Words per answer
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+    """
+
+    def __init__(self, latency=0.0, token_delay=0.0, model_latency=None, words=DEFAULT_WORDS,
+                 host="127.0.0.1", port=0):
+        self.latency = latency
+        self.token_delay = token_delay
+        self.model_latency = dict(model_latency or {})
+        self.words = words
+        self.requests = 0
+        self.calls = Counter()  # model_id -> completions served
+        self._lock = threading.Lock()
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self):
+        """OpenAI base_url for this server (includes /v1)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        """Serve from a background thread; returns base_url"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="moondev-stub-llm", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def answer(self, request):
+        """(model_id, answer text) for a chat completion request body"""
+        model_id = request.get("model", "stub")
+        prompt = "\n".join(str(m.get("content", "")) for m in request.get("messages", []))
+        with self._lock:
+            self.requests += 1
+            self.calls[model_id] += 1
+        return model_id, stub_answer(model_id, prompt, self.words)
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like OpenRouter
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                models = sorted(server.model_latency) or ["stub"]
+                return self._json(200, {"object": "list", "data": [{"id": m, "object": "model"} for m in models]})
+            self._json(404, {"error": {"message": "Not found"}})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                request = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                return self._json(400, {"error": {"message": "Invalid JSON"}})
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                return self._json(404, {"error": {"message": "Not found"}})
+
+            model_id, text = server.answer(request)
+            time.sleep(server.model_latency.get(model_id, server.latency))
+            completion_id = f"chatcmpl-stub-{server.requests}"
+            if request.get("stream"):
+                return self._stream(completion_id, model_id, text)
+
+            self._json(200, {
+                "id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": model_id,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": len(text.split()), "total_tokens": len(text.split())},
+            })
+
+        def _stream(self, completion_id, model_id, text):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            def event(delta, finish_reason=None):
+                chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                         "model": model_id, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+                return f"data: {json.dumps(chunk)}\n\n"
+
+            words = text.split(" ")
+            pieces = [" ".join(words[i:i + WORDS_PER_CHUNK]) + " " for i in range(0, len(words), WORDS_PER_CHUNK)]
+            pieces[-1] = pieces[-1].rstrip()
+            try:
+                for i, piece in enumerate(pieces):
+                    if i and server.token_delay:
+                        time.sleep(server.token_delay)
+                    delta = {"role": "assistant", "content": piece} if i == 0 else {"content": piece}
+                    self._chunk(event(delta))
+                self._chunk(event({}, "stop") + "data: [DONE]\n\n")
+                self._chunk("")
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True  # Client cancelled the stream
+
+        def _chunk(self, text):
+            data = text.encode()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+
+        def _json(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def _model_latency(value):
+    model_id, _, seconds = value.rpartition("=")
+    if not model_id:
+        raise argparse.ArgumentTypeError("expected MODEL=SECONDS")
+    return model_id, float(seconds)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's stub OpenAI-compatible LLM server")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds before the first token")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="Seconds between streamed chunks")
+    parser.add_argument("--model-latency", type=_model_latency, action="append", default=[],
+                        metavar="MODEL=SECONDS", help="Per-model latency (repeatable)")
+    parser.add_argument("--words", type=int, default=DEFAULT_WORDS, help="Words per answer")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    server = StubLLMServer(latency=args.latency, token_delay=args.token_delay,
+                           model_latency=dict(args.model_latency), words=args.words, host=args.host, port=args.port)
+    print(f"🌙 Moon Dev stub LLM server on {server.base_url}")
+    print(f"   OPENROUTER_BASE_URL={server.base_url} OPENROUTER_API_KEY=stub")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,455 @@
+"""
+🌙 Moon Dev's Swarm Data Summarizer
+Shrink API responses to compact stats and top-N tables for the swarm prompt
+
+Built with love by Moon Dev 🚀
+
+Each endpoint family gets its own reducer: liquidations, positions, HLP
+sentiment, orderbook, candles and ticks. Reducers walk the parsed payload
+once (heapq for top-N) and never serialize it, so a 500 KB response costs a
+few milliseconds and a few hundred tokens instead of a truncated JSON dump.
+Anything else falls back to a generic reducer that shows scalar fields and a
+few sample records.
+
+The token budget is shared across all results: small summaries take what
+they need and the rest is split between the larger ones. Lines are dropped
+whole, lowest priority first, so records are never cut in half.
+
+Usage:
+    from ai_agents.summarize import summarize_results
+
+    text = summarize_results({'get_liquidations(timeframe="24h")': liqs}, token_budget=6000)
+"""
+
+import heapq
+import math
+from datetime import datetime, timezone
+from itertools import chain
+
+# ============================================
+# 🎯 SUMMARY CONFIGURATION - Moon Dev
+# ============================================
+TOKEN_BUDGET = 6000     # Tokens for all API data in one swarm prompt
+TOP_N = 10              # Rows per top-N table
+PATH_POINTS = 12        # Points in a downsampled price path
+CHARS_PER_TOKEN = 4     # Rough estimate, good enough for budgeting
+SAMPLE_CHARS = 160      # Longest sample record in the generic reducer
+
+
+def estimate_tokens(text):
+    """Approximate token count of text"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+# ==================== FORMATTING ====================
+def _usd(value):
+    """$1.23B / $45.6M / $7.8K / $512, keeping the sign"""
+    if value is None:
+        return "n/a"
+    value = float(value)
+    sign, value = ("-" if value < 0 else ""), abs(value)
+    for limit, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if value >= limit:
+            return f"{sign}${value / limit:.2f}{suffix}"
+    return f"{sign}${value:,.0f}"
+
+
+def _num(value):
+    """Compact number: thousands separators for big values, significant digits for small ones"""
+    if value is None:
+        return "n/a"
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, int):
+        return f"{value:,}"
+    if abs(value) >= 100:
+        return f"{value:,.2f}"
+    return f"{value:.6g}"
+
+
+def _pct(part, total):
+    return f"{part / total * 100:.0f}%" if total else "n/a"
+
+
+def _time(ms):
+    """Millisecond timestamp -> 'MM-DD HH:MM' UTC"""
+    try:
+        return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime("%m-%d %H:%M")
+    except (TypeError, ValueError, OverflowError, OSError):
+        return str(ms)
+
+
+def _short(address):
+    return f"{address[:6]}…{address[-4:]}" if isinstance(address, str) and len(address) > 12 else str(address)
+
+
+def _float(value, default=0.0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _table(title, headers, rows):
+    """Table block: ([title, header], rows), cells joined with ' | '"""
+    return [title, " | ".join(headers)], [" | ".join(str(cell) for cell in row) for row in rows]
+
+
+def _path(points):
+    """Downsample a price series to PATH_POINTS evenly spaced values"""
+    if len(points) <= PATH_POINTS:
+        return points
+    step = (len(points) - 1) / (PATH_POINTS - 1)
+    return [points[round(i * step)] for i in range(PATH_POINTS)]
+
+
+def _volatility(prices):
+    """Root mean square of step-to-step log returns, in percent"""
+    returns = [math.log(b / a) for a, b in zip(prices, prices[1:]) if a > 0 and b > 0]
+    return math.sqrt(sum(r * r for r in returns) / len(returns)) * 100 if returns else 0.0
+
+
+# ==================== LIQUIDATIONS ====================
+def _liquidations(result, top_n):
+    rows = result["liquidations"] if isinstance(result, dict) else result
+    stats = result.get("stats") if isinstance(result, dict) else None
+    if not stats:
+        stats = {"total_count": 0, "long_count": 0, "short_count": 0,
+                 "long_value_usd": 0.0, "short_value_usd": 0.0, "by_exchange": {}, "by_coin": {}}
+        for row in rows:
+            value, long = _float(row.get("value_usd", row.get("value"))), row.get("side") == "long"
+            stats["total_count"] += 1
+            stats["long_count" if long else "short_count"] += 1
+            stats["long_value_usd" if long else "short_value_usd"] += value
+            exchange = stats["by_exchange"].setdefault(row.get("exchange", "hyperliquid"), {"count": 0, "volume": 0.0})
+            exchange["count"] += 1
+            exchange["volume"] += value
+            coin = stats["by_coin"].setdefault(row.get("coin") or row.get("symbol"),
+                                               {"count": 0, "volume": 0.0, "long_volume": 0.0})
+            coin["count"] += 1
+            coin["volume"] += value
+            coin["long_volume"] += value if long else 0.0
+
+    longs, shorts = _float(stats.get("long_value_usd")), _float(stats.get("short_value_usd"))
+    total = _float(stats.get("total_value_usd"), longs + shorts)
+    timeframe = f" ({result['timeframe']})" if isinstance(result, dict) and result.get("timeframe") else ""
+    lines = [
+        f"{_num(stats.get('total_count', len(rows)))} liquidations{timeframe}, {_usd(total)} total",
+        f"longs {_num(stats.get('long_count'))} / {_usd(longs)} ({_pct(longs, total)}) | "
+        f"shorts {_num(stats.get('short_count'))} / {_usd(shorts)} ({_pct(shorts, total)})",
+    ]
+    exchanges = stats.get("by_exchange") or {}
+    if len(exchanges) > 1:
+        lines.append("by exchange: " + ", ".join(
+            f"{name} {_num(ex.get('count'))} {_usd(ex.get('volume'))}"
+            for name, ex in sorted(exchanges.items(), key=lambda item: -_float(item[1].get("volume")))))
+
+    coins = heapq.nlargest(top_n, (stats.get("by_coin") or {}).items(), key=lambda item: _float(item[1].get("volume")))
+    lines.append(_table("top coins by liquidated value:", ["coin", "count", "value", "long share"], [
+        (coin, _num(c.get("count")), _usd(c.get("volume")), _pct(_float(c.get("long_volume")), _float(c.get("volume"))))
+        for coin, c in coins]))
+
+    largest = heapq.nlargest(top_n, rows, key=lambda row: _float(row.get("value_usd", row.get("value"))))
+    lines.append(_table("largest liquidations:", ["time", "exchange", "coin", "side", "value", "price"], [
+        (_time(row.get("timestamp", row.get("time"))), row.get("exchange", "-"), row.get("coin") or row.get("symbol"),
+         row.get("side"), _usd(row.get("value_usd", row.get("value"))), _num(_float(row.get("price"))))
+        for row in largest]))
+    return lines
+
+
+# ==================== POSITIONS ====================
+def _position_rows(positions):
+    return [(p.get("coin"), p.get("side"), _usd(p.get("value")), f"{_num(p.get('leverage'))}x",
+             _num(p.get("entry_price")), _num(p.get("liq_price")), f"{_num(p.get('distance_pct'))}%",
+             _usd(p.get("pnl")), _short(p.get("address"))) for p in positions]
+
+
+POSITION_HEADERS = ["coin", "side", "value", "lev", "entry", "liq", "to liq", "pnl", "address"]
+
+
+def _positions(result, top_n):
+    longs, shorts = result["longs"], result["shorts"]
+    long_value = _float(result.get("total_long_value"), sum(_float(p.get("value")) for p in longs))
+    short_value = _float(result.get("total_short_value"), sum(_float(p.get("value")) for p in shorts))
+    minimum = f" (min {_usd(result['min_position_value'])})" if result.get("min_position_value") else ""
+    lines = [f"{_num(result.get('total_positions', len(longs) + len(shorts)))} whale positions{minimum}: "
+             f"longs {len(longs)} / {_usd(long_value)} | shorts {len(shorts)} / {_usd(short_value)} | "
+             f"long share {_pct(long_value, long_value + short_value)}"]
+
+    by_coin = {}
+    for p in chain(longs, shorts):
+        sides = by_coin.setdefault(p.get("coin"), [0.0, 0.0])
+        sides[p.get("side") != "long"] += _float(p.get("value"))
+    coins = heapq.nlargest(top_n, by_coin.items(), key=lambda item: sum(item[1]))
+    lines.append(_table("coin concentration:", ["coin", "long value", "short value"],
+                    [(coin, _usd(long), _usd(short)) for coin, (long, short) in coins]))
+
+    everyone = list(chain(longs, shorts))
+    lines.append(_table("closest to liquidation:", POSITION_HEADERS, _position_rows(
+        heapq.nsmallest(top_n, everyone, key=lambda p: _float(p.get("distance_pct"), math.inf)))))
+    lines.append(_table("largest positions:", POSITION_HEADERS, _position_rows(
+        heapq.nlargest(top_n, everyone, key=lambda p: _float(p.get("value"))))))
+    return lines
+
+
+def _all_positions(result, top_n):
+    symbols = result["symbols"]
+    long_value = sum(_float(s.get("total_long_value")) for s in symbols.values())
+    short_value = sum(_float(s.get("total_short_value")) for s in symbols.values())
+    lines = [f"{len(symbols)} symbols, {_num(sum(s.get('total_positions', 0) for s in symbols.values()))} "
+             f"whale positions: longs {_usd(long_value)} | shorts {_usd(short_value)} | "
+             f"long share {_pct(long_value, long_value + short_value)}"]
+
+    def total(item):
+        return _float(item[1].get("total_long_value")) + _float(item[1].get("total_short_value"))
+
+    lines.append(_table("largest symbols:", ["symbol", "positions", "long value", "short value", "long share"], [
+        (name, _num(s.get("total_positions")), _usd(s.get("total_long_value")), _usd(s.get("total_short_value")),
+         _pct(_float(s.get("total_long_value")), total((name, s))))
+        for name, s in heapq.nlargest(top_n, symbols.items(), key=total)]))
+
+    everyone = chain.from_iterable(chain(s.get("longs", []), s.get("shorts", [])) for s in symbols.values())
+    lines.append(_table("closest to liquidation (all symbols):", POSITION_HEADERS, _position_rows(
+        heapq.nsmallest(top_n, everyone, key=lambda p: _float(p.get("distance_pct"), math.inf)))))
+    return lines
+
+
+# ==================== HLP SENTIMENT ====================
+def _hlp_sentiment(result, top_n):
+    known = ("net_delta", "z_score", "percentile", "signal", "timestamp")
+    lines = [f"net delta {_usd(result['net_delta'])} | z-score {_num(result.get('z_score'))} | "
+             f"percentile {_num(result.get('percentile'))} | signal: {result.get('signal', 'n/a')}"]
+    extra = _scalars({k: v for k, v in result.items() if k not in known})
+    return lines + ([extra] if extra else [])
+
+
+# ==================== ORDERBOOK ====================
+def _orderbook(result, top_n):
+    bids, asks = result["levels"][:2]
+
+    def level(entry):
+        return _float(entry.get("px")), _float(entry.get("sz")), entry.get("n", "-")
+
+    bids, asks = [level(entry) for entry in bids], [level(entry) for entry in asks]
+    best_bid = result.get("best_bid", bids[0][0] if bids else None)
+    best_ask = result.get("best_ask", asks[0][0] if asks else None)
+    mid = result.get("mid_price", (best_bid + best_ask) / 2 if bids and asks else None)
+    spread = result.get("spread", best_ask - best_bid if bids and asks else None)
+    bid_usd, ask_usd = sum(px * sz for px, sz, _ in bids), sum(px * sz for px, sz, _ in asks)
+    lines = [
+        f"{result.get('coin', '')} mid {_num(mid)} | bid {_num(best_bid)} x {_num(result.get('best_bid_size'))} | "
+        f"ask {_num(best_ask)} x {_num(result.get('best_ask_size'))} | spread {_num(spread)} "
+        f"({_num(result.get('spread_bps'))} bps)",
+        f"depth over {len(bids)} bid / {len(asks)} ask levels: bids {_usd(bid_usd)} | asks {_usd(ask_usd)} | "
+        f"imbalance {(bid_usd - ask_usd) / (bid_usd + ask_usd) * 100 if bid_usd + ask_usd else 0:+.1f}% (positive = bid heavy)",
+    ]
+    walls = heapq.nlargest(top_n, chain((("bid",) + b for b in bids), (("ask",) + a for a in asks)),
+                           key=lambda wall: wall[1] * wall[2])
+    lines.append(_table("largest levels:", ["side", "price", "size", "orders", "value"],
+                    [(side, _num(px), _num(sz), n, _usd(px * sz)) for side, px, sz, n in walls]))
+    return lines
+
+
+# ==================== CANDLES & TICKS ====================
+def _candles(result, top_n):
+    candles = result.get("candles", []) if isinstance(result, dict) else result
+    if not candles:
+        return ["0 candles"]
+    first, last = candles[0], candles[-1]
+    closes = [_float(c.get("c")) for c in candles]
+    volumes = [_float(c.get("v")) for c in candles]
+    ranges = [(_float(c.get("h")) - _float(c.get("l"))) / _float(c.get("o"), 1.0) * 100 for c in candles]
+    lines = [
+        f"{len(candles)} {first.get('i', '')} candles {first.get('s', '')}, {_time(first.get('t'))} -> {_time(last.get('t'))} UTC",
+        f"open {_num(_float(first.get('o')))} close {_num(closes[-1])} "
+        f"({(closes[-1] / _float(first.get('o'), closes[-1]) - 1) * 100:+.2f}%) | "
+        f"high {_num(max(_float(c.get('h')) for c in candles))} low {_num(min(_float(c.get('l')) for c in candles))} | "
+        f"avg candle range {sum(ranges) / len(ranges):.3f}%",
+        f"volume {_num(sum(volumes))} total, {_num(sum(volumes) / len(volumes))} avg, last {_num(volumes[-1])} | "
+        f"volatility {_volatility(closes):.3f}% per candle",
+        "close path: " + ", ".join(_num(p) for p in _path(closes)),
+    ]
+    lines.append(_table(f"last {min(top_n, len(candles))} candles:", ["time", "open", "high", "low", "close", "volume"], [
+        (_time(c.get("t")), c.get("o"), c.get("h"), c.get("l"), c.get("c"), c.get("v")) for c in candles[-top_n:]]))
+    return lines
+
+
+def _ticks(result, top_n):
+    ticks = result["ticks"]
+    if not ticks:
+        return [f"{result.get('symbol', '')} {result.get('duration', '')}: 0 ticks"]
+    prices = [_float(t.get("p")) for t in ticks]
+    first, last = prices[0], prices[-1]
+    return [
+        f"{result.get('symbol', '')} {result.get('duration', '')}: {len(ticks)} ticks, "
+        f"{_time(ticks[0].get('t'))} -> {_time(ticks[-1].get('t'))} UTC, latest {_num(result.get('latest_price', last))}",
+        f"first {_num(first)} last {_num(last)} ({(last / first - 1) * 100 if first else 0:+.2f}%) | "
+        f"high {_num(max(prices))} low {_num(min(prices))} | volatility {_volatility(prices):.4f}% per tick",
+        "price path: " + ", ".join(_num(p) for p in _path(prices)),
+    ]
+
+
+# ==================== GENERIC FALLBACK ====================
+TIME_KEYS = ("t", "time", "timestamp")
+
+
+def _field(key, value):
+    """One value of a record, rendering millisecond timestamps as times"""
+    if (key in TIME_KEYS or str(key).endswith(("_at", "_time"))) and isinstance(value, (int, float)) and value > 1e11:
+        return _time(value)
+    return _compact(value, 1)
+
+
+def _compact(value, depth=0):
+    """Short one-line rendering of a record; nested containers collapse to their size"""
+    if isinstance(value, dict):
+        if depth:
+            return f"{{{len(value)} keys}}"
+        return "{" + ", ".join(f"{k}: {_field(k, v)}" for k, v in value.items()) + "}"
+    if isinstance(value, (list, tuple)):
+        return f"[{len(value)} items]"
+    if isinstance(value, str) and len(value) > 42:
+        return value[:40] + "…"
+    return _num(value)
+
+
+def _scalars(mapping):
+    return "; ".join(f"{k}={_field(k, v)}" for k, v in mapping.items() if not isinstance(v, (dict, list)))
+
+
+def _samples(title, items, top_n):
+    """Sample block: a count line, then the first top_n records"""
+    if not items:
+        return f"{title}: 0 items"
+    rows = []
+    for item in items[:top_n]:
+        text = _compact(item)
+        rows.append("  " + (text if len(text) <= SAMPLE_CHARS else text[:SAMPLE_CHARS - 1] + "…"))
+    return [f"{title}: {len(items)} items"], rows
+
+
+def _generic(result, top_n, prefix=""):
+    if isinstance(result, str):
+        rows = result.splitlines()
+        return [([f"{len(rows)} lines"], rows[:top_n])]
+    if isinstance(result, (list, tuple)):
+        return [_samples(prefix or "records", result, top_n)]
+    if not isinstance(result, dict):
+        return [_compact(result)]
+
+    lines = []
+    scalars = _scalars(result)
+    if scalars:
+        lines.append(f"{prefix}{scalars}" if prefix else scalars)
+    for key, value in result.items():
+        if isinstance(value, list):
+            lines.append(_samples(f"{prefix}{key}", value, top_n))
+        elif isinstance(value, dict) and not prefix:
+            lines += _generic(value, top_n, prefix=f"{key}.")
+        elif isinstance(value, dict):
+            lines.append(f"{prefix}{key}: {_compact(value)}"[:SAMPLE_CHARS])
+    return lines
+
+
+REDUCERS = {
+    "get_liquidations": _liquidations,
+    "get_all_liquidations": _liquidations,
+    "get_binance_liquidations": _liquidations,
+    "get_bybit_liquidations": _liquidations,
+    "get_okx_liquidations": _liquidations,
+    "get_hip3_liquidations": _liquidations,
+    "get_positions": _positions,
+    "get_all_positions": _all_positions,
+    "get_hlp_sentiment": _hlp_sentiment,
+    "get_orderbook": _orderbook,
+    "get_candles": _candles,
+    "get_ticks": _ticks,
+}
+
+
+def summarize(method, result, top_n=TOP_N):
+    """
+    Reduce one API result to summary blocks, most important first.
+
+    A block is a line, or a (head lines, rows) table that can lose rows from
+    the end when the budget is tight.
+
+    Endpoints without a dedicated reducer, and payloads whose shape a reducer
+    does not recognise, go through the generic reducer.
+    """
+    reducer = REDUCERS.get(method)
+    if reducer is not None:
+        try:
+            return reducer(result, top_n)
+        except (AttributeError, KeyError, TypeError, ValueError, IndexError, ZeroDivisionError):
+            pass
+    return _generic(result, top_n)
+
+
+# ==================== BUDGETING ====================
+def _allocate(needs, budget):
+    """Split budget so small sections get all they need and large ones share the rest evenly"""
+    shares, remaining = {}, dict(needs)
+    while remaining:
+        fair = budget // len(remaining)
+        small = {key: need for key, need in remaining.items() if need <= fair}
+        if not small:
+            shares.update((key, fair) for key in remaining)
+            break
+        for key, need in small.items():
+            shares[key] = need
+            budget -= need
+            del remaining[key]
+    return shares
+
+
+def _block_lines(block):
+    return [block] if isinstance(block, str) else block[0] + block[1]
+
+
+def _fit(blocks, budget):
+    """
+    Keep blocks in order while they fit (always at least the first).
+
+    The last table that fits keeps as many whole rows as it can; a table
+    without room for a single row is dropped with everything after it.
+    """
+    kept, used = [], 0
+    for block in blocks:
+        head, rows = ([block], []) if isinstance(block, str) else block
+        if not isinstance(block, str) and not rows:
+            continue
+        taken, cost = [], sum(map(estimate_tokens, head))
+        for row in rows:
+            if used + cost + estimate_tokens(row) > budget:
+                break
+            taken.append(row)
+            cost += estimate_tokens(row)
+        fits = used + cost <= budget and (taken or not rows)
+        if fits or not kept:
+            kept += head + taken
+            used += cost
+        if not fits or len(taken) < len(rows):
+            total = sum(len(_block_lines(b)) for b in blocks)
+            kept.append(f"... {total - len(kept)} more lines over the token budget")
+            break
+    return kept
+
+
+def summarize_results(data, token_budget=TOKEN_BUDGET, top_n=TOP_N):
+    """
+    Summarize API results for the swarm prompt within token_budget.
+
+    Args:
+        data: {call label: result}, e.g. {'get_ticks(symbol="BTC")': {...}}
+        token_budget: Approximate tokens for the whole summary
+        top_n: Rows per top-N table
+
+    Returns:
+        Text with one '=== label ===' section per result
+    """
+    sections = {label: [f"=== {label} ==="] + summarize(label.split("(", 1)[0], result, top_n)
+                for label, result in data.items()}
+    shares = _allocate({label: sum(estimate_tokens(line) for block in blocks for line in _block_lines(block))
+                        for label, blocks in sections.items()}, token_budget)
+    return "\n\n".join("\n".join(_fit(blocks, shares[label])) for label, blocks in sections.items())
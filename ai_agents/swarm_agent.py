@@ -13,14 +13,32 @@ Usage:
     for model, data in results.items():
         if data["success"]:
             print(f"{model}: {data['response']}")
+
+    # Return once 3 models have answered, waiting at most 30 seconds
+    results = swarm.query("Should I buy BTC now?", quorum=3, budget=30)
+
+    # Watch tokens arrive per model
+    for event in swarm.stream("Should I buy BTC now?"):
+        if not event.done:
+            print(f"[{event.model}] {event.text}", end="")
 """
 
 import os
+import re
+import sys
+import time
+import queue
+import threading
+from collections import namedtuple
 from dotenv import load_dotenv
-from openai import OpenAI
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from termcolor import cprint
 
+# Add parent directory to path so this file also runs as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_agents.llm_cache import cache_key, default_llm_cache
+from ai_agents.openrouter import get_client, get_executor, model_slot
+
 # Load environment variables
 load_dotenv()
 
@@ -43,10 +61,108 @@ SWARM_MODELS = [
 # Model parameters
 DEFAULT_MAX_TOKENS = 2048
 DEFAULT_TEMPERATURE = 0.7
-MODEL_TIMEOUT = 120  # seconds
+MODEL_TIMEOUT = 120  # seconds - default latency budget for one swarm query
+QUORUM = None        # Return once this many models answered (None = wait for every model)
+
+DEFAULT_SYSTEM_PROMPT = "You are a helpful trading analyst."
+TIMEOUT_RESPONSE = "Timeout"
+CANCELLED_RESPONSE = "Cancelled - quorum reached"
 
 # ============================================
 
+THINK_PATTERN = re.compile(r"<think>.*?</think>", re.DOTALL)
+
+# One streamed piece of a model's answer. While done is False, text is the
+# next visible chunk. The final event per model has done=True and text set
+# to the full answer (or the error when success is False).
+StreamEvent = namedtuple("StreamEvent", ["model", "text", "done", "success"])
+
+
+class _ThinkFilter:
+    """Hides <think>...</think> from streamed text, even when a tag is split across chunks"""
+
+    def __init__(self):
+        self.buffer = ""
+        self.thinking = False
+
+    def feed(self, text):
+        self.buffer += text
+        shown = []
+        while True:
+            tag = "</think>" if self.thinking else "<think>"
+            index = self.buffer.find(tag)
+            if index == -1:
+                break
+            if not self.thinking:
+                shown.append(self.buffer[:index])
+            self.buffer = self.buffer[index + len(tag):]
+            self.thinking = not self.thinking
+
+        # Hold back a tail that could be the start of the next tag
+        cut = len(self.buffer)
+        for size in range(min(len(tag) - 1, len(self.buffer)), 0, -1):
+            if tag.startswith(self.buffer[-size:]):
+                cut -= size
+                break
+        if not self.thinking:
+            shown.append(self.buffer[:cut])
+        self.buffer = self.buffer[cut:]
+        return "".join(shown)
+
+    def flush(self):
+        text = "" if self.thinking else self.buffer
+        self.buffer = ""
+        return text
+
+
+class _ModelCall:
+    """
+    One model's in-flight request, abortable from the thread that cancels it
+
+    A straggler can sit inside create() until its first token arrives. Aborting
+    frees its model slot at once, so later queries aren't queued behind an
+    answer nobody will read, and closes its stream if it has one. The worker
+    closes a stream that only shows up after the abort.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._slot = None
+        self._stream = None
+        self._aborted = False
+
+    def hold(self, slot):
+        """Record the acquired model slot - False (slot released) if already aborted"""
+        with self._lock:
+            if not self._aborted:
+                self._slot = slot
+                return True
+        slot.release()
+        return False
+
+    def attach(self, stream):
+        """Record the open stream - False (stream closed) if already aborted"""
+        with self._lock:
+            if not self._aborted:
+                self._stream = stream
+                return True
+        stream.close()
+        return False
+
+    def abort(self):
+        """Release the slot and close the stream, once"""
+        with self._lock:
+            self._aborted = True
+            slot, self._slot = self._slot, None
+            stream, self._stream = self._stream, None
+        if slot is not None:
+            slot.release()
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass  # Worker may be mid-read on it - it bails out on its own
+
 
 class SwarmAgent:
     """
@@ -57,60 +173,135 @@ class SwarmAgent:
     on trading decisions.
     """
 
-    def __init__(self, custom_models=None):
+    def __init__(self, custom_models=None, quorum=QUORUM, budget=MODEL_TIMEOUT, cache=None):
         """
         Initialize the Swarm Agent
 
         Args:
             custom_models: Optional list of (name, model_id) tuples to override defaults
+            quorum: Default number of answers query() waits for (None = every model)
+            budget: Default seconds query() waits before giving up on slower models
+            cache: Reuse answers to repeated prompts - True, a directory or an LLMCache
         """
         self.models = custom_models or SWARM_MODELS
+        self.quorum = quorum
+        self.budget = budget
+        self.cache = default_llm_cache(cache)
 
-        api_key = os.getenv("OPENROUTER_API_KEY")
-        if not api_key:
-            raise ValueError("OPENROUTER_API_KEY not found in environment!")
-
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1"
-        )
+        # Shared keep-alive client and worker pool (see openrouter.py)
+        self.client = get_client()
+        self.executor = get_executor()
 
         cprint("\n🌙 Moon Dev's Swarm Agent Initialized", "cyan", attrs=['bold'])
         cprint(f"   📡 {len(self.models)} AI models ready via OpenRouter", "green")
         for name, model_id in self.models:
             cprint(f"      • {name}", "white")
 
-    def _query_model(self, model_name, model_id, prompt, system_prompt):
-        """Query a single model via OpenRouter"""
+    def _stream_model(self, model_name, model_id, prompt, system_prompt, events, cancelled, call, deadline):
+        """Stream one model's answer onto the events queue, stopping early once cancelled is set"""
+        key = None
+        if self.cache is not None:
+            key = cache_key(model_id, system_prompt, prompt, DEFAULT_TEMPERATURE, DEFAULT_MAX_TOKENS)
+            cached = self.cache.get(key)
+            if cached is not None:
+                events.put(StreamEvent(model_name, cached, False, True))
+                events.put(StreamEvent(model_name, cached, True, True))
+                return
+
+        slot = model_slot(model_id)
+        while not slot.acquire(timeout=0.1):  # Per-model concurrency limit
+            if cancelled.is_set():
+                return
+        if not call.hold(slot):
+            return  # Cancelled while acquiring - hold() handed the slot back
+
+        stream = None
         try:
-            response = self.client.chat.completions.create(
+            stream = self.client.chat.completions.create(
                 model=model_id,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=DEFAULT_MAX_TOKENS,
-                temperature=DEFAULT_TEMPERATURE
+                temperature=DEFAULT_TEMPERATURE,
+                stream=True,
+                timeout=max(1.0, deadline - time.monotonic()),  # Nothing waits for it past the budget
             )
-
-            content = response.choices[0].message.content
-
-            # Strip <think> tags from reasoning models
-            import re
-            content = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL).strip()
-
-            return model_name, content, True
+            if not call.attach(stream):
+                return  # Cancelled while waiting for the first token
+
+            parts = []
+            visible = _ThinkFilter()  # Strip <think> tags from reasoning models
+            for chunk in stream:
+                if cancelled.is_set():
+                    return
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    parts.append(text)
+                    shown = visible.feed(text)
+                    if shown:
+                        events.put(StreamEvent(model_name, shown, False, True))
+
+            tail = visible.flush()
+            if tail:
+                events.put(StreamEvent(model_name, tail, False, True))
+            content = THINK_PATTERN.sub("", "".join(parts)).strip()
+            if key is not None:
+                self.cache.put(key, content, model_id)
+            events.put(StreamEvent(model_name, content, True, True))
 
         except Exception as e:
-            return model_name, str(e), False
+            if not cancelled.is_set():
+                events.put(StreamEvent(model_name, str(e), True, False))
+        finally:
+            call.abort()  # Closes the stream and frees the slot (no-op if the canceller already did)
 
-    def query(self, prompt, system_prompt="You are a helpful trading analyst."):
+    def stream(self, prompt, system_prompt=DEFAULT_SYSTEM_PROMPT, budget=None):
+        """
+        Query all models in parallel, yielding StreamEvents as tokens arrive
+
+        Every model ends with one done=True event. Models still running when
+        the budget (seconds, default self.budget) runs out end with a
+        "Timeout" event. Closing the generator early, e.g. by breaking out of
+        the loop, cancels every model that is still streaming.
+        """
+        events, cancelled = queue.Queue(), threading.Event()
+        deadline = time.monotonic() + (budget or self.budget)
+        calls = [_ModelCall() for _ in self.models]
+        futures = [self.executor.submit(self._stream_model, name, model_id, prompt, system_prompt, events, cancelled,
+                                        call, deadline)
+                   for (name, model_id), call in zip(self.models, calls)]
+
+        pending = [name for name, _ in self.models]
+        try:
+            while pending:
+                try:
+                    event = events.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    for name in pending:
+                        yield StreamEvent(name, TIMEOUT_RESPONSE, True, False)
+                    return
+                if event.done:
+                    pending.remove(event.model)
+                yield event
+        finally:
+            cancelled.set()
+            for future in futures:
+                future.cancel()  # Calls still queued behind busy workers never start
+            for call in calls:
+                call.abort()  # Stragglers give up their model slot and connection right now
+
+    def query(self, prompt, system_prompt=DEFAULT_SYSTEM_PROMPT, quorum=None, budget=None):
         """
         Query all models in parallel
 
         Args:
             prompt: The question/prompt to send to all models
             system_prompt: System prompt for context
+            quorum: Return once this many models answered successfully and
+                cancel the rest (default self.quorum; None = wait for every model)
+            budget: Seconds to wait before giving up on slower models (default self.budget)
 
         Returns:
             Dict mapping model names to response dicts:
@@ -119,36 +310,39 @@ class SwarmAgent:
                 "GPT-5 Mini": {"response": "...", "success": True},
                 ...
             }
+            Models cut off by the quorum or the budget have success False.
         """
-        cprint(f"\n🌊 Querying {len(self.models)} AI models in parallel...", "cyan", attrs=['bold'])
+        quorum = quorum or self.quorum
+        needed = min(quorum or len(self.models), len(self.models))
+        if needed < len(self.models):
+            cprint(f"\n🌊 Querying {len(self.models)} AI models in parallel (first {needed} answers win)...",
+                   "cyan", attrs=['bold'])
+        else:
+            cprint(f"\n🌊 Querying {len(self.models)} AI models in parallel...", "cyan", attrs=['bold'])
 
         results = {}
-
-        with ThreadPoolExecutor(max_workers=len(self.models)) as executor:
-            # Submit all queries in parallel
-            futures = {
-                executor.submit(
-                    self._query_model, name, model_id, prompt, system_prompt
-                ): name
-                for name, model_id in self.models
-            }
-
-            # Collect results as they complete
-            try:
-                for future in as_completed(futures, timeout=MODEL_TIMEOUT):
-                    name, response, success = future.result()
-                    results[name] = {"response": response, "success": success}
-
-                    status = "✅" if success else "❌"
-                    color = "green" if success else "red"
-                    cprint(f"   {status} {name}", color)
-
-            except TimeoutError:
-                cprint("   ⏰ Some models timed out", "yellow")
-                # Mark remaining as failed
-                for future, name in futures.items():
-                    if name not in results:
-                        results[name] = {"response": "Timeout", "success": False}
+        started = time.monotonic()
+        events = self.stream(prompt, system_prompt, budget)
+        for event in events:
+            if not event.done:
+                continue
+            results[event.model] = {"response": event.text, "success": event.success}
+            elapsed = time.monotonic() - started
+            if event.text == TIMEOUT_RESPONSE and not event.success:
+                cprint(f"   ⏰ {event.model} timed out ({elapsed:.1f}s)", "yellow")
+            else:
+                status = "✅" if event.success else "❌"
+                color = "green" if event.success else "red"
+                cprint(f"   {status} {event.model} ({elapsed:.1f}s)", color)
+            if sum(1 for r in results.values() if r["success"]) >= needed:
+                break
+        events.close()  # Cancels the stragglers
+
+        stragglers = [name for name, _ in self.models if name not in results]
+        if stragglers:
+            cprint(f"   🚀 Quorum of {needed} reached - cancelled {', '.join(stragglers)}", "cyan")
+            for name in stragglers:
+                results[name] = {"response": CANCELLED_RESPONSE, "success": False}
 
         successful = sum(1 for r in results.values() if r["success"])
         cprint(f"\n✨ {successful}/{len(self.models)} models responded - Moon Dev", "cyan")
@@ -101,53 +101,217 @@ Need an API key? https://moondev.com
 """
 
 import os
+import copy
+import time
+import asyncio
 import requests
 from datetime import datetime
 from dotenv import load_dotenv
 
+from data_layer.bulk import DEFAULT_CONCURRENCY, iter_addresses, iter_addresses_async
+from data_layer.cache import ResponseCache, ValidatorCache
+from data_layer.candle_store import CandleStore
+from data_layer.columnar import (
+    CANDLE_COLUMNS, COLUMNAR_FORMATS, HLP_DELTA_COLUMNS, HLP_HISTORY_COLUMNS,
+    POSITION_SNAPSHOT_COLUMNS, TICK_COLUMNS, columnar_format, to_frame,
+)
+from data_layer.decoders import RESPONSE_FORMATS, LazyJSON, get_decoder
+from data_layer.metrics import Metrics
+from data_layer.models import (
+    parse_candles, parse_fills, parse_orderbook, parse_positions, parse_ticks, parse_user_fills,
+)
+from data_layer.rate_limit import RateLimiter
+from data_layer.retry import RetryPolicy
+from data_layer.single_flight import SingleFlight
+
+try:
+    import aiohttp
+except ImportError:  # Only needed for AsyncMoonDevAPI
+    aiohttp = None
+
 load_dotenv()
 
+DEFAULT_BASE_URL = "https://api.moondev.com"
+HYPERLIQUID_INFO_URL = "https://api.hyperliquid.xyz/info"
+REQUEST_TIMEOUT = 30  # seconds
 
-class MoonDevAPI:
-    """🌙 Moon Dev's API Client"""
+# Transient network errors worth retrying (requests / aiohttp)
+NETWORK_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+ASYNC_NETWORK_ERRORS = (
+    (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) if aiohttp else ()
+)
 
-    def __init__(self, api_key=None, base_url="https://api.moondev.com"):
-        self.api_key = api_key or os.getenv('MOONDEV_API_KEY')
-        self.base_url = base_url
-        self.headers = {'X-API-Key': self.api_key} if self.api_key else {}
-        self.session = requests.Session()
 
-    def _get(self, endpoint, auth_required=True):
-        """Make GET request to API"""
-        url = f"{self.base_url}{endpoint}"
-        headers = self.headers if auth_required else {}
+def _default_rate_limiter(rate_limiter):
+    """Resolve the rate_limiter argument shared by both clients
+
+    None  -> built-in 3,600 req/min bucket (shared across processes when
+             MOONDEV_RATE_LIMIT_FILE is set)
+    False -> no client-side rate limiting
+    """
+    if rate_limiter is None:
+        return RateLimiter(state_file=os.getenv('MOONDEV_RATE_LIMIT_FILE'))
+    return rate_limiter or None
+
+
+def _default_retry(retry):
+    """Resolve the retry argument shared by both clients
+
+    None  -> RetryPolicy with 4 attempts, 5s connect / 30s read timeouts
+             and a 60s deadline per call
+    False -> one attempt, 30s timeout
+    """
+    if retry is None:
+        return RetryPolicy()
+    return retry or None
+
+
+def _default_metrics(metrics):
+    """Resolve the opt-in metrics argument shared by both clients
+
+    True -> in-process Metrics (snapshot() / prometheus_text())
+    None/False -> no instrumentation
+    """
+    if metrics is True:
+        return Metrics()
+    return metrics or None
+
+
+def _default_cache(cache):
+    """Resolve the opt-in cache argument shared by both clients
+
+    True -> in-memory ResponseCache with per-endpoint TTLs
+    None/False -> no caching
+    """
+    if cache is True:
+        return ResponseCache()
+    return cache or None
+
+
+def _default_validators(conditional):
+    """Resolve the opt-in conditional argument shared by both clients
+
+    True -> ValidatorCache remembering ETag/Last-Modified per URL
+    None/False -> plain GETs
+    """
+    if conditional is True:
+        return ValidatorCache()
+    return conditional or None
 
-        response = self.session.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return response
+
+def _default_candle_store(candle_store):
+    """Resolve the opt-in candle_store argument
+
+    str -> CandleStore rooted at that directory
+    None/False -> every get_candles() call goes to the network
+    """
+    if isinstance(candle_store, str):
+        return CandleStore(candle_store)
+    return candle_store or None
+
+
+def _check_format(response_format):
+    """Validate a response_format argument"""
+    if response_format not in RESPONSE_FORMATS + COLUMNAR_FORMATS:
+        raise ValueError(f"response_format must be one of {RESPONSE_FORMATS + COLUMNAR_FORMATS}")
+    return response_format
+
+
+def _decode_text(body):
+    """Decode a plain text response body"""
+    return body.decode('utf-8')
+
+
+def _parse_address_list(text):
+    """Split the plain text whale address list into clean addresses"""
+    addresses = text.strip().split('\n')
+    return [addr.strip() for addr in addresses if addr.strip()]
+
+
+class _MoonDevEndpoints:
+    """
+    🌙 Endpoint surface shared by MoonDevAPI and AsyncMoonDevAPI
+
+    Every method only builds its path and hands it to self._request().
+    The sync client returns the decoded data, the async client returns an
+    awaitable - so both clients always expose the exact same endpoints.
+    Bulk helpers fan a per-address method out through self._map_addresses().
+    """
+
+    def _request(self, endpoint, auth_required=True, text=False, parse=None, payload=None, model=None,
+                 columns=None, response_format=None):
+        """Fetch an endpoint and return the decoded body (implemented by each client)"""
+        raise NotImplementedError
+
+    def _map_addresses(self, fn, addresses, concurrency):
+        """Stream fn(address) results for many addresses (implemented by each client)"""
+        raise NotImplementedError
+
+    def _decode(self, body, text=False, parse=None, model=None, columns=None, response_format="json"):
+        """Turn a raw response body into the requested response format"""
+        if response_format == "raw":
+            return body
+
+        loads = _decode_text if text else self.decoder
+        if response_format == "lazy":
+            return LazyJSON(body, loads, parse)
+
+        if columns and response_format in COLUMNAR_FORMATS:
+            arrays = columns.decode(body, loads)
+            return to_frame(arrays) if response_format == "frame" else arrays
+
+        data = loads(body)
+        if parse:
+            data = parse(data)
+        if model and response_format == "typed":
+            data = model(data)
+        return data
+
+    def _timed_decode(self, endpoint, body, decode):
+        """_decode() a fetched body, recording decode time when metrics are on"""
+        if not self.metrics:
+            return self._decode(body, *decode)
+        started = time.perf_counter()
+        data = self._decode(body, *decode)
+        self.metrics.observe_decode(endpoint, time.perf_counter() - started)
+        return data
+
+    def as_format(self, response_format):
+        """
+        Same client (session, cache, rate limiter) returning another format.
+
+        Args:
+            response_format: "json" (decoded objects), "raw" (bytes),
+                             "lazy" (LazyJSON, decoded on first access),
+                             "typed" (records from data_layer.models where available),
+                             "arrays" / "frame" (columnar time series, see
+                             data_layer.columnar - other endpoints return json)
+        """
+        clone = copy.copy(self)
+        clone.response_format = _check_format(response_format)
+        return clone
 
     # ==================== HEALTH ====================
     def health(self):
         """Check API health status (no auth required)"""
-        response = self._get("/health", auth_required=False)
-        return response.json()
+        return self._request("/health", auth_required=False)
 
     # ==================== LIQUIDATIONS ====================
     def get_liquidations(self, timeframe="1h"):
         """Get liquidation data for specified timeframe (10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d)"""
-        response = self._get(f"/api/liquidations/{timeframe}.json")
-        return response.json()
+        return self._request(f"/api/liquidations/{timeframe}.json")
 
     def get_liquidation_stats(self):
         """Get aggregated liquidation stats across all timeframes"""
-        response = self._get("/api/liquidations/stats.json")
-        return response.json()
+        return self._request("/api/liquidations/stats.json")
 
     # ==================== POSITIONS ====================
     def get_positions(self):
-        """Get large positions near liquidation ($200k+) - top 50 across ALL symbols"""
-        response = self._get("/api/positions.json")
-        return response.json()
+        """Get large positions near liquidation ($200k+) - top 50 across ALL symbols
+
+        With response_format="typed", longs/shorts are lists of Position records.
+        """
+        return self._request("/api/positions.json", model=parse_positions)
 
     def get_all_positions(self):
         """Get ALL positions for all 148 symbols - top 50 longs/shorts per symbol
@@ -155,55 +319,46 @@ class MoonDevAPI:
         Returns dict with symbols key containing all symbol data.
         Access specific symbol: data['symbols']['BTC'], data['symbols']['HYPE'], etc.
         """
-        response = self._get("/api/positions/all.json")
-        return response.json()
+        return self._request("/api/positions/all.json")
 
     # ==================== WHALES ====================
     def get_whales(self):
         """Get recent whale trades ($25k+)"""
-        response = self._get("/api/whales.json")
-        return response.json()
+        return self._request("/api/whales.json")
 
     def get_whale_addresses(self):
         """Get plain text list of known whale addresses"""
-        response = self._get("/api/whale_addresses.txt")
-        addresses = response.text.strip().split('\n')
-        return [addr.strip() for addr in addresses if addr.strip()]
+        return self._request("/api/whale_addresses.txt", text=True, parse=_parse_address_list)
 
     def get_buyers(self):
         """Get recent $5k+ buyers on HYPE/SOL/XRP/ETH (buyers only, no sells)"""
-        response = self._get("/api/buyers.json")
-        return response.json()
+        return self._request("/api/buyers.json")
 
     def get_depositors(self):
         """Get all Hyperliquid depositors - canonical list of every address that bridged USDC"""
-        response = self._get("/api/depositors.json")
-        return response.json()
+        return self._request("/api/depositors.json")
 
     # ==================== EVENTS ====================
     def get_events(self):
         """Get real-time blockchain events (Transfers, Swaps, Deposits, etc.)"""
-        response = self._get("/api/events.json")
-        return response.json()
+        return self._request("/api/events.json")
 
     # ==================== CONTRACTS ====================
     def get_contracts(self):
         """Get contract registry with metadata and activity tracking"""
-        response = self._get("/api/contracts.json")
-        return response.json()
+        return self._request("/api/contracts.json")
 
     # ==================== TICK DATA ====================
     def get_tick_stats(self):
         """Get tick data collection stats and summary"""
-        response = self._get("/api/ticks/stats.json")
-        return response.json()
+        return self._request("/api/ticks/stats.json")
 
     def get_tick_latest(self):
         """Get latest prices for all symbols"""
-        response = self._get("/api/ticks/latest.json")
-        return response.json()
+        return self._request("/api/ticks/latest.json")
 
-    def get_ticks(self, symbol="BTC", duration="1h", limit=10000, start_time=None, end_time=None):
+    def get_ticks(self, symbol="BTC", duration="1h", limit=10000, start_time=None, end_time=None,
+                  as_frame=False, as_arrays=False):
         """
         Get historical tick data for any of 80 tracked symbols.
 
@@ -214,6 +369,8 @@ class MoonDevAPI:
             limit: Max ticks to return (default: 10000)
             start_time: Start time in Unix ms (optional, overrides duration)
             end_time: End time in Unix ms (optional)
+            as_frame: Return a pandas DataFrame of typed columns instead
+            as_arrays: Return a dict of NumPy arrays instead
 
         Returns:
             dict with:
@@ -222,6 +379,8 @@ class MoonDevAPI:
                 - tick_count: Number of ticks returned
                 - latest_price: Most recent price
                 - ticks: List of tick objects [{t, p, dt}, ...]
+            With response_format="typed", ticks is a list of Tick records.
+            With as_frame/as_arrays: columns time (int64 ms), price (float64).
         """
         params = [f"duration={duration}", f"limit={limit}"]
         if start_time is not None:
@@ -229,34 +388,29 @@ class MoonDevAPI:
         if end_time is not None:
             params.append(f"endTime={end_time}")
         query = "?" + "&".join(params)
-        response = self._get(f"/api/ticks/{symbol.upper()}{query}")
-        return response.json()
+        return self._request(f"/api/ticks/{symbol.upper()}{query}", model=parse_ticks,
+                             columns=TICK_COLUMNS, response_format=columnar_format(as_frame, as_arrays))
 
     # ==================== ORDER FLOW & TRADES ====================
     def get_trades(self):
         """Get recent 500 trades (real-time)"""
-        response = self._get("/api/trades.json")
-        return response.json()
+        return self._request("/api/trades.json")
 
     def get_large_trades(self):
         """Get large trades >$100k (24h)"""
-        response = self._get("/api/large_trades.json")
-        return response.json()
+        return self._request("/api/large_trades.json")
 
     def get_orderflow(self):
         """Get order flow imbalance by timeframe + per coin"""
-        response = self._get("/api/orderflow.json")
-        return response.json()
+        return self._request("/api/orderflow.json")
 
     def get_orderflow_stats(self):
         """Get order flow service stats (uptime, trades/sec)"""
-        response = self._get("/api/orderflow/stats.json")
-        return response.json()
+        return self._request("/api/orderflow/stats.json")
 
     def get_imbalance(self, timeframe="1h"):
         """Get buy/sell imbalance (5m, 15m, 1h, 4h, 24h)"""
-        response = self._get(f"/api/imbalance/{timeframe}.json")
-        return response.json()
+        return self._request(f"/api/imbalance/{timeframe}.json")
 
     # ==================== USER POSITIONS (HYPERLIQUID) ====================
     def get_user_positions(self, address):
@@ -290,13 +444,10 @@ class MoonDevAPI:
                 }
             }
         """
-        url = "https://api.hyperliquid.xyz/info"
         payload = {"type": "clearinghouseState", "user": address}
 
         print(f"📡 Moon Dev: Fetching positions for {address[:6]}...{address[-4:]}")
-        response = self.session.post(url, json=payload, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return self._request(HYPERLIQUID_INFO_URL, payload=payload)
 
     # ==================== MOON DEV USER API (LOCAL NODE) ====================
     def get_user_positions_api(self, address):
@@ -311,8 +462,7 @@ class MoonDevAPI:
         Returns:
             dict with positions, margin summary, and account details
         """
-        response = self._get(f"/api/user/{address}/positions")
-        return response.json()
+        return self._request(f"/api/user/{address}/positions")
 
     def get_user_fills(self, address, limit=100):
         """
@@ -346,13 +496,15 @@ class MoonDevAPI:
                 'tid': 12345,              # trade ID
                 'fee': '1.5'               # fee paid
             }
+
+        With response_format="typed", fills is a list of Fill records.
         """
         params = f"?limit={limit}" if limit != 100 else ""
-        response = self._get(f"/api/user/{address}/fills{params}")
-        return response.json()
+        return self._request(f"/api/user/{address}/fills{params}", model=parse_user_fills)
 
     # ==================== POSITION SNAPSHOTS ====================
-    def get_position_snapshots(self, symbol, hours=24, limit=1000, min_distance_pct=None, max_distance_pct=None, side=None):
+    def get_position_snapshots(self, symbol, hours=24, limit=1000, min_distance_pct=None, max_distance_pct=None, side=None,
+                               as_frame=False, as_arrays=False):
         """
         Get historical position snapshots for positions near liquidation.
 
@@ -366,9 +518,13 @@ class MoonDevAPI:
             min_distance_pct: Filter by minimum distance to liquidation %
             max_distance_pct: Filter by maximum distance to liquidation %
             side: Filter by position side ('long' or 'short')
+            as_frame: Return a pandas DataFrame of typed columns instead
+            as_arrays: Return a dict of NumPy arrays instead
 
         Returns:
             dict with snapshots and metadata
+            With as_frame/as_arrays: columns time, address, side, position_value,
+            entry_price, liquidation_price, distance_pct, leverage.
         """
         params = f"?hours={hours}&limit={limit}"
         if min_distance_pct is not None:
@@ -377,8 +533,8 @@ class MoonDevAPI:
             params += f"&max_distance_pct={max_distance_pct}"
         if side is not None:
             params += f"&side={side}"
-        response = self._get(f"/api/position_snapshots/symbol/{symbol}{params}")
-        return response.json()
+        return self._request(f"/api/position_snapshots/symbol/{symbol}{params}",
+                             columns=POSITION_SNAPSHOT_COLUMNS, response_format=columnar_format(as_frame, as_arrays))
 
     def get_position_snapshot_stats(self, hours=24):
         """
@@ -395,8 +551,7 @@ class MoonDevAPI:
                 - scan_metadata: recent scan info
         """
         params = f"?hours={hours}"
-        response = self._get(f"/api/position_snapshots/stats{params}")
-        return response.json()
+        return self._request(f"/api/position_snapshots/stats{params}")
 
     # ==================== MARKET DATA (NO RATE LIMITS!) ====================
     def get_prices(self):
@@ -414,8 +569,7 @@ class MoonDevAPI:
                 - funding_rates: Dict of coin -> funding rate
                 - open_interest: Dict of coin -> open interest
         """
-        response = self._get("/api/prices")
-        return response.json()
+        return self._request("/api/prices")
 
     def get_price(self, coin):
         """
@@ -436,8 +590,7 @@ class MoonDevAPI:
                 - spread: ask - bid
                 - spread_bps: Spread in basis points
         """
-        response = self._get(f"/api/price/{coin}")
-        return response.json()
+        return self._request(f"/api/price/{coin}")
 
     def get_orderbook(self, coin):
         """
@@ -462,9 +615,10 @@ class MoonDevAPI:
                 - spread_bps: Spread in basis points
                 - bid_depth: Number of bid levels
                 - ask_depth: Number of ask levels
+            With response_format="typed", an OrderBook record with
+            bids/asks as lists of BookLevel records.
         """
-        response = self._get(f"/api/orderbook/{coin}")
-        return response.json()
+        return self._request(f"/api/orderbook/{coin}", model=parse_orderbook)
 
     def get_account(self, address):
         """
@@ -485,8 +639,7 @@ class MoonDevAPI:
                 - assetPositions: List of all open positions with full details
                 - withdrawable: Available to withdraw
         """
-        response = self._get(f"/api/account/{address}")
-        return response.json()
+        return self._request(f"/api/account/{address}")
 
     def get_fills(self, address, limit=100):
         """
@@ -516,10 +669,10 @@ class MoonDevAPI:
                     "oid": 293951512222       # Order ID
                 }
             ]
+            With response_format="typed", a list of Fill records.
         """
         params = f"?limit={limit}" if limit != 100 else ""
-        response = self._get(f"/api/fills/{address}{params}")
-        return response.json()
+        return self._request(f"/api/fills/{address}{params}", model=parse_fills)
 
     def get_candle_symbols(self):
         """
@@ -535,10 +688,9 @@ class MoonDevAPI:
                 - intervals: Available candle intervals (1m, 5m, 15m, 1h, 4h, 1d)
                 - symbol_details: Dict with per-symbol metadata
         """
-        response = self._get("/api/candles/symbols")
-        return response.json()
+        return self._request("/api/candles/symbols")
 
-    def get_candles(self, coin, interval="5m", start_time=None, end_time=None):
+    def get_candles(self, coin, interval="5m", start_time=None, end_time=None, as_frame=False, as_arrays=False):
         """
         Get OHLCV candles for any of 80 tracked symbols in Hyperliquid-compatible format.
 
@@ -556,6 +708,8 @@ class MoonDevAPI:
             interval: Candle interval - 1m, 5m, 15m, 1h, 4h, 1d (default: 5m)
             start_time: Start timestamp in ms (optional)
             end_time: End timestamp in ms (optional)
+            as_frame: Return a pandas DataFrame of typed columns instead
+            as_arrays: Return a dict of NumPy arrays instead
 
         Returns:
             list of candle objects:
@@ -573,6 +727,11 @@ class MoonDevAPI:
                     "n": 239               # Number of price updates
                 }
             ]
+            With response_format="typed", a list of Candle records.
+            With as_frame/as_arrays: columns time, close_time, open, high, low,
+            close, volume, trades.
+            With a candle_store (MoonDevAPI), closed candles are read from disk
+            and only missing ranges plus the open bar are downloaded.
         """
         params = [f"interval={interval}"]
         if start_time is not None:
@@ -580,8 +739,8 @@ class MoonDevAPI:
         if end_time is not None:
             params.append(f"endTime={end_time}")
         query = "?" + "&".join(params) if params else ""
-        response = self._get(f"/api/candles/{coin}{query}")
-        return response.json()
+        return self._request(f"/api/candles/{coin}{query}", model=parse_candles,
+                             columns=CANDLE_COLUMNS, response_format=columnar_format(as_frame, as_arrays))
 
     # ==================== HLP (HYPERLIQUIDITY PROVIDER) ====================
     def get_hlp_positions(self, include_strategies=True):
@@ -619,8 +778,7 @@ class MoonDevAPI:
             }
         """
         params = "" if include_strategies else "?include_strategies=false"
-        response = self._get(f"/api/hlp/positions{params}")
-        return response.json()
+        return self._request(f"/api/hlp/positions{params}")
 
     def get_hlp_trades(self, limit=100):
         """
@@ -636,8 +794,7 @@ class MoonDevAPI:
                 - strategies: Which strategies have trades
         """
         params = f"?limit={limit}" if limit != 100 else ""
-        response = self._get(f"/api/hlp/trades{params}")
-        return response.json()
+        return self._request(f"/api/hlp/trades{params}")
 
     def get_hlp_trade_stats(self):
         """
@@ -652,24 +809,26 @@ class MoonDevAPI:
                 - by_strategy: Volume breakdown by strategy
                 - by_coin: Volume breakdown by coin
         """
-        response = self._get("/api/hlp/trades/stats")
-        return response.json()
+        return self._request("/api/hlp/trades/stats")
 
-    def get_hlp_position_history(self, hours=24):
+    def get_hlp_position_history(self, hours=24, as_frame=False, as_arrays=False):
         """
         Get historical position snapshots over time.
 
         Args:
             hours: Number of hours of history (default: 24)
+            as_frame: Return a pandas DataFrame of typed columns instead
+            as_arrays: Return a dict of NumPy arrays instead
 
         Returns:
             dict with:
                 - snapshots: List of position snapshots with timestamps
                 - interval: Time between snapshots
+            With as_frame/as_arrays: columns time, account_value, net_exposure, positions.
         """
         params = f"?hours={hours}" if hours != 24 else ""
-        response = self._get(f"/api/hlp/positions/history{params}")
-        return response.json()
+        return self._request(f"/api/hlp/positions/history{params}",
+                             columns=HLP_HISTORY_COLUMNS, response_format=columnar_format(as_frame, as_arrays))
 
     def get_hlp_liquidators(self):
         """
@@ -682,25 +841,27 @@ class MoonDevAPI:
                 - events: List of liquidator activation events
                 - liquidators: Current status of each liquidator account
         """
-        response = self._get("/api/hlp/liquidators")
-        return response.json()
+        return self._request("/api/hlp/liquidators")
 
-    def get_hlp_deltas(self, hours=24):
+    def get_hlp_deltas(self, hours=24, as_frame=False, as_arrays=False):
         """
         Get HLP net exposure (delta) changes over time.
 
         Args:
             hours: Number of hours of history (default: 24)
+            as_frame: Return a pandas DataFrame of typed columns instead
+            as_arrays: Return a dict of NumPy arrays instead
 
         Returns:
             dict with:
                 - deltas: Time series of net exposure values
                 - current: Current net exposure
                 - change_24h: 24-hour change in exposure
+            With as_frame/as_arrays: columns time, net_delta, long_exposure, short_exposure.
         """
         params = f"?hours={hours}" if hours != 24 else ""
-        response = self._get(f"/api/hlp/deltas{params}")
-        return response.json()
+        return self._request(f"/api/hlp/deltas{params}",
+                             columns=HLP_DELTA_COLUMNS, response_format=columnar_format(as_frame, as_arrays))
 
     def get_hlp_sentiment(self):
         """
@@ -716,8 +877,7 @@ class MoonDevAPI:
                 - signal: Human readable signal (e.g., "Retail heavily SHORT")
                 - percentile: Where current delta falls historically
         """
-        response = self._get("/api/hlp/sentiment")
-        return response.json()
+        return self._request("/api/hlp/sentiment")
 
     def get_hlp_liquidator_status(self):
         """
@@ -728,8 +888,7 @@ class MoonDevAPI:
         Returns:
             dict with liquidator addresses, status (active/idle), and PnL data
         """
-        response = self._get("/api/hlp/liquidators/status")
-        return response.json()
+        return self._request("/api/hlp/liquidators/status")
 
     def get_hlp_market_maker(self):
         """
@@ -738,8 +897,7 @@ class MoonDevAPI:
         Returns:
             dict with market maker positions and activity for major coins
         """
-        response = self._get("/api/hlp/market-maker")
-        return response.json()
+        return self._request("/api/hlp/market-maker")
 
     def get_hlp_timing(self):
         """
@@ -748,8 +906,7 @@ class MoonDevAPI:
         Returns:
             dict with profitability breakdown by hour and trading session
         """
-        response = self._get("/api/hlp/timing")
-        return response.json()
+        return self._request("/api/hlp/timing")
 
     def get_hlp_correlation(self):
         """
@@ -758,8 +915,7 @@ class MoonDevAPI:
         Returns:
             dict with correlation data showing how HLP delta relates to price moves
         """
-        response = self._get("/api/hlp/correlation")
-        return response.json()
+        return self._request("/api/hlp/correlation")
 
     def get_hlp_delta(self):
         """
@@ -776,8 +932,7 @@ class MoonDevAPI:
                 - position_count: Number of positions across vaults
                 - timestamp: Last update time
         """
-        response = self._get("/api/hlp/delta")
-        return response.json()
+        return self._request("/api/hlp/delta")
 
     def get_hlp_flips(self):
         """
@@ -801,8 +956,7 @@ class MoonDevAPI:
                 }
             ]
         """
-        response = self._get("/api/hlp/flips")
-        return response.json()
+        return self._request("/api/hlp/flips")
 
     def get_hlp_flip_stats(self):
         """
@@ -820,24 +974,20 @@ class MoonDevAPI:
                 - current_direction: Current HLP direction (long/short)
                 - current_hold_hours: Hours in current direction
         """
-        response = self._get("/api/hlp/flip-stats")
-        return response.json()
+        return self._request("/api/hlp/flip-stats")
 
     # ==================== SMART MONEY ====================
     def get_smart_money_rankings(self):
         """Get Top 100 smart money + Bottom 100 dumb money rankings"""
-        response = self._get("/api/smart_money/rankings.json")
-        return response.json()
+        return self._request("/api/smart_money/rankings.json")
 
     def get_smart_money_leaderboard(self):
         """Get Top 50 performers with details"""
-        response = self._get("/api/smart_money/leaderboard.json")
-        return response.json()
+        return self._request("/api/smart_money/leaderboard.json")
 
     def get_smart_money_signals(self, timeframe="1h"):
         """Get smart money trading signals (10m, 1h, 24h)"""
-        response = self._get(f"/api/smart_money/signals_{timeframe}.json")
-        return response.json()
+        return self._request(f"/api/smart_money/signals_{timeframe}.json")
 
     # ==================== MULTI-EXCHANGE LIQUIDATIONS ====================
     def get_all_liquidations(self, timeframe="1h"):
@@ -850,8 +1000,7 @@ class MoonDevAPI:
         Returns:
             dict with liquidation events from all exchanges, sorted by USD value
         """
-        response = self._get(f"/api/all_liquidations/{timeframe}.json")
-        return response.json()
+        return self._request(f"/api/all_liquidations/{timeframe}.json")
 
     def get_all_liquidation_stats(self):
         """
@@ -864,8 +1013,7 @@ class MoonDevAPI:
                 - by_exchange: Breakdown by exchange (hyperliquid, binance, bybit, okx)
                 - by_side: Long vs short breakdown
         """
-        response = self._get("/api/all_liquidations/stats.json")
-        return response.json()
+        return self._request("/api/all_liquidations/stats.json")
 
     def get_binance_liquidations(self, timeframe="1h"):
         """
@@ -874,8 +1022,7 @@ class MoonDevAPI:
         Args:
             timeframe: 10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d
         """
-        response = self._get(f"/api/binance_liquidations/{timeframe}.json")
-        return response.json()
+        return self._request(f"/api/binance_liquidations/{timeframe}.json")
 
     def get_bybit_liquidations(self, timeframe="1h"):
         """
@@ -884,8 +1031,7 @@ class MoonDevAPI:
         Args:
             timeframe: 10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d
         """
-        response = self._get(f"/api/bybit_liquidations/{timeframe}.json")
-        return response.json()
+        return self._request(f"/api/bybit_liquidations/{timeframe}.json")
 
     def get_okx_liquidations(self, timeframe="1h"):
         """
@@ -894,8 +1040,7 @@ class MoonDevAPI:
         Args:
             timeframe: 10m, 1h, 4h, 12h, 24h, 2d, 7d, 14d, 30d
         """
-        response = self._get(f"/api/okx_liquidations/{timeframe}.json")
-        return response.json()
+        return self._request(f"/api/okx_liquidations/{timeframe}.json")
 
     # ==================== HIP3 LIQUIDATIONS ====================
     def get_hip3_liquidations(self, timeframe="1h"):
@@ -922,8 +1067,7 @@ class MoonDevAPI:
                 - category: 'stocks', 'commodities', 'indices', or 'fx'
                 - timestamp: Event timestamp
         """
-        response = self._get(f"/api/hip3_liquidations/{timeframe}.json")
-        return response.json()
+        return self._request(f"/api/hip3_liquidations/{timeframe}.json")
 
     def get_hip3_liquidation_stats(self):
         """
@@ -941,8 +1085,7 @@ class MoonDevAPI:
                 - by_symbol: Breakdown by individual symbol
                 - top_symbols: Top symbols by liquidation volume
         """
-        response = self._get("/api/hip3_liquidations/stats.json")
-        return response.json()
+        return self._request("/api/hip3_liquidations/stats.json")
 
     # ==================== HIP3 MARKET DATA (Multi-Dex) ====================
     def get_hip3_meta(self, include_delisted=False):
@@ -968,8 +1111,7 @@ class MoonDevAPI:
         Symbol format: {dex}:{ticker} (e.g., xyz:TSLA, hyna:BTC, km:US500)
         """
         params = "?include_delisted=true" if include_delisted else ""
-        response = self._get(f"/api/hip3/meta{params}")
-        return response.json()
+        return self._request(f"/api/hip3/meta{params}")
 
     def get_hip3_tick_stats(self):
         """
@@ -983,19 +1125,21 @@ class MoonDevAPI:
                 - by_category: Breakdown by category
                 - last_update: Last collection timestamp
         """
-        response = self._get("/api/hip3_ticks/stats.json")
-        return response.json()
+        return self._request("/api/hip3_ticks/stats.json")
 
-    def get_hip3_ticks(self, dex, ticker):
+    def get_hip3_ticks(self, dex, ticker, as_frame=False, as_arrays=False):
         """
         Get raw tick data for a specific HIP3 symbol.
 
         Args:
             dex: Dex prefix (xyz, flx, hyna, km)
             ticker: Symbol ticker (tsla, btc, gold, us500, etc.) - case insensitive
+            as_frame: Return a pandas DataFrame of typed columns instead
+            as_arrays: Return a dict of NumPy arrays instead
 
         Returns:
             dict/list with tick data for the symbol
+            With as_frame/as_arrays: columns time (int64 ms), price (float64).
 
         Examples:
             get_hip3_ticks("xyz", "tsla")   # Tesla stock
@@ -1003,8 +1147,361 @@ class MoonDevAPI:
             get_hip3_ticks("hyna", "btc")   # Bitcoin
             get_hip3_ticks("km", "us500")   # S&P 500 index
         """
-        response = self._get(f"/api/hip3_ticks/{dex.lower()}_{ticker.lower()}.json")
-        return response.json()
+        return self._request(f"/api/hip3_ticks/{dex.lower()}_{ticker.lower()}.json",
+                             columns=TICK_COLUMNS, response_format=columnar_format(as_frame, as_arrays))
+
+    # ==================== BULK (MANY WALLETS) ====================
+    def get_accounts(self, addresses, concurrency=DEFAULT_CONCURRENCY):
+        """
+        get_account() for many wallets, streamed back as each one completes.
+
+        Args:
+            addresses: Iterable of wallet addresses (e.g. get_whale_addresses())
+            concurrency: Max requests in flight (default: 8)
+
+        Returns:
+            Iterator of AddressResult(address, data, error) in completion order
+            (an async iterator on AsyncMoonDevAPI). Failed addresses carry the
+            exception in .error instead of aborting the batch.
+        """
+        return self._map_addresses(self.get_account, addresses, concurrency)
+
+    def get_user_positions_many(self, addresses, concurrency=DEFAULT_CONCURRENCY):
+        """get_user_positions_api() for many wallets (see get_accounts for the result format)"""
+        return self._map_addresses(self.get_user_positions_api, addresses, concurrency)
+
+    def get_fills_many(self, addresses, limit=100, concurrency=DEFAULT_CONCURRENCY):
+        """get_fills() for many wallets (see get_accounts for the result format)"""
+        return self._map_addresses(lambda address: self.get_fills(address, limit), addresses, concurrency)
+
+    def get_user_fills_many(self, addresses, limit=100, concurrency=DEFAULT_CONCURRENCY):
+        """get_user_fills() for many wallets (see get_accounts for the result format)"""
+        return self._map_addresses(lambda address: self.get_user_fills(address, limit), addresses, concurrency)
+
+
+class MoonDevAPI(_MoonDevEndpoints):
+    """
+    🌙 Moon Dev's API Client
+
+    Args:
+        api_key: Moon Dev API key (defaults to MOONDEV_API_KEY)
+        base_url: API base URL (defaults to MOONDEV_BASE_URL, then https://api.moondev.com)
+        rate_limiter: RateLimiter to throttle requests with. Defaults to a
+                      built-in 3,600 req/min bucket, pass False to disable.
+        cache: True (or a ResponseCache) to serve repeat calls from memory
+               while the data is still fresh. Off by default.
+        conditional: True (or a ValidatorCache) to send ETag/Last-Modified
+                     conditional requests and reuse the decoded body on 304.
+                     Off by default.
+        coalesce: Share one in-flight request between concurrent identical
+                  calls (default: True)
+        retry: RetryPolicy for GETs failing with 429/5xx or network errors.
+               Defaults to 4 attempts with jittered backoff, pass False to disable.
+        metrics: True (or a Metrics) to record per-endpoint latency, bytes,
+                 decode time, status codes, retries and cache hits. Off by default.
+        decoder: JSON decoder - "orjson", "msgspec", "json" or a callable.
+                 Defaults to the fastest one installed.
+        response_format: "json" (default), "raw" bytes, "lazy" LazyJSON views,
+                         "typed" records with numbers already parsed, or
+                         "arrays" / "frame" for columnar time series (json elsewhere)
+        candle_store: Directory (or a CandleStore) to keep closed candles in.
+                      get_candles() with a start_time then only downloads
+                      missing ranges and the still-open bar. Off by default.
+    """
+
+    def __init__(self, api_key=None, base_url=None, rate_limiter=None, cache=None,
+                 conditional=None, coalesce=True, decoder=None, response_format="json", candle_store=None,
+                 retry=None, metrics=None):
+        self.api_key = api_key or os.getenv('MOONDEV_API_KEY')
+        self.base_url = base_url or os.getenv('MOONDEV_BASE_URL', DEFAULT_BASE_URL)
+        self.headers = {'X-API-Key': self.api_key} if self.api_key else {}
+        self.session = requests.Session()
+        self.rate_limiter = _default_rate_limiter(rate_limiter)
+        self.cache = _default_cache(cache)
+        self.validators = _default_validators(conditional)
+        self.single_flight = SingleFlight() if coalesce else None
+        self.retry = _default_retry(retry)
+        self.metrics = _default_metrics(metrics)
+        self.decoder = get_decoder(decoder)
+        self.response_format = _check_format(response_format)
+        self.candle_store = _default_candle_store(candle_store)
+
+    def get_candles(self, coin, interval="5m", start_time=None, end_time=None, as_frame=False, as_arrays=False):
+        fmt = columnar_format(as_frame, as_arrays) or self.response_format
+        if self.candle_store is None or start_time is None or fmt in ("raw", "lazy"):
+            return super().get_candles(coin, interval, start_time, end_time, as_frame, as_arrays)
+
+        def fetch(start_ms, end_ms):
+            return super(MoonDevAPI, self).get_candles(coin, interval, start_ms, end_ms, as_arrays=True)
+
+        return self.candle_store.get_candles(fetch, coin, interval, start_time, end_time, fmt)
+
+    get_candles.__doc__ = _MoonDevEndpoints.get_candles.__doc__
+
+    def _map_addresses(self, fn, addresses, concurrency):
+        """Run fn over addresses on a bounded thread pool"""
+        return iter_addresses(fn, addresses, concurrency)
+
+    def _get(self, endpoint, auth_required=True, extra_headers=None):
+        """Make GET request to API"""
+        url = f"{self.base_url}{endpoint}"
+        headers = self.headers if auth_required else {}
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+
+        attempts = [0]
+
+        def send(started):
+            attempts[0] += 1
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            timeout = self.retry.timeouts(started) if self.retry else REQUEST_TIMEOUT
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            return response.status_code, response.headers, response
+
+        started = time.perf_counter()
+        try:
+            if self.retry:
+                _, _, response = self.retry.call(send, NETWORK_ERRORS)
+            else:
+                _, _, response = send(None)
+        except Exception as e:
+            if self.metrics:
+                self.metrics.observe_request(endpoint, type(e).__name__, time.perf_counter() - started,
+                                             retries=attempts[0] - 1)
+            raise
+
+        if self.metrics:
+            self.metrics.observe_request(endpoint, response.status_code, time.perf_counter() - started,
+                                         len(response.content), attempts[0] - 1)
+        response.raise_for_status()
+        return response
+
+    def _post(self, url, payload):
+        """Make POST request to an absolute URL (Hyperliquid info API)"""
+        response = self.session.post(url, json=payload, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response
+
+    def _request(self, endpoint, auth_required=True, text=False, parse=None, payload=None, model=None,
+                 columns=None, response_format=None):
+        """Fetch an endpoint and return the decoded body"""
+        decode = (text, parse, model, columns, response_format or self.response_format)
+        if payload is not None:
+            return self._decode(self._post(endpoint, payload).content, *decode)
+
+        key = (endpoint, *decode)
+        if self.cache:
+            hit, data = self.cache.get(key)
+            if hit:
+                if self.metrics:
+                    self.metrics.cache_hit(endpoint)
+                return data
+
+        if self.single_flight:
+            return self.single_flight.do(key, lambda: self._fetch(key, endpoint, auth_required, decode))
+        return self._fetch(key, endpoint, auth_required, decode)
+
+    def _fetch(self, key, endpoint, auth_required, decode):
+        """GET an endpoint over the network, decode it and update the caches"""
+        conditional_headers, validated = None, None
+        if self.validators:
+            conditional_headers, validated = self.validators.request_headers(key)
+
+        response = self._get(endpoint, auth_required, conditional_headers)
+        body = response.content
+
+        if response.status_code == 304 and validated is not None:
+            data = self.validators.revalidated(validated)
+            body_size = validated[2]
+            if self.metrics:
+                self.metrics.cache_hit(endpoint, "not_modified")
+        else:
+            data = self._timed_decode(endpoint, body, decode)
+            body_size = len(body)
+            if self.validators:
+                self.validators.remember(key, response.headers.get('ETag'),
+                                         response.headers.get('Last-Modified'), data, body_size)
+
+        if self.cache:
+            self.cache.put(key, data, body_size, self.cache.ttl_for(endpoint))
+        return data
+
+
+class AsyncMoonDevAPI(_MoonDevEndpoints):
+    """
+    🌙 Moon Dev's Async API Client
+
+    Same methods as MoonDevAPI, but every call returns an awaitable and all
+    requests share one pooled aiohttp connection. Fan out with asyncio.gather:
+
+        async with AsyncMoonDevAPI() as api:
+            liqs, hlp, book = await asyncio.gather(
+                api.get_liquidations("1h"),
+                api.get_hlp_sentiment(),
+                api.get_orderbook("BTC"),
+            )
+
+    Args:
+        api_key: Moon Dev API key (defaults to MOONDEV_API_KEY)
+        base_url: API base URL (defaults to MOONDEV_BASE_URL, then https://api.moondev.com)
+        max_connections: Size of the shared connection pool (default: 100)
+        rate_limiter: RateLimiter to throttle requests with. Defaults to a
+                      built-in 3,600 req/min bucket, pass False to disable.
+        cache: True (or a ResponseCache) to serve repeat calls from memory
+               while the data is still fresh. Off by default.
+        conditional: True (or a ValidatorCache) to send ETag/Last-Modified
+                     conditional requests and reuse the decoded body on 304.
+                     Off by default.
+        coalesce: Share one in-flight request between concurrent identical
+                  calls (default: True)
+        retry: RetryPolicy for GETs failing with 429/5xx or network errors.
+               Defaults to 4 attempts with jittered backoff, pass False to disable.
+        metrics: True (or a Metrics) to record per-endpoint latency, bytes,
+                 decode time, status codes, retries and cache hits. Off by default.
+        decoder: JSON decoder - "orjson", "msgspec", "json" or a callable.
+                 Defaults to the fastest one installed.
+        response_format: "json" (default), "raw" bytes, "lazy" LazyJSON views,
+                         "typed" records with numbers already parsed, or
+                         "arrays" / "frame" for columnar time series (json elsewhere)
+    """
+
+    def __init__(self, api_key=None, base_url=None, max_connections=100,
+                 rate_limiter=None, cache=None, conditional=None, coalesce=True, decoder=None,
+                 response_format="json", retry=None, metrics=None):
+        if aiohttp is None:
+            raise ImportError("AsyncMoonDevAPI requires aiohttp - pip install aiohttp")
+
+        self.api_key = api_key or os.getenv('MOONDEV_API_KEY')
+        self.base_url = base_url or os.getenv('MOONDEV_BASE_URL', DEFAULT_BASE_URL)
+        self.headers = {'X-API-Key': self.api_key} if self.api_key else {}
+        self.max_connections = max_connections
+        self.rate_limiter = _default_rate_limiter(rate_limiter)
+        self.cache = _default_cache(cache)
+        self.validators = _default_validators(conditional)
+        self.single_flight = SingleFlight() if coalesce else None
+        self.retry = _default_retry(retry)
+        self.metrics = _default_metrics(metrics)
+        self.decoder = get_decoder(decoder)
+        self.response_format = _check_format(response_format)
+        self._pool = {"session": None}  # Shared with as_format() views
+
+    @property
+    def session(self):
+        """The pooled aiohttp session (None until the first request)"""
+        return self._pool["session"]
+
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _ensure_session(self):
+        """Create the pooled session lazily (must happen inside a running loop)"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            self._pool["session"] = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self.session
+
+    async def close(self):
+        """Close the pooled session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self._pool["session"] = None
+
+    def _map_addresses(self, fn, addresses, concurrency):
+        """Run fn over addresses with a bounded number of tasks"""
+        return iter_addresses_async(fn, addresses, concurrency)
+
+    async def _request(self, endpoint, auth_required=True, text=False, parse=None, payload=None,
+                       model=None, columns=None, response_format=None):
+        """Fetch an endpoint and return the decoded body"""
+        session = await self._ensure_session()
+        decode = (text, parse, model, columns, response_format or self.response_format)
+
+        if payload is not None:
+            async with session.post(endpoint, json=payload) as response:
+                response.raise_for_status()
+                return self._decode(await response.read(), *decode)
+
+        key = (endpoint, *decode)
+        if self.cache:
+            hit, data = self.cache.get(key)
+            if hit:
+                if self.metrics:
+                    self.metrics.cache_hit(endpoint)
+                return data
+
+        if self.single_flight:
+            return await self.single_flight.do_async(
+                key, lambda: self._fetch(session, key, endpoint, auth_required, decode))
+        return await self._fetch(session, key, endpoint, auth_required, decode)
+
+    async def _get(self, session, endpoint, auth_required=True, extra_headers=None):
+        """GET an endpoint (with retries) -> (status, headers, body)"""
+        url = f"{self.base_url}{endpoint}"
+        headers = self.headers if auth_required else {}
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+
+        attempts = [0]
+
+        async def send(started):
+            attempts[0] += 1
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+            if self.retry:
+                connect, read = self.retry.timeouts(started)
+                timeout = aiohttp.ClientTimeout(total=connect + read, sock_connect=connect, sock_read=read)
+            else:
+                timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            async with session.get(url, headers=headers, timeout=timeout) as response:
+                return response.status, response.headers, (response, await response.read())
+
+        started = time.perf_counter()
+        try:
+            if self.retry:
+                status, headers, (response, body) = await self.retry.call_async(send, ASYNC_NETWORK_ERRORS)
+            else:
+                status, headers, (response, body) = await send(None)
+        except Exception as e:
+            if self.metrics:
+                self.metrics.observe_request(endpoint, type(e).__name__, time.perf_counter() - started,
+                                             retries=attempts[0] - 1)
+            raise
+
+        if self.metrics:
+            self.metrics.observe_request(endpoint, status, time.perf_counter() - started, len(body), attempts[0] - 1)
+        response.raise_for_status()
+        return status, headers, body
+
+    async def _fetch(self, session, key, endpoint, auth_required, decode):
+        """GET an endpoint over the network, decode it and update the caches"""
+        conditional_headers, validated = None, None
+        if self.validators:
+            conditional_headers, validated = self.validators.request_headers(key)
+
+        status, headers, body = await self._get(session, endpoint, auth_required, conditional_headers)
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        if status == 304 and validated is not None:
+            data = self.validators.revalidated(validated)
+            body_size = validated[2]
+            if self.metrics:
+                self.metrics.cache_hit(endpoint, "not_modified")
+        else:
+            data = self._timed_decode(endpoint, body, decode)
+            body_size = len(body)
+            if self.validators:
+                self.validators.remember(key, etag, last_modified, data, body_size)
+
+        if self.cache:
+            self.cache.put(key, data, body_size, self.cache.ttl_for(endpoint))
+        return data
 
 
 # ==================== TEST SUITE ====================
@@ -0,0 +1,343 @@
+"""
+🌙 Moon Dev's Client Benchmark
+Throughput, latency, CPU and memory of MoonDevAPI against the local mock server
+
+Built with love by Moon Dev 🚀
+
+Every scenario runs in its own child process against a mock Data Layer
+server (data_layer.mock_server, also in a child process). Peak RSS and CPU
+per request therefore belong to that scenario alone.
+
+Scenarios:
+    sync_sequential       one thread, one request at a time
+    sync_threads          8 threads sharing one client
+    async_gather          AsyncMoonDevAPI, 8 requests in flight
+    bulk_accounts         get_accounts() over many wallets (8 in flight)
+    decoder_<name>        get_all_positions() (~1.7 MB) with each installed decoder
+    cache_hit             repeat calls served by ResponseCache
+    conditional_304       repeat calls revalidated with ETag -> 304
+    example_02_positions  examples/02_positions.py panels + table (post-processing only)
+    example_11_user_fills examples/11_user_fills.py stats + panels for a large wallet
+    example_14_multi_liq  examples/14_multi_liquidations.py dashboard sections
+
+Usage:
+    python benchmarks/bench_client.py                             # all scenarios, table output
+    python benchmarks/bench_client.py --output results/HEAD.json  # save JSON
+    python benchmarks/bench_client.py --compare results/main.json # diff against a saved run
+    python benchmarks/bench_client.py --scenarios sync_sequential,cache_hit --requests 2000
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+import subprocess
+import importlib.util
+
+from harness import ROOT, Recorder, compare, environment, load_results, mock_server
+
+from api import AsyncMoonDevAPI, MoonDevAPI
+from data_layer.cache import ResponseCache
+from data_layer.decoders import available_decoders
+
+# ============================================
+# 🎯 BENCHMARK CONFIGURATION - Moon Dev
+# ============================================
+DEFAULT_REQUESTS = 500
+CONCURRENCY = 8
+API_KEY = "benchmark"
+
+# Rate limiting would cap every scenario at 60 req/s and coalescing would
+# merge identical concurrent calls, so both are off unless a scenario is about them
+CLIENT_OPTIONS = {"api_key": API_KEY, "rate_limiter": False, "coalesce": False}
+
+
+def _client(base_url, **options):
+    return MoonDevAPI(base_url=base_url, **{**CLIENT_OPTIONS, **options})
+
+
+def _addresses(n):
+    return ["0x%040x" % (0xA11CE + i) for i in range(n)]
+
+
+# ==================== CLIENT SCENARIOS ====================
+def sync_sequential(base_url, n):
+    api = _client(base_url)
+    api.get_positions()  # Warm the connection
+    with Recorder() as recorder:
+        for _ in range(n):
+            with recorder.op():
+                api.get_positions()
+    return recorder.result(endpoint="/api/positions.json")
+
+
+def sync_threads(base_url, n):
+    api = _client(base_url)  # requests' default pool (10 connections) covers 8 threads
+    api.get_positions()
+
+    def worker(count):
+        for _ in range(count):
+            with recorder.op():
+                api.get_positions()
+
+    with Recorder() as recorder:
+        threads = [threading.Thread(target=worker, args=(n // CONCURRENCY,)) for _ in range(CONCURRENCY)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return recorder.result(endpoint="/api/positions.json", concurrency=CONCURRENCY)
+
+
+def async_gather(base_url, n):
+    async def run():
+        async with AsyncMoonDevAPI(base_url=base_url, max_connections=CONCURRENCY, **CLIENT_OPTIONS) as api:
+            await api.get_positions()
+            semaphore = asyncio.Semaphore(CONCURRENCY)
+
+            async def one():
+                async with semaphore:
+                    start = time.perf_counter()
+                    await api.get_positions()
+                    recorder.add(time.perf_counter() - start)
+
+            with recorder:
+                await asyncio.gather(*(one() for _ in range(n)))
+
+    recorder = Recorder()
+    asyncio.run(run())
+    return recorder.result(endpoint="/api/positions.json", concurrency=CONCURRENCY)
+
+
+def bulk_accounts(base_url, n):
+    api = _client(base_url)
+    api.get_account(_addresses(1)[0])
+    with Recorder() as recorder:
+        last = time.perf_counter()
+        for result in api.get_accounts(_addresses(n), concurrency=CONCURRENCY):
+            assert result.ok, result.error
+            now = time.perf_counter()
+            recorder.add(now - last)
+            last = now
+    return recorder.result(endpoint="/api/account/{address}", concurrency=CONCURRENCY,
+                           note="latency = time between completions")
+
+
+def _decoder_scenario(name):
+    def scenario(base_url, n):
+        api = _client(base_url, decoder=name)
+        body_size = len(api.as_format("raw").get_all_positions())
+        with Recorder() as recorder:
+            for _ in range(max(10, n // 25)):
+                with recorder.op():
+                    api.get_all_positions()
+        return recorder.result(endpoint="/api/positions/all.json", bytes=body_size)
+    return scenario
+
+
+def cache_hit(base_url, n):
+    api = _client(base_url, cache=ResponseCache(ttls=[], default_ttl=3600))
+    api.get_positions()
+    with Recorder() as recorder:
+        for _ in range(n * 10):
+            with recorder.op():
+                api.get_positions()
+    return recorder.result(endpoint="/api/positions.json")
+
+
+def conditional_304(base_url, n):
+    api = _client(base_url, conditional=True)
+    api.get_positions()
+    with Recorder() as recorder:
+        for _ in range(n):
+            with recorder.op():
+                api.get_positions()
+    return recorder.result(endpoint="/api/positions.json")
+
+
+# ==================== EXAMPLE PIPELINES ====================
+class _Prefetched:
+    """Client stand-in that downloads each call once, so pipelines time post-processing only"""
+
+    def __init__(self, api):
+        self._api = api
+        self._results = {}
+        self.api_key = api.api_key
+
+    def __getattr__(self, name):
+        method = getattr(self._api, name)
+
+        def call(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            if key not in self._results:
+                self._results[key] = method(*args, **kwargs)
+            return self._results[key]
+        return call
+
+
+def _load_example(filename):
+    """Import an example script with its rich console writing to a buffer"""
+    from rich.console import Console
+
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(ROOT, "examples", filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.console = Console(file=io.StringIO(), width=140, force_terminal=True)
+    return module
+
+
+def _pipeline(n, render):
+    render()  # Warm up (and download everything once)
+    with Recorder() as recorder:
+        for _ in range(max(10, n // 10)):
+            with recorder.op():
+                render()
+    return recorder
+
+
+def example_02_positions(base_url, n):
+    from rich.columns import Columns
+
+    example = _load_example("02_positions.py")
+    api = _Prefetched(_client(base_url))
+
+    def render():
+        positions = api.get_positions()
+        console = example.console
+        console.file.seek(0)
+        console.file.truncate()
+        console.print(Columns([example.create_stats_panel(positions), example.create_coin_distribution(positions)]))
+        console.print(Columns([example.create_risk_analysis(positions), example.create_top_whales_panel(positions)]))
+        console.print(example.create_positions_table(positions))
+        example.display_symbols_list(api)  # Walks all 148 symbols of positions/all.json
+
+    return _pipeline(n, render).result(note="post-processing + rendering, data prefetched")
+
+
+def example_11_user_fills(base_url, n):
+    example = _load_example("11_user_fills.py")
+    api = _Prefetched(_client(base_url))
+    # Largest wallet among a few candidates (the mock sizes wallets per address)
+    address = max(_addresses(16), key=lambda a: api.get_user_fills(a, limit=-1)["total"])
+
+    def render():
+        fills = api.get_user_fills(address, limit=-1)["fills"]
+        example.console.file.seek(0)
+        example.console.file.truncate()
+        stats = example.calculate_fill_stats(fills)
+        example.display_summary_panels(stats, address, len(fills))
+        example.display_coin_breakdown(stats)
+        example.display_direction_breakdown(stats)
+        example.display_win_streak_analysis(stats)
+        example.display_recent_fills(fills, limit=30)
+
+    recorder = _pipeline(n, render)
+    return recorder.result(fills=api.get_user_fills(address, limit=-1)["total"],
+                           note="post-processing + rendering, data prefetched")
+
+
+def example_14_multi_liq(base_url, n):
+    example = _load_example("14_multi_liquidations.py")
+    api = _Prefetched(_client(base_url))
+
+    def render():
+        example.console.file.seek(0)
+        example.console.file.truncate()
+        example.display_exchange_status(api)
+        example.display_combined_stats(api)
+        example.display_exchange_breakdown(api)
+        example.display_timeframe_comparison(api)
+        example.display_top_liquidations(api)
+        example.display_coin_breakdown(api)
+
+    return _pipeline(n, render).result(note="post-processing + rendering, data prefetched")
+
+
+SCENARIOS = {
+    "sync_sequential": sync_sequential,
+    "sync_threads": sync_threads,
+    "async_gather": async_gather,
+    "bulk_accounts": bulk_accounts,
+    **{f"decoder_{name}": _decoder_scenario(name) for name in available_decoders()},
+    "cache_hit": cache_hit,
+    "conditional_304": conditional_304,
+    "example_02_positions": example_02_positions,
+    "example_11_user_fills": example_11_user_fills,
+    "example_14_multi_liq": example_14_multi_liq,
+}
+
+
+def run_isolated(name, base_url, n):
+    """Run one scenario in a fresh interpreter so CPU and peak RSS are its own"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--run-one", name, "--base-url", base_url, "--requests", str(n)],
+        capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "failed"}
+    return json.loads(completed.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev client benchmark")
+    parser.add_argument("--scenarios", help=f"Comma-separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="Requests per client scenario")
+    parser.add_argument("--scale", type=float, default=1.0, help="Mock payload size multiplier")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock server latency per response (seconds)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Baseline JSON results to compare against")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON results")
+    parser.add_argument("--run-one", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(SCENARIOS[args.run_one](args.base_url, args.requests)))
+        return
+
+    names = args.scenarios.split(",") if args.scenarios else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    report = {
+        "meta": {**environment(), "requests": args.requests, "scale": args.scale, "latency": args.latency,
+                 "concurrency": CONCURRENCY},
+        "results": {},
+    }
+    with mock_server(scale=args.scale, latency=args.latency) as base_url:
+        for name in names:
+            if not args.json:
+                print(f"⏱️  {name}...", file=sys.stderr)
+            report["results"][name] = run_isolated(name, base_url, args.requests)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("=" * 86)
+        print(f"🌙 Moon Dev Client Benchmark 🚀  commit {report['meta']['commit']}  "
+              f"scale {args.scale}  latency {args.latency}s")
+        print("=" * 86)
+        print(f"{'scenario':<24} {'ops':>6} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'cpu ms/op':>10} {'rss MB':>8}")
+        for name, row in report["results"].items():
+            if "error" in row:
+                print(f"{name:<24} ❌ {row['error']}")
+                continue
+            print(f"{name:<24} {row['ops']:>6} {row['req_per_s']:>10} {row['p50_ms']:>9} {row['p99_ms']:>9} "
+                  f"{row['cpu_ms_per_op']:>10} {row['peak_rss_mb']!s:>8}")
+
+    if args.compare:
+        compare(load_results(args.compare), report)
+
+
+if __name__ == "__main__":
+    main()
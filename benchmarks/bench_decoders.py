@@ -0,0 +1,144 @@
+"""
+🌙 Moon Dev's JSON Decoder Benchmark
+Compare every installed JSON decoder on real (recorded) API payloads
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    python benchmarks/bench_decoders.py --record payloads/   # save live payloads (needs API key)
+    python benchmarks/bench_decoders.py --payloads payloads/ # benchmark recorded payloads
+    python benchmarks/bench_decoders.py                      # benchmark synthetic payloads
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+# Add parent directory to path for api.py import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_layer.decoders import LazyJSON, available_decoders
+
+# Heavy payloads worth recording: (file name, MoonDevAPI method, args)
+RECORD_CALLS = [
+    ("positions_all", "get_all_positions", ()),
+    ("ticks_btc_24h", "get_ticks", ("BTC", "24h")),
+    ("user_fills_all", "get_user_fills", ("0x010461c14e146ac35fe42271bdc1134ee31c703a", -1)),
+    ("hlp_trades", "get_hlp_trades", (2000,)),
+    ("candles_btc_1m", "get_candles", ("BTC", "1m")),
+]
+
+
+def record_payloads(directory):
+    """Fetch raw payloads from the live API and save them to directory"""
+    from api import MoonDevAPI
+
+    os.makedirs(directory, exist_ok=True)
+    api = MoonDevAPI().as_format("raw")
+    for name, method, args in RECORD_CALLS:
+        body = getattr(api, method)(*args)
+        with open(os.path.join(directory, f"{name}.json"), "wb") as f:
+            f.write(body)
+        print(f"💾 {name}: {len(body):,} bytes")
+
+
+def load_payloads(directory):
+    """Load every recorded .json payload from directory"""
+    payloads = {}
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(".json"):
+            with open(os.path.join(directory, filename), "rb") as f:
+                payloads[filename[:-5]] = f.read()
+    return payloads
+
+
+def synthetic_payloads(seed=42):
+    """Payloads shaped like the heaviest endpoints when nothing is recorded"""
+    rng = random.Random(seed)
+
+    def position(coin):
+        return {
+            "address": f"0x{rng.getrandbits(160):040x}", "coin": coin,
+            "size": rng.uniform(-500, 500), "entry_price": rng.uniform(1, 100000),
+            "position_value": rng.uniform(2e5, 5e7), "liquidation_price": rng.uniform(1, 100000),
+            "distance_pct": rng.uniform(0, 15), "leverage": rng.randint(1, 50),
+        }
+
+    symbols = [f"SYM{i}" for i in range(148)]
+    positions_all = {"symbols": {s: {"longs": [position(s) for _ in range(25)],
+                                     "shorts": [position(s) for _ in range(25)]} for s in symbols}}
+
+    now = 1768392000000
+    ticks = {"symbol": "BTC", "duration": "24h",
+             "ticks": [{"t": now + i * 1000, "p": round(95000 + rng.gauss(0, 200), 1)} for i in range(10000)]}
+
+    fills = {"fills": [{"coin": "BTC", "px": f"{rng.uniform(90000, 100000):.1f}", "sz": f"{rng.uniform(0, 2):.5f}",
+                        "side": rng.choice("BA"), "time": now + i, "dir": "Open Long",
+                        "closedPnl": f"{rng.uniform(-500, 500):.2f}", "fee": f"{rng.uniform(0, 5):.4f}",
+                        "tid": 293951512222 + i, "hash": f"0x{rng.getrandbits(256):064x}"} for i in range(32000)]}
+
+    return {name: json.dumps(data).encode() for name, data in
+            [("positions_all", positions_all), ("ticks_10k", ticks), ("user_fills_32k", fills)]}
+
+
+def bench(fn, repeat):
+    """Best-of-repeat wall time for fn() in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(payloads, repeat=5):
+    """Benchmark every decoder on every payload, returns JSON-friendly results"""
+    decoders = available_decoders()
+    results = []
+    for name, body in payloads.items():
+        first_key = next(iter(json.loads(body)), None) if body.lstrip()[:1] == b"{" else None
+        row = {"payload": name, "bytes": len(body), "decoders_ms": {}}
+        for decoder_name, loads in decoders.items():
+            row["decoders_ms"][decoder_name] = round(bench(lambda: loads(body), repeat), 3)
+        if first_key is not None:
+            row["lazy_pick_ms"] = round(bench(lambda: LazyJSON(body, decoders["json"]).pick(first_key), repeat), 3)
+        results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev JSON decoder benchmark")
+    parser.add_argument("--payloads", help="Directory of recorded .json payloads")
+    parser.add_argument("--record", help="Record live payloads into this directory and exit")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON results")
+    args = parser.parse_args()
+
+    if args.record:
+        record_payloads(args.record)
+        return
+
+    payloads = load_payloads(args.payloads) if args.payloads else synthetic_payloads()
+    results = run(payloads, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("=" * 60)
+    print("🌙 Moon Dev JSON Decoder Benchmark 🚀")
+    print("=" * 60)
+    for row in results:
+        print(f"\n📦 {row['payload']} ({row['bytes']:,} bytes)")
+        baseline = row["decoders_ms"]["json"]
+        for decoder_name, ms in sorted(row["decoders_ms"].items(), key=lambda item: item[1]):
+            print(f"   {decoder_name:<8} {ms:>9.2f} ms  ({baseline / ms:.1f}x vs json)")
+        if "lazy_pick_ms" in row:
+            print(f"   lazy pick {row['lazy_pick_ms']:>7.2f} ms  (one top-level key)")
+
+
+if __name__ == "__main__":
+    main()
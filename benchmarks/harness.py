@@ -0,0 +1,171 @@
+"""
+🌙 Moon Dev's Benchmark Harness
+Shared measurement helpers for the benchmarks/ scripts
+
+Built with love by Moon Dev 🚀
+
+- mock_server(): runs data_layer.mock_server in a child process, so the
+  server's CPU and memory never show up in the client's numbers
+- Recorder: wall time per operation, plus CPU time and peak RSS for the
+  whole run
+- environment(): commit, Python and decoder versions, so JSON results from
+  different commits can be compared
+"""
+
+import os
+import sys
+import time
+import json
+import socket
+import platform
+import subprocess
+import contextlib
+import urllib.request
+
+try:
+    import resource
+except ImportError:  # Windows - peak RSS is reported as None
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def mock_server(scale=1.0, latency=0.0, startup_timeout=15):
+    """Start `python -m data_layer.mock_server` on a free port and yield its base URL"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "data_layer.mock_server", "--port", str(port),
+         "--scale", str(scale), "--latency", str(latency)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                urllib.request.urlopen(f"{base_url}/health", timeout=1).read()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("mock server failed to start")
+                time.sleep(0.05)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)  # bytes on macOS, KB elsewhere
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class Recorder:
+    """
+    Collects per-operation latencies for one scenario.
+
+    Usage:
+        recorder = Recorder()
+        with recorder:
+            for _ in range(n):
+                with recorder.op():
+                    do_work()
+        recorder.result()   # {"ops", "req_per_s", "p50_ms", "p99_ms", "cpu_ms_per_op", "peak_rss_mb", ...}
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self.wall = self.cpu = 0.0
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.wall = time.perf_counter() - self._wall
+        self.cpu = time.process_time() - self._cpu
+
+    @contextlib.contextmanager
+    def op(self):
+        start = time.perf_counter()
+        yield
+        self.latencies.append(time.perf_counter() - start)
+
+    def add(self, seconds):
+        """Record an operation timed elsewhere (e.g. inside a coroutine or worker)"""
+        self.latencies.append(seconds)
+
+    def result(self, **extra):
+        ops = len(self.latencies)
+        latencies = sorted(self.latencies)
+        return {
+            "ops": ops,
+            "seconds": round(self.wall, 4),
+            "req_per_s": round(ops / self.wall, 1) if self.wall else None,
+            "p50_ms": round(_percentile(latencies, 0.5) * 1000, 3) if ops else None,
+            "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3) if ops else None,
+            "cpu_ms_per_op": round(self.cpu / ops * 1000, 3) if ops else None,
+            "peak_rss_mb": peak_rss_mb(),
+            **extra,
+        }
+
+
+def environment():
+    """Metadata that makes results comparable across commits and machines"""
+    from data_layer.decoders import available_decoders
+
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True,
+                                  timeout=10).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    return {
+        "commit": git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "decoders": sorted(available_decoders()),
+        "timestamp": int(time.time()),
+    }
+
+
+def compare(baseline, current):
+    """Print current vs baseline results side by side (higher req/s, lower ms is better)"""
+    print(f"\n📊 vs {baseline['meta'].get('commit')} (baseline) -> {current['meta'].get('commit')}")
+    print(f"   {'scenario':<24} {'req/s':>18} {'p50 ms':>18} {'p99 ms':>18} {'cpu ms/op':>18}")
+    for name, row in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            continue
+        cells = []
+        for key in ("req_per_s", "p50_ms", "p99_ms", "cpu_ms_per_op"):
+            old, new = base.get(key), row.get(key)
+            change = f"{(new - old) / old * 100:+.0f}%" if old and new is not None else "n/a"
+            cells.append(f"{new!s:>10} {change:>7}")
+        print(f"   {name:<24} " + " ".join(cells))
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
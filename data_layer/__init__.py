@@ -0,0 +1,28 @@
+"""
+🌙 Moon Dev's Data Layer Toolkit
+Client-side helpers that power MoonDevAPI (rate limiting, caching, ...)
+Built with love by Moon Dev
+"""
+from .analytics import batch_fill_stats, fill_stats
+from .cache import ResponseCache, ValidatorCache
+from .candle_store import CandleStore
+from .columnar import ColumnSpec
+from .feed import Feed, Poller, Update
+from .fill_store import FillStore, fill_columns
+from .metrics import JsonlSink, Metrics
+from .models import BookLevel, Candle, Fill, OrderBook, Position, Tick
+from .position_diff import PositionDiff, PositionEvent
+from .rate_limit import RateLimiter
+from .recording import FixtureStore, record_responses
+from .retry import RetryPolicy
+from .single_flight import SingleFlight
+from .tick_archive import TickArchive, TickSyncError
+
+__all__ = [
+    "RateLimiter", "ResponseCache", "ValidatorCache", "SingleFlight",
+    "BookLevel", "Candle", "Fill", "OrderBook", "Position", "Tick", "ColumnSpec",
+    "CandleStore", "TickArchive", "TickSyncError", "FillStore",
+    "fill_columns", "fill_stats", "batch_fill_stats", "RetryPolicy",
+    "Metrics", "JsonlSink", "FixtureStore", "record_responses",
+    "Poller", "Feed", "Update", "PositionDiff", "PositionEvent",
+]
@@ -0,0 +1,195 @@
+"""
+🌙 Moon Dev's Wallet Analytics
+Vectorized fill statistics - one wallet or hundreds in a single NumPy pass
+
+Built with love by Moon Dev 🚀
+
+Works on the fill columns produced by fill_columns() / FillStore.history():
+group-bys are bincounts over integer codes and win/loss streaks are
+run-length encoded, so no Python loop ever walks the fills.
+
+Usage:
+    from data_layer import fill_columns, fill_stats, batch_fill_stats
+
+    stats = fill_stats(fill_columns(api.get_user_fills(address, limit=-1)["fills"]))
+    print(stats["total_pnl"], stats["max_win_streak"], stats["max_drawdown"])
+
+    # Many wallets at once
+    all_stats = batch_fill_stats({addr: store.history(addr) for addr in whales})
+"""
+
+import numpy as np
+
+
+def _empty_stats():
+    """Stats for a wallet with no fills (same keys as a full result)"""
+    return {
+        'total_fills': 0, 'total_volume': 0.0, 'total_pnl': 0.0, 'total_fees': 0.0,
+        'winning_trades': 0, 'losing_trades': 0,
+        'buys': 0, 'sells': 0, 'buy_volume': 0.0, 'sell_volume': 0.0,
+        'coins': {}, 'directions': {},
+        'largest_win': 0.0, 'largest_loss': 0.0,
+        'first_fill': None, 'last_fill': None,
+        'max_drawdown': 0.0,
+        'max_win_streak': 0, 'max_loss_streak': 0, 'current_streak': 0, 'current_type': None,
+    }
+
+
+def _factorize(values, codes):
+    """Map strings to integer codes shared across wallets (codes dict grows in place)"""
+    return np.array([codes.setdefault(v, len(codes)) for v in np.asarray(values).tolist()], dtype=np.int64)
+
+
+def _group_sum(codes, n_groups, weights=None):
+    return np.bincount(codes, weights=weights, minlength=n_groups)
+
+
+def _streaks(wallet, pnl, n_wallets):
+    """Run-length encode win/loss runs of non-zero PnL fills per wallet"""
+    max_win = np.zeros(n_wallets, dtype=np.int64)
+    max_loss = np.zeros(n_wallets, dtype=np.int64)
+    current = np.zeros(n_wallets, dtype=np.int64)
+    current_sign = np.zeros(n_wallets, dtype=np.int64)
+
+    closed = pnl != 0
+    wallet, sign = wallet[closed], np.sign(pnl[closed]).astype(np.int64)
+    if not len(sign):
+        return max_win, max_loss, current, current_sign
+
+    # A new run starts where the sign or the wallet changes
+    starts = np.flatnonzero(np.r_[True, (sign[1:] != sign[:-1]) | (wallet[1:] != wallet[:-1])])
+    lengths = np.diff(np.r_[starts, len(sign)])
+    run_wallet, run_sign = wallet[starts], sign[starts]
+
+    wins = run_sign > 0
+    np.maximum.at(max_win, run_wallet[wins], lengths[wins])
+    np.maximum.at(max_loss, run_wallet[~wins], lengths[~wins])
+
+    # Last run per wallet is the current streak
+    last = np.flatnonzero(np.r_[run_wallet[1:] != run_wallet[:-1], True])
+    current[run_wallet[last]] = lengths[last]
+    current_sign[run_wallet[last]] = run_sign[last]
+    return max_win, max_loss, current, current_sign
+
+
+def _drawdowns(starts, net):
+    """Max drawdown of cumulative net PnL per wallet (fills grouped by wallet, time ordered)"""
+    group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(net)]))
+    cum = np.cumsum(net)
+    cum -= np.r_[0.0, cum][starts][group]  # Restart the running total at every wallet
+
+    # Shift each wallet above the previous one so one running max never crosses wallets
+    span = cum.max() - cum.min() + 1.0
+    peak = np.maximum.accumulate(cum + group * span) - group * span
+    drawdown = np.maximum(peak, 0.0) - cum  # Equity starts at 0
+    return np.maximum.reduceat(drawdown, starts)
+
+
+def batch_fill_stats(wallets):
+    """
+    Fill statistics for many wallets in one vectorized pass.
+
+    Args:
+        wallets: dict of address -> fill columns (fill_columns() / FillStore.history())
+
+    Returns:
+        dict of address -> stats dict with:
+            total_fills, total_volume, total_pnl, total_fees,
+            winning_trades, losing_trades, buys, sells, buy_volume, sell_volume,
+            coins {coin: {count, volume, pnl}}, directions {dir: count},
+            largest_win, largest_loss, first_fill, last_fill,
+            max_drawdown (cumulative PnL net of fees),
+            max_win_streak, max_loss_streak, current_streak, current_type ('win'/'loss')
+    """
+    addresses = list(wallets)
+    results = {address: _empty_stats() for address in addresses}
+    active = [i for i, address in enumerate(addresses) if len(wallets[address]['time'])]
+    if not active:
+        return results
+
+    # One flat table of numbers, ordered by wallet then time. Strings become
+    # integer codes up front (dict lookups beat sorting fixed-width unicode)
+    coin_codes, dir_codes = {}, {}
+    flat = {name: [] for name in ('time', 'px', 'sz', 'closed_pnl', 'fee', 'is_buy', 'coin', 'dir')}
+    for i in active:
+        part = wallets[addresses[i]]
+        order = np.argsort(part['time'], kind='stable')
+        for name in ('time', 'px', 'sz', 'closed_pnl', 'fee'):
+            flat[name].append(np.asarray(part[name])[order])
+        flat['is_buy'].append((np.asarray(part['side']) == 'B')[order])
+        flat['coin'].append(_factorize(part['coin'], coin_codes)[order])
+        flat['dir'].append(_factorize(part['dir'], dir_codes)[order])
+
+    sizes = [len(times) for times in flat['time']]
+    wallet = np.repeat(np.arange(len(active)), sizes)
+    columns = {name: np.concatenate(values) for name, values in flat.items()}
+
+    n = len(active)
+    volume = columns['px'] * columns['sz']
+    pnl, fee = columns['closed_pnl'], columns['fee']
+    is_buy = columns['is_buy']
+    starts = np.flatnonzero(np.r_[True, wallet[1:] != wallet[:-1]])
+
+    counts = _group_sum(wallet, n)
+    total_volume = _group_sum(wallet, n, volume)
+    total_pnl = _group_sum(wallet, n, pnl)
+    total_fees = _group_sum(wallet, n, fee)
+    wins = _group_sum(wallet[pnl > 0], n)
+    losses = _group_sum(wallet[pnl < 0], n)
+    buys = _group_sum(wallet[is_buy], n)
+    buy_volume = _group_sum(wallet, n, np.where(is_buy, volume, 0.0))
+    largest_win = np.maximum(np.maximum.reduceat(pnl, starts), 0.0)
+    largest_loss = np.minimum(np.minimum.reduceat(pnl, starts), 0.0)
+    max_drawdown = _drawdowns(starts, pnl - fee)
+    max_win, max_loss, current, current_sign = _streaks(wallet, pnl, n)
+
+    # Per-coin / per-direction group-bys on (wallet, code) pairs
+    coins, directions = list(coin_codes), list(dir_codes)
+    coin_keys = wallet * len(coins) + columns['coin']
+    coin_count = _group_sum(coin_keys, n * len(coins)).reshape(n, -1)
+    coin_volume = _group_sum(coin_keys, n * len(coins), volume).reshape(n, -1)
+    coin_pnl = _group_sum(coin_keys, n * len(coins), pnl).reshape(n, -1)
+    dir_count = _group_sum(wallet * len(directions) + columns['dir'], n * len(directions)).reshape(n, -1)
+
+    times = columns['time']
+    ends = np.r_[starts[1:], len(times)] - 1
+
+    for g, i in enumerate(active):
+        results[addresses[i]] = {
+            'total_fills': int(counts[g]),
+            'total_volume': float(total_volume[g]),
+            'total_pnl': float(total_pnl[g]),
+            'total_fees': float(total_fees[g]),
+            'winning_trades': int(wins[g]),
+            'losing_trades': int(losses[g]),
+            'buys': int(buys[g]),
+            'sells': int(counts[g] - buys[g]),
+            'buy_volume': float(buy_volume[g]),
+            'sell_volume': float(total_volume[g] - buy_volume[g]),
+            'coins': {
+                coins[c]: {'count': int(coin_count[g, c]), 'volume': float(coin_volume[g, c]),
+                           'pnl': float(coin_pnl[g, c])}
+                for c in np.flatnonzero(coin_count[g])
+            },
+            'directions': {directions[d]: int(dir_count[g, d]) for d in np.flatnonzero(dir_count[g])},
+            'largest_win': float(largest_win[g]),
+            'largest_loss': float(largest_loss[g]),
+            'first_fill': int(times[starts[g]]),
+            'last_fill': int(times[ends[g]]),
+            'max_drawdown': float(max_drawdown[g]),
+            'max_win_streak': int(max_win[g]),
+            'max_loss_streak': int(max_loss[g]),
+            'current_streak': int(current[g]),
+            'current_type': {1: 'win', -1: 'loss'}.get(int(current_sign[g])),
+        }
+    return results
+
+
+def fill_stats(columns):
+    """
+    Fill statistics for one wallet (see batch_fill_stats for the keys).
+
+    Args:
+        columns: Fill columns from fill_columns() or FillStore.history()
+    """
+    return batch_fill_stats({None: columns})[None]
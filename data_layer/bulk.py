@@ -0,0 +1,101 @@
+"""
+🌙 Moon Dev's Bulk Fetch Helpers
+Run one per-address call over many wallets with a concurrency cap
+
+Built with love by Moon Dev 🚀
+
+Results stream back as they complete. A failing address doesn't stop the
+batch - it comes back with its error attached. Every request still goes
+through the client, so the rate limiter and caches apply as usual.
+
+Usage:
+    for result in api.get_accounts(addresses, concurrency=8):
+        if result.ok:
+            print(result.address, result.data["account_value"])
+        else:
+            print(result.address, "failed:", result.error)
+"""
+
+import asyncio
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# ============================================
+# 🎯 BULK CONFIGURATION - Moon Dev
+# ============================================
+DEFAULT_CONCURRENCY = 8  # Stays inside requests' default pool of 10 connections
+
+
+class AddressResult(namedtuple("AddressResult", ["address", "data", "error"])):
+    """One address from a bulk call: data on success, the exception on failure"""
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def iter_addresses(fn, addresses, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Call fn(address) for every address on a thread pool, yielding AddressResults
+    in completion order. At most `concurrency` calls are in flight; closing the
+    generator early cancels the calls that haven't started.
+    """
+    addresses = iter(addresses)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="moondev-bulk")
+    pending = {}
+
+    def submit_next():
+        for address in addresses:
+            pending[executor.submit(fn, address)] = address
+            return
+
+    try:
+        for _ in range(concurrency):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                address = pending.pop(future)
+                error = future.exception()
+                yield AddressResult(address, None if error else future.result(), error)
+                submit_next()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def iter_addresses_async(fn, addresses, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Async version of iter_addresses: `concurrency` worker tasks await
+    fn(address) and results are yielded in completion order.
+    """
+    addresses = iter(addresses)
+    results = asyncio.Queue()
+
+    async def worker():
+        for address in addresses:
+            try:
+                result = AddressResult(address, await fn(address), None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                result = AddressResult(address, None, e)
+            await results.put(result)
+        await results.put(None)  # This worker is done
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+            else:
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,186 @@
+"""
+🌙 Moon Dev's Response Cache
+In-memory TTL + LRU cache keyed to how often each endpoint actually updates
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+
+    api = MoonDevAPI(cache=True)
+    api.get_liquidation_stats()   # network
+    api.get_liquidation_stats()   # free - served from cache for 30s
+    print(api.cache.stats())
+"""
+
+import re
+import time
+import threading
+from collections import OrderedDict
+
+# ============================================
+# 🎯 CACHE CONFIGURATION - Moon Dev
+# ============================================
+
+DEFAULT_TTL = 30                    # Most data updates every 30 seconds
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64MB of response bodies
+
+# (pattern, ttl seconds) - first match wins, TTL 0 = never cache
+# Cadences come from the endpoint docs at the top of api.py
+ENDPOINT_TTLS = [
+    (re.compile(r"^/health"), 0),
+    (re.compile(r"^/api/positions/all\.json"), 60),       # updates every 60s
+    (re.compile(r"^/api/positions\.json"), 1),            # updates every 1s
+    (re.compile(r"^/api/(prices|price/|orderbook/|account/)"), 1),
+    (re.compile(r"^/api/ticks/latest\.json"), 1),
+    (re.compile(r"^/api/trades\.json"), 1),               # real-time
+    (re.compile(r"^/api/position_snapshots/"), 60),       # snapshots every 1 min
+    (re.compile(r"^/api/hlp/(delta|positions/history)"), 60),
+    (re.compile(r"^/api/(all_)?liquidations/(7d|14d|30d)\.json"), 900),  # archives
+]
+
+# ============================================
+
+
+def ttl_for(endpoint, ttls=ENDPOINT_TTLS, default=DEFAULT_TTL):
+    """Freshness window (seconds) for an endpoint path"""
+    for pattern, ttl in ttls:
+        if pattern.match(endpoint):
+            return ttl
+    return default
+
+
+class ResponseCache:
+    """
+    🌙 Moon Dev's Response Cache
+
+    Stores decoded responses for as long as the server's data stays fresh.
+    Entries expire by per-endpoint TTL and the least recently used ones get
+    evicted once the cached response bodies exceed max_bytes. Cached objects
+    are shared between callers, so treat them as read-only.
+
+    Args:
+        max_bytes: Upper bound on cached response body bytes (default: 64MB)
+        ttls: List of (compiled regex, ttl) overriding ENDPOINT_TTLS
+        default_ttl: TTL for endpoints without a matching pattern (default: 30)
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, ttls=None, default_ttl=DEFAULT_TTL):
+        self.max_bytes = max_bytes
+        self.ttls = ttls if ttls is not None else ENDPOINT_TTLS
+        self.default_ttl = default_ttl
+
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, endpoint):
+        """Freshness window (seconds) for an endpoint path"""
+        return ttl_for(endpoint, self.ttls, self.default_ttl)
+
+    def get(self, key):
+        """Return (True, value) for a fresh entry, (False, None) otherwise"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[2]
+                self._drop(key)
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value, size, ttl):
+        """Store a decoded value that cost `size` bytes on the wire"""
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, size, value)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key):
+        """Remove an entry (caller holds the lock)"""
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """Snapshot of cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+class ValidatorCache(ResponseCache):
+    """
+    🌙 Moon Dev's Conditional GET Store
+
+    Remembers the ETag / Last-Modified validators and the decoded body per
+    URL, so polling a big payload like /api/positions/all.json can send
+    If-None-Match / If-Modified-Since and reuse the decoded object on a 304
+    instead of re-downloading and re-parsing it. URLs whose responses carry
+    no validators are never stored, so servers without them cost nothing.
+
+    Args:
+        max_bytes: Upper bound on remembered response body bytes (default: 64MB)
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        super().__init__(max_bytes=max_bytes)
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+    def request_headers(self, key):
+        """Conditional headers for a URL plus the remembered entry (or None)"""
+        hit, entry = self.get(key)
+        if not hit:
+            return {}, None
+
+        etag, last_modified, _, _ = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers, entry
+
+    def remember(self, key, etag, last_modified, data, size):
+        """Store validators from a 200 response (no-op when there are none)"""
+        if etag or last_modified:
+            self.put(key, (etag, last_modified, size, data), size, float('inf'))
+
+    def revalidated(self, entry):
+        """Record a 304 and return the remembered decoded object"""
+        with self._lock:
+            self.not_modified += 1
+            self.bytes_saved += entry[2]
+        return entry[3]
+
+    def stats(self):
+        """Snapshot of conditional GET counters"""
+        stats = super().stats()
+        stats["not_modified"] = self.not_modified
+        stats["bytes_saved"] = self.bytes_saved
+        return stats
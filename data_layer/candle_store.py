@@ -0,0 +1,220 @@
+"""
+🌙 Moon Dev's Local Candle Store
+Persistent, gap-aware candle cache - closed candles are downloaded once
+
+Built with love by Moon Dev 🚀
+
+Closed candles never change, so there's no reason to download them twice.
+The store keeps one append-only binary file per coin x interval (read back
+through a NumPy memmap) plus the list of time ranges it already covers.
+get_candles() then only fetches the missing gaps and the still-open bar.
+
+Usage:
+    from api import MoonDevAPI
+
+    api = MoonDevAPI(candle_store="~/.moondev/candles")
+    candles = api.get_candles("BTC", "1h", start_time=start_ms, end_time=end_ms)  # first run: network
+    candles = api.get_candles("BTC", "1h", start_time=start_ms, end_time=end_ms)  # re-run: local
+"""
+
+import os
+import json
+import time
+import threading
+
+import numpy as np
+
+from .columnar import CANDLE_COLUMNS, to_frame
+from .models import Candle
+
+# Milliseconds per candle interval
+INTERVAL_MS = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "1h": 3_600_000,
+    "4h": 14_400_000,
+    "1d": 86_400_000,
+}
+
+# One fixed-size 64 byte record per candle
+CANDLE_DTYPE = np.dtype([
+    ("time", "<i8"), ("close_time", "<i8"),
+    ("open", "<f8"), ("high", "<f8"), ("low", "<f8"), ("close", "<f8"),
+    ("volume", "<f8"), ("trades", "<i8"),
+])
+
+COLUMNS = [name for name, _, _ in CANDLE_COLUMNS.columns]
+
+
+def _merge_ranges(ranges):
+    """Merge overlapping/adjacent [start, end) ranges"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def _missing_ranges(start, end, covered):
+    """Parts of [start, end) not inside any covered range"""
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class CandleStore:
+    """
+    🌙 Moon Dev's Local Candle Store
+
+    Files per coin x interval inside `root`:
+        BTC_1h.bin   - append-only CANDLE_DTYPE records (closed candles only)
+        BTC_1h.json  - covered [start, end) open-time ranges
+
+    One process should write to a store at a time; reads are memory-mapped.
+
+    Args:
+        root: Directory holding the store (created if missing)
+    """
+
+    def __init__(self, root):
+        self.root = os.path.expanduser(root)
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+        self.fetched_ranges = 0
+
+    def _paths(self, coin, interval):
+        base = os.path.join(self.root, f"{coin.upper()}_{interval}")
+        return base + ".bin", base + ".json"
+
+    # ==================== RANGES ====================
+    def covered(self, coin, interval):
+        """Covered [start, end) open-time ranges for coin x interval"""
+        _, meta_path = self._paths(coin, interval)
+        if not os.path.exists(meta_path):
+            return []
+        with open(meta_path) as f:
+            return json.load(f)["ranges"]
+
+    def _mark_covered(self, coin, interval, start, end):
+        _, meta_path = self._paths(coin, interval)
+        ranges = _merge_ranges(self.covered(coin, interval) + [[start, end]])
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"ranges": ranges}, f)
+        os.replace(tmp_path, meta_path)
+
+    # ==================== DATA ====================
+    def _append(self, coin, interval, arrays):
+        """Append closed candles (already filtered to uncovered times)"""
+        records = np.empty(len(arrays["time"]), dtype=CANDLE_DTYPE)
+        for name in COLUMNS:
+            records[name] = arrays[name]
+        data_path, _ = self._paths(coin, interval)
+        with open(data_path, "ab") as f:
+            f.write(records.tobytes())
+
+    def read(self, coin, interval, start_time, end_time):
+        """Stored candles with open time in [start_time, end_time], sorted, as arrays"""
+        data_path, _ = self._paths(coin, interval)
+        if not os.path.exists(data_path) or os.path.getsize(data_path) == 0:
+            return {name: np.empty(0, dtype=CANDLE_DTYPE[name]) for name in COLUMNS}
+
+        records = np.memmap(data_path, dtype=CANDLE_DTYPE, mode="r")
+        selected = records[(records["time"] >= start_time) & (records["time"] <= end_time)]
+        selected = selected[np.argsort(selected["time"], kind="stable")]
+        return {name: np.array(selected[name]) for name in COLUMNS}
+
+    # ==================== SYNC ====================
+    def get_candles(self, fetch, coin, interval, start_time, end_time=None, response_format="json"):
+        """
+        Candles for [start_time, end_time] - only gaps and the open bar hit the network.
+
+        Args:
+            fetch: fetch(start_ms, end_ms) -> candle arrays from the API
+            coin: Symbol (e.g. "BTC")
+            interval: 1m, 5m, 15m, 1h, 4h, 1d
+            start_time: Start open time in Unix ms
+            end_time: End open time in Unix ms (default: now)
+            response_format: "json", "typed", "arrays" or "frame"
+        """
+        if interval not in INTERVAL_MS:
+            raise ValueError(f"Unknown interval {interval!r} (use {', '.join(INTERVAL_MS)})")
+
+        step = INTERVAL_MS[interval]
+        now = int(time.time() * 1000)
+        end_time = now if end_time is None else end_time
+        open_bar = now - now % step  # Open time of the bar that's still forming
+
+        with self._lock:
+            closed_end = min(end_time + 1, open_bar)
+            for gap_start, gap_end in _missing_ranges(start_time, closed_end, self.covered(coin, interval)):
+                self._fill_gap(fetch, coin, interval, gap_start, gap_end)
+            arrays = self.read(coin, interval, start_time, end_time)
+
+        if end_time >= open_bar:
+            live = fetch(open_bar, end_time)
+            keep = (live["time"] >= open_bar) & (live["time"] <= end_time)
+            arrays = {name: np.concatenate([arrays[name], live[name][keep]]) for name in COLUMNS}
+
+        return _format(arrays, coin, interval, response_format)
+
+    def _fill_gap(self, fetch, coin, interval, gap_start, gap_end):
+        """Fetch [gap_start, gap_end) and store the closed candles
+
+        The API caps how many bars one call returns (the latest ones of the
+        range), so a page may start well after what was asked for. The span a
+        page returned is marked covered, and whatever is left on either side
+        of it is fetched next. Gaps only hold closed bars, so an empty page
+        confirms there is nothing there (before a listing, past retention)
+        and is marked covered too - re-runs don't ask again.
+        """
+        step = INTERVAL_MS[interval]
+        pending = [(gap_start, gap_end)]
+        while pending:
+            start, end = pending.pop()
+            arrays = fetch(start, end - 1)
+            self.fetched_ranges += 1
+
+            keep = (arrays["time"] >= start) & (arrays["time"] < end)
+            arrays = {name: values[keep] for name, values in arrays.items()}
+            if not len(arrays["time"]):
+                self._mark_covered(coin, interval, start, end)  # Confirmed empty
+                continue
+
+            self._append(coin, interval, arrays)
+            first, last = int(arrays["time"].min()), int(arrays["time"].max()) + step
+            self._mark_covered(coin, interval, first, last)
+            if last < end:
+                pending.append((last, end))
+            if start < first:
+                pending.append((start, first))
+
+
+def _format(arrays, coin, interval, response_format):
+    """Candle arrays -> the caller's response format"""
+    if response_format == "arrays":
+        return arrays
+    if response_format == "frame":
+        return to_frame(arrays)
+
+    rows = [
+        {"t": int(t), "T": int(close_t), "s": coin, "i": interval,
+         "o": str(o), "h": str(h), "l": str(l), "c": str(c), "v": str(v), "n": int(n)}
+        for t, close_t, o, h, l, c, v, n in zip(*(arrays[name].tolist() for name in COLUMNS))
+    ]
+    if response_format == "typed":
+        return [Candle.from_dict(row) for row in rows]
+    return rows
@@ -0,0 +1,212 @@
+"""
+🌙 Moon Dev's Columnar Decoding
+Time-series endpoints straight into NumPy arrays / pandas DataFrames
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+
+    api = MoonDevAPI()
+    ticks = api.get_ticks("BTC", "24h", as_arrays=True)   # {"time": int64[], "price": float64[]}
+    candles = api.get_candles("ETH", "1h", as_frame=True)  # pandas DataFrame
+
+    returns = ticks["price"][1:] / ticks["price"][:-1] - 1   # vectorized from here on
+
+Timestamps become int64 Unix ms, prices/sizes float64. Only the record list
+is returned - envelope fields like tick_count are dropped. With msgspec
+installed the records are decoded into slim structs that skip every field
+we don't keep, so no per-record dicts get built at all.
+"""
+
+from datetime import datetime
+from operator import attrgetter, itemgetter
+from typing import Any, List, Union
+
+try:
+    import numpy as np
+except ImportError:  # Only needed for as_arrays / as_frame
+    np = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+COLUMNAR_FORMATS = ("arrays", "frame")
+
+
+def _to_ms(value):
+    """Timestamp (ms number or ISO string) -> int Unix ms"""
+    if isinstance(value, str):
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp() * 1000)
+    return int(value)
+
+
+class ColumnSpec:
+    """
+    🌙 How to turn one endpoint's records into typed columns
+
+    Args:
+        records: Envelope keys that may hold the record list (a top-level
+                 list is always accepted)
+        columns: List of (column name, candidate JSON keys, kind) where kind
+                 is "time" (int64 ms), "float" (float64), "int" (int64) or
+                 "str" (object). The first key present in the data wins.
+    """
+
+    def __init__(self, records, columns):
+        self.records = tuple(records)
+        self.columns = [(name, tuple(keys), kind) for name, keys, kind in columns]
+        self._struct_type = None
+        self._row_fields = None
+
+    # ==================== DECODING ====================
+    def decode(self, body, loads):
+        """Raw JSON bytes -> {column: numpy array}"""
+        if np is None:
+            raise ImportError("Columnar responses require numpy - pip install numpy pandas")
+
+        if msgspec is not None:
+            data = msgspec.json.decode(body, type=self._msgspec_type())
+            if isinstance(data, list):
+                rows = data
+            else:
+                rows = next((getattr(data, f"f{i}") for i in range(len(self.records))
+                             if getattr(data, f"f{i}") is not msgspec.UNSET), [])
+            fields = self._row_fields
+            return self._columns(rows, lambda key: attrgetter(fields[key]),
+                                 lambda row, key: getattr(row, fields[key]) is not msgspec.UNSET)
+
+        return self.extract(loads(body))
+
+    def extract(self, data):
+        """Already decoded JSON -> {column: numpy array}"""
+        if np is None:
+            raise ImportError("Columnar responses require numpy - pip install numpy pandas")
+
+        if isinstance(data, list):
+            rows = data
+        else:
+            rows = next((data[key] for key in self.records if key in data), [])
+        return self._columns(rows, itemgetter, lambda row, key: key in row)
+
+    def _columns(self, rows, getter, has_key):
+        """Build one typed array per column (getter(key) returns a row accessor)"""
+        arrays = {}
+        for name, keys, kind in self.columns:
+            # Responses are uniform, so pick the key from the first row
+            key = next((k for k in keys if rows and has_key(rows[0], k)), None)
+            if key is None:
+                arrays[name] = _empty(kind, len(rows))
+                continue
+
+            values = map(getter(key), rows)
+            if kind == "time":
+                arrays[name] = np.fromiter(map(_to_ms, values), dtype=np.int64, count=len(rows))
+            elif kind == "float":
+                arrays[name] = np.array(list(values), dtype=np.float64)
+            elif kind == "int":
+                arrays[name] = np.fromiter(values, dtype=np.int64, count=len(rows))
+            else:
+                arrays[name] = np.array(list(values), dtype=object)
+        return arrays
+
+    def _msgspec_type(self):
+        """Struct types that only decode the keys this spec uses"""
+        if self._struct_type is None:
+            keys = sorted({key for _, candidates, _ in self.columns for key in candidates})
+            self._row_fields = {key: f"f{i}" for i, key in enumerate(keys)}
+            row = _struct("Row", keys)
+            envelope = _struct("Envelope", self.records, List[row])
+            self._struct_type = Union[List[row], envelope]
+        return self._struct_type
+
+
+def _struct(name, keys, field_type=Any):
+    """msgspec Struct with one optional field (f0, f1, ...) per JSON key"""
+    fields = [(f"f{i}", field_type, msgspec.UNSET) for i in range(len(keys))]
+    rename = {f"f{i}": key for i, key in enumerate(keys)}
+    return msgspec.defstruct(name, fields, rename=rename, gc=False)
+
+
+def _empty(kind, length):
+    """Placeholder column for a key the endpoint didn't send"""
+    if kind == "float":
+        return np.full(length, np.nan)
+    if kind in ("time", "int"):
+        return np.zeros(length, dtype=np.int64)
+    return np.full(length, None, dtype=object)
+
+
+def to_frame(arrays):
+    """{column: array} -> pandas DataFrame (imported lazily, it's heavy)"""
+    import pandas as pd
+    return pd.DataFrame(arrays, copy=False)
+
+
+def columnar_format(as_frame=False, as_arrays=False):
+    """Map the as_frame / as_arrays method arguments to a response format"""
+    if as_frame:
+        return "frame"
+    if as_arrays:
+        return "arrays"
+    return None
+
+
+# ==================== ENDPOINT SPECS ====================
+TICK_COLUMNS = ColumnSpec(
+    records=("ticks", "data"),
+    columns=[
+        ("time", ("t", "timestamp", "time"), "time"),
+        ("price", ("p", "price"), "float"),
+    ],
+)
+
+CANDLE_COLUMNS = ColumnSpec(
+    records=("candles", "data"),
+    columns=[
+        ("time", ("t",), "time"),
+        ("close_time", ("T",), "time"),
+        ("open", ("o",), "float"),
+        ("high", ("h",), "float"),
+        ("low", ("l",), "float"),
+        ("close", ("c",), "float"),
+        ("volume", ("v",), "float"),
+        ("trades", ("n",), "int"),
+    ],
+)
+
+HLP_DELTA_COLUMNS = ColumnSpec(
+    records=("deltas", "data"),
+    columns=[
+        ("time", ("timestamp", "t", "time", "datetime"), "time"),
+        ("net_delta", ("net_delta", "delta"), "float"),
+        ("long_exposure", ("long_exposure",), "float"),
+        ("short_exposure", ("short_exposure",), "float"),
+    ],
+)
+
+HLP_HISTORY_COLUMNS = ColumnSpec(
+    records=("snapshots", "history", "data"),
+    columns=[
+        ("time", ("timestamp", "t", "time", "datetime"), "time"),
+        ("account_value", ("total_account_value", "account_value"), "float"),
+        ("net_exposure", ("net_exposure_delta", "net_exposure", "net_delta"), "float"),
+        ("positions", ("total_positions", "position_count"), "int"),
+    ],
+)
+
+POSITION_SNAPSHOT_COLUMNS = ColumnSpec(
+    records=("snapshots", "data"),
+    columns=[
+        ("time", ("timestamp", "snapshot_time", "t", "time"), "time"),
+        ("address", ("user", "address"), "str"),
+        ("side", ("side",), "str"),
+        ("position_value", ("position_value", "value_usd"), "float"),
+        ("entry_price", ("entry_price", "entry_px"), "float"),
+        ("liquidation_price", ("liquidation_price", "liq_px"), "float"),
+        ("distance_pct", ("distance_pct", "liquidation_distance_pct"), "float"),
+        ("leverage", ("leverage", "lev"), "float"),
+    ],
+)
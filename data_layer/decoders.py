@@ -0,0 +1,135 @@
+"""
+🌙 Moon Dev's JSON Decoders
+Pluggable fast JSON decoding (orjson / msgspec when installed, stdlib fallback)
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from api import MoonDevAPI
+
+    api = MoonDevAPI(decoder="orjson")          # or "msgspec", "json", any callable
+    lazy = api.as_format("lazy")                # same session, lazy responses
+    data = lazy.get_all_positions()             # nothing decoded yet
+    btc = data.pick("symbols")                  # decode only what you touch
+    raw = api.as_format("raw").get_ticks("BTC") # plain bytes
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+RESPONSE_FORMATS = ("json", "raw", "lazy", "typed")  # typed: see data_layer/models.py
+
+
+def _msgspec_decoder():
+    """msgspec decoder bound to one reusable Decoder instance"""
+    return msgspec.json.Decoder().decode
+
+
+def available_decoders():
+    """Map of decoder name -> loads(bytes) callable for everything installed"""
+    decoders = {"json": json.loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    if msgspec is not None:
+        decoders["msgspec"] = _msgspec_decoder()
+    return decoders
+
+
+def get_decoder(decoder=None):
+    """
+    Resolve a decoder argument to a loads(bytes) callable.
+
+    Args:
+        decoder: None/"auto" for the fastest installed (orjson > msgspec > json),
+                 a decoder name, or any callable taking bytes
+    """
+    if callable(decoder):
+        return decoder
+
+    decoders = available_decoders()
+    if decoder in (None, "auto"):
+        for name in ("orjson", "msgspec", "json"):
+            if name in decoders:
+                return decoders[name]
+    if decoder not in decoders:
+        raise ValueError(f"Decoder {decoder!r} not installed (available: {', '.join(decoders)})")
+    return decoders[decoder]
+
+
+def _pick_struct(keys):
+    """msgspec Struct type that only materializes the given top-level keys"""
+    fields = [(f"f{i}", Any, msgspec.UNSET) for i in range(len(keys))]
+    rename = {f"f{i}": key for i, key in enumerate(keys)}
+    return msgspec.defstruct("Pick", fields, rename=rename)
+
+
+class LazyJSON:
+    """
+    🌙 Lazily decoded response body
+
+    Holds the raw bytes and only decodes on first access. Behaves like the
+    decoded dict/list for indexing, iteration and len(). Use pick() to pull
+    a few top-level keys out of a big object - with msgspec installed the
+    rest of the payload is skipped instead of materialized.
+    """
+
+    __slots__ = ("raw", "_decoder", "_parse", "_value", "_decoded")
+
+    def __init__(self, raw, decoder=json.loads, parse=None):
+        self.raw = raw
+        self._decoder = decoder
+        self._parse = parse
+        self._value = None
+        self._decoded = False
+
+    @property
+    def value(self):
+        """Fully decoded body (decoded once, then reused)"""
+        if not self._decoded:
+            value = self._decoder(self.raw)
+            self._value = self._parse(value) if self._parse else value
+            self._decoded = True
+        return self._value
+
+    def pick(self, *keys):
+        """Dict with only the requested top-level keys (missing keys are left out)"""
+        if self._decoded or msgspec is None or self._parse is not None:
+            value = self.value
+            return {key: value[key] for key in keys if key in value}
+
+        picked = msgspec.json.decode(self.raw, type=_pick_struct(keys))
+        result = {}
+        for i, key in enumerate(keys):
+            item = getattr(picked, f"f{i}")
+            if item is not msgspec.UNSET:
+                result[key] = item
+        return result
+
+    def get(self, key, default=None):
+        return self.value.get(key, default)
+
+    def __getitem__(self, key):
+        return self.value[key]
+
+    def __contains__(self, key):
+        return key in self.value
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        state = "decoded" if self._decoded else f"{len(self.raw):,} bytes"
+        return f"<LazyJSON {state}>"
@@ -0,0 +1,406 @@
+"""
+🌙 Moon Dev's Live Feeds
+One scheduler polls every subscribed endpoint at its own cadence and fans each fetch out to all subscribers
+
+Built with love by Moon Dev 🚀
+
+Subscribe to endpoints by path-style name ("positions", "prices",
+"hlp/delta", "trades", ...) or by MoonDevAPI method name ("get_orderbook").
+Each distinct (endpoint, arguments) pair is fetched once per poll, however
+many feeds want it. The poll cadence comes from the documented update
+frequency (the same per-endpoint table the ResponseCache uses): 1s for
+positions/prices/trades, 60s for positions/all and hlp/delta, 30s for
+everything else. Every fetch goes through the client, so its rate limiter,
+retries, caches and metrics still apply.
+
+Updates are delivered by callback, as a blocking iterator or queue, or as an
+async iterator:
+
+Usage:
+    from api import MoonDevAPI
+    from data_layer import Poller
+
+    with Poller(MoonDevAPI()) as poller:
+        poller.subscribe("hlp/delta", callback=lambda u: print(u.data["net_delta"]))
+        book = poller.subscribe("orderbook", coin="BTC")
+
+        for update in book:                   # blocks, one Update per poll
+            print(update.time, update.data["spread_bps"])
+
+    # asyncio
+    async for update in poller.subscribe("positions", every=5):
+        ...
+"""
+
+import re
+import time
+import heapq
+import asyncio
+import inspect
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .cache import DEFAULT_TTL, ttl_for
+
+# ============================================
+# 🎯 FEED CONFIGURATION - Moon Dev
+# ============================================
+MIN_INTERVAL = 1.0        # Fastest allowed poll (the API's fastest endpoints update every 1s)
+DEFAULT_WORKERS = 8       # Concurrent fetches - a slow positions/all doesn't hold up 1s feeds
+DEFAULT_QUEUE_SIZE = 100  # Updates a feed keeps for a slow reader before dropping the oldest
+
+# Feed names that don't map to get_<name with / and - as _>
+FEED_ALIASES = {
+    "positions/all": "get_all_positions",
+    "ticks/latest": "get_tick_latest",
+    "ticks/stats": "get_tick_stats",
+    "liquidations/stats": "get_liquidation_stats",
+    "hlp/trades/stats": "get_hlp_trade_stats",
+    "hlp/positions/history": "get_hlp_position_history",
+    "hlp/liquidators/status": "get_hlp_liquidator_status",
+}
+
+# ============================================
+
+
+class Update(namedtuple("Update", ["feed", "data", "time", "error"])):
+    """One poll of an endpoint: data on success, the exception on failure"""
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class _EndpointProbe:
+    """Stand-in client that returns the path a method would request instead of fetching it"""
+
+    response_format = "json"
+
+    def _request(self, endpoint, *args, **kwargs):
+        return endpoint
+
+
+def resolve_feed(api, name):
+    """MoonDevAPI method name for a feed name ("hlp/delta" -> "get_hlp_delta")"""
+    method = FEED_ALIASES.get(name)
+    if method is None:
+        method = name if name.startswith("get_") or name == "health" else "get_" + re.sub(r"[/-]", "_", name)
+    if method.startswith("_") or not callable(getattr(api, method, None)):
+        raise ValueError(f"Unknown feed {name!r}")
+    return method
+
+
+def feed_cadence(api, method, params=None):
+    """Seconds between polls for a method - how often its endpoint's data updates"""
+    try:
+        endpoint = getattr(type(api), method)(_EndpointProbe(), **(params or {}))
+    except Exception:
+        endpoint = None
+    if not isinstance(endpoint, str):
+        return DEFAULT_TTL
+    cache = getattr(api, "cache", None)
+    ttl = cache.ttl_for(endpoint) if cache else ttl_for(endpoint)
+    return ttl or DEFAULT_TTL  # TTL 0 = never cached, not never changing
+
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
+
+
+class Feed:
+    """
+    🌙 Moon Dev's Feed - one subscriber's view of an endpoint
+
+    Created by Poller.subscribe(). With a callback, every Update is handed to
+    it on a poller worker thread (keep it quick). Without one, updates are
+    queued: read them with get(), a for loop or an async for loop. Once more
+    than `maxsize` are waiting, the oldest are dropped and counted in
+    `dropped`. Closing the feed unsubscribes it and ends its iterators.
+    """
+
+    def __init__(self, poller, key, name, every, callback=None, maxsize=DEFAULT_QUEUE_SIZE):
+        self.poller = poller
+        self.key = key
+        self.name = name
+        self.every = every
+        self.callback = callback
+        self.latest = None
+        self.delivered = 0
+        self.dropped = 0
+        self.closed = False
+
+        self._updates = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self._waiters = []  # (loop, future) of async readers
+
+    def __repr__(self):
+        return f"Feed({self.name}, every={self.every}s)"
+
+    def _deliver(self, update):
+        """Hand one update to the callback or queue it for readers"""
+        self.latest = update
+        self.delivered += 1
+        if self.callback is not None:
+            try:
+                self.callback(update)
+            except Exception as e:
+                self.poller.stats["callback_errors"] += 1
+                print(f"⚠️ Feed callback failed for {self.name}: {e}")
+            return
+
+        with self._cond:
+            if len(self._updates) == self._updates.maxlen:
+                self.dropped += 1
+            self._updates.append(update)
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def _close(self):
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def close(self):
+        """Unsubscribe - queued updates can still be read"""
+        self.poller.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, timeout=None):
+        """Next Update. Blocks until one arrives; None on timeout or once closed and drained."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._updates or self.closed, timeout)
+            return self._updates.popleft() if self._updates else None
+
+    def __iter__(self):
+        while True:
+            update = self.get()
+            if update is None:
+                return
+            yield update
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            with self._cond:
+                if self._updates:
+                    return self._updates.popleft()
+                if self.closed:
+                    raise StopAsyncIteration
+                loop = asyncio.get_running_loop()
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+            await future
+
+
+class _Endpoint:
+    """One distinct (method, params) pair polled on behalf of its feeds"""
+
+    __slots__ = ("key", "method", "params", "label", "feeds", "interval", "due", "in_flight", "latest")
+
+    def __init__(self, key, method, params):
+        self.key = key
+        self.method = method
+        self.params = params
+        args = ", ".join(f"{k}={v!r}" for k, v in params.items())
+        self.label = f"{method}({args})" if args else method
+        self.feeds = []
+        self.interval = None
+        self.due = None
+        self.in_flight = False
+        self.latest = None
+
+
+class Poller:
+    """
+    🌙 Moon Dev's Poller
+
+    A single scheduler thread tracks when each subscribed endpoint is due
+    next and hands the fetch to a small worker pool. The next poll is
+    scheduled `interval` seconds after the previous one finishes, so a slow
+    endpoint never has two fetches in flight, and a client cache entry has
+    always expired by the time it's polled again. An endpoint shared by
+    several feeds is polled at the fastest cadence any of them asked for.
+
+    Args:
+        api: MoonDevAPI to fetch with
+        workers: Concurrent fetches (default: 8)
+        min_interval: Floor on any feed's `every` (default: 1s)
+    """
+
+    def __init__(self, api, workers=DEFAULT_WORKERS, min_interval=MIN_INTERVAL):
+        if inspect.iscoroutinefunction(getattr(api, "close", None)):
+            raise TypeError("Poller needs the sync MoonDevAPI (it polls from worker threads)")
+        self.api = api
+        self.workers = workers
+        self.min_interval = min_interval
+
+        self._lock = threading.Condition()
+        self._endpoints = {}  # key -> _Endpoint
+        self._heap = []       # (due, seq, key) - stale entries are skipped
+        self._seq = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._executor = None
+        self.stats = {"polls": 0, "errors": 0, "callback_errors": 0}
+
+    # ==================== SUBSCRIPTIONS ====================
+    def subscribe(self, name, callback=None, every=None, maxsize=DEFAULT_QUEUE_SIZE, replay=True, **params):
+        """
+        Subscribe to an endpoint and start polling it (starts the poller if needed).
+
+        Args:
+            name: Feed name ("positions", "hlp/delta", "orderbook", ...) or method ("get_orderbook")
+            callback: Called with each Update on a worker thread. Without one, updates are queued.
+            every: Seconds between polls (default: the endpoint's update cadence)
+            maxsize: Queued updates kept for a slow reader (None = unbounded)
+            replay: Deliver the endpoint's latest update right away if another feed already has one
+            **params: Arguments for the API method (coin="BTC", timeframe="1h", ...)
+
+        Returns:
+            Feed
+        """
+        method = resolve_feed(self.api, name)
+        inspect.signature(getattr(self.api, method)).bind(**params)  # TypeError now, not on every poll
+        if every is None:
+            every = feed_cadence(self.api, method, params)
+        every = max(self.min_interval, every)
+
+        key = (method, tuple(sorted(params.items())))
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = _Endpoint(key, method, params)
+            feed = Feed(self, key, endpoint.label, every, callback, maxsize)
+            endpoint.feeds.append(feed)
+            latest = endpoint.latest
+
+            interval = min(f.every for f in endpoint.feeds)
+            if endpoint.interval is None:
+                endpoint.interval = interval
+                self._schedule(endpoint, time.monotonic())
+            elif interval < endpoint.interval:
+                # Faster subscriber - pull the next poll forward
+                due = endpoint.due - endpoint.interval + interval
+                endpoint.interval = interval
+                if not endpoint.in_flight:
+                    self._schedule(endpoint, due)
+
+        if replay and latest is not None:
+            feed._deliver(latest)
+        self.start()
+        return feed
+
+    def unsubscribe(self, feed):
+        """Stop delivering to a feed; an endpoint with no feeds left stops being polled"""
+        with self._lock:
+            endpoint = self._endpoints.get(feed.key)
+            if endpoint is not None and feed in endpoint.feeds:
+                endpoint.feeds.remove(feed)
+                if endpoint.feeds:
+                    endpoint.interval = min(f.every for f in endpoint.feeds)
+                else:
+                    del self._endpoints[feed.key]
+        feed._close()
+
+    def schedule(self):
+        """{endpoint: (seconds between polls, subscriber count)} for everything being polled"""
+        with self._lock:
+            return {e.label: (e.interval, len(e.feeds)) for e in self._endpoints.values()}
+
+    # ==================== SCHEDULER ====================
+    def _schedule(self, endpoint, due):
+        """Queue the next poll of an endpoint (caller holds the lock)"""
+        endpoint.due = due
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, endpoint.key))
+        self._lock.notify()
+
+    def _run(self):
+        with self._lock:
+            while not self._stop.is_set():
+                if not self._heap:
+                    self._lock.wait()
+                    continue
+                due, _, key = self._heap[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._lock.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+                endpoint = self._endpoints.get(key)
+                if endpoint is None or endpoint.due != due or endpoint.in_flight:
+                    continue  # Unsubscribed or rescheduled since
+                endpoint.in_flight = True
+                self._executor.submit(self._poll, endpoint)
+
+    def _poll(self, endpoint):
+        """Fetch one endpoint and fan the update out to its feeds"""
+        try:
+            update = Update(endpoint.label, getattr(self.api, endpoint.method)(**endpoint.params), time.time(), None)
+        except Exception as e:
+            update = Update(endpoint.label, None, time.time(), e)
+
+        with self._lock:
+            self.stats["polls"] += 1
+            if update.ok:
+                endpoint.latest = update
+            else:
+                self.stats["errors"] += 1
+            endpoint.in_flight = False
+            feeds = list(endpoint.feeds)
+            if self._endpoints.get(endpoint.key) is endpoint and not self._stop.is_set():
+                self._schedule(endpoint, time.monotonic() + endpoint.interval)
+
+        for feed in feeds:
+            feed._deliver(update)
+
+    # ==================== LIFECYCLE ====================
+    def start(self):
+        """Start the scheduler thread (subscribe() does this for you)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return self._thread
+            self._stop.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="moondev-poller")
+            self._thread = threading.Thread(target=self._run, name="moondev-feed-scheduler", daemon=True)
+            self._thread.start()
+            return self._thread
+
+    def stop(self, timeout=None):
+        """Stop polling and close every feed (their iterators end once drained)"""
+        with self._lock:
+            self._stop.set()
+            self._lock.notify()
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+            feeds = [f for e in self._endpoints.values() for f in e.feeds]
+            self._endpoints.clear()
+            self._heap.clear()
+        if thread:
+            thread.join(timeout)
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        for feed in feeds:
+            feed._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
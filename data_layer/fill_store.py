@@ -0,0 +1,187 @@
+"""
+🌙 Moon Dev's Fill Store
+Incremental wallet fill sync - download a wallet's history once, then only what's new
+
+Built with love by Moon Dev 🚀
+
+get_user_fills(address, limit=-1) re-downloads every fill on every call
+(megabytes for a 32,000-fill whale). The store keeps each wallet's fills in
+an append-only binary file, asks the API for the most recent page only and
+widens the page until it overlaps what's already stored. Fills are deduped
+by tid and the merged history comes back as columns.
+
+Usage:
+    from api import MoonDevAPI
+    from data_layer import FillStore
+
+    api = MoonDevAPI()
+    store = FillStore("~/.moondev/fills")
+    store.sync(api, "0x...")                     # First run: full history
+    store.sync(api, "0x...")                     # Later runs: newest page only
+    df = store.history("0x...", as_frame=True)
+"""
+
+import os
+import threading
+
+import numpy as np
+
+from .columnar import to_frame
+
+# ============================================
+# 🎯 FILL STORE CONFIGURATION - Moon Dev
+# ============================================
+PAGE_LIMITS = (100, 2000)  # Recent pages tried before falling back to limit=-1 (all)
+
+# One fixed-size record per fill (strings as fixed-width bytes)
+FILL_DTYPE = np.dtype([
+    ("time", "<i8"), ("tid", "<i8"), ("oid", "<i8"),
+    ("coin", "S24"), ("side", "S1"), ("dir", "S24"),
+    ("px", "<f8"), ("sz", "<f8"), ("closed_pnl", "<f8"), ("fee", "<f8"), ("start_position", "<f8"),
+    ("crossed", "?"), ("hash", "S66"),
+])
+
+# Record column -> key in the API fill dict
+FILL_KEYS = {
+    "time": "time", "tid": "tid", "oid": "oid", "coin": "coin", "side": "side", "dir": "dir",
+    "px": "px", "sz": "sz", "closed_pnl": "closedPnl", "fee": "fee",
+    "start_position": "startPosition", "crossed": "crossed", "hash": "hash",
+}
+
+STRING_COLUMNS = ("coin", "side", "dir", "hash")
+
+
+def _to_records(fills):
+    """API fill dicts -> FILL_DTYPE records"""
+    records = np.zeros(len(fills), dtype=FILL_DTYPE)
+    for name, key in FILL_KEYS.items():
+        values = [fill.get(key) for fill in fills]
+        if name in STRING_COLUMNS:
+            records[name] = [(v or "").encode() for v in values]
+        elif name == "crossed":
+            records[name] = [bool(v) for v in values]
+        else:
+            records[name] = [0 if v in (None, "") else v for v in values]
+    return records
+
+
+def _columns(records):
+    """FILL_DTYPE records -> dict of NumPy columns (strings decoded)"""
+    columns = {}
+    for name in FILL_DTYPE.names:
+        values = np.array(records[name])
+        columns[name] = values.astype(str) if name in STRING_COLUMNS else values
+    return columns
+
+
+def fill_columns(fills):
+    """
+    API fill dicts (get_user_fills / get_fills) -> dict of NumPy columns.
+
+    Same columns as FillStore.history(), in the order given.
+    """
+    return _columns(_to_records(fills))
+
+
+class FillStore:
+    """
+    🌙 Moon Dev's Fill Store
+
+    One `<address>.bin` file of FILL_DTYPE records per wallet inside `root`.
+    A wallet that was never synced gets its full history (limit=-1); after
+    that each sync fetches the newest page and only widens it when the page
+    doesn't reach back to fills already stored. Threads can sync different
+    wallets in parallel: the fetch runs outside any lock, and only the merge
+    and write of one wallet's file is serialized. One process should sync
+    into a store at a time.
+
+    Args:
+        root: Directory holding the store (created if missing)
+    """
+
+    def __init__(self, root):
+        self.root = os.path.expanduser(root)
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()  # Guards _address_locks and stats - never held across a fetch
+        self._address_locks = {}
+        self.stats = {"syncs": 0, "requests": 0, "fills_fetched": 0, "fills_written": 0}
+
+    def _address_lock(self, address):
+        """Lock serializing merges into one wallet's file"""
+        with self._lock:
+            return self._address_locks.setdefault(address.lower(), threading.Lock())
+
+    def _count(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                self.stats[name] += value
+
+    def _path(self, address):
+        return os.path.join(self.root, f"{address.lower()}.bin")
+
+    def _records(self, address):
+        path = self._path(address)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return np.empty(0, dtype=FILL_DTYPE)
+        return np.memmap(path, dtype=FILL_DTYPE, mode="r")
+
+    def newest(self, address):
+        """(highest time, highest tid) stored for a wallet, or (None, None)"""
+        records = self._records(address)
+        if not len(records):
+            return None, None
+        return int(records["time"].max()), int(records["tid"].max())
+
+    # ==================== SYNC ====================
+    def _fetch_new(self, api, address, stored):
+        """Fetch pages until one overlaps the stored fills (or is the whole history)"""
+        limits = PAGE_LIMITS + (-1,) if os.path.exists(self._path(address)) else (-1,)
+        newest_time = int(stored["time"].max()) if len(stored) else None
+
+        for limit in limits:
+            fills = api.get_user_fills(address, limit=limit).get("fills", [])
+            self._count(requests=1, fills_fetched=len(fills))
+            complete = limit == -1 or len(fills) < limit
+            if complete or newest_time is None or any(f.get("time", 0) <= newest_time for f in fills):
+                return fills
+        return fills
+
+    def sync(self, api, address):
+        """
+        Bring one wallet's stored history up to date.
+
+        Args:
+            api: MoonDevAPI instance
+            address: Wallet address
+
+        Returns:
+            Number of new fills stored
+        """
+        api = api.as_format("json")
+        fills = self._fetch_new(api, address, self._records(address))
+        records = _to_records(fills)
+        records = records[np.unique(records["tid"], return_index=True)[1]]
+
+        with self._address_lock(address):
+            stored = self._records(address)  # Re-read - a concurrent sync of this wallet may have written
+            if len(stored):
+                records = records[~np.isin(records["tid"], stored["tid"])]
+            with open(self._path(address), "ab") as f:
+                f.write(records.tobytes())
+
+        self._count(syncs=1, fills_written=len(records))
+        return len(records)
+
+    # ==================== QUERY ====================
+    def history(self, address, as_frame=False):
+        """
+        Merged fill history for a wallet as columns, oldest first.
+
+        Returns:
+            dict of NumPy arrays (time, tid, oid, coin, side, dir, px, sz,
+            closed_pnl, fee, start_position, crossed, hash), or a pandas
+            DataFrame with as_frame=True
+        """
+        records = self._records(address)
+        columns = _columns(records[np.argsort(records["time"], kind="stable")])
+        return to_frame(columns) if as_frame else columns
@@ -0,0 +1,237 @@
+"""
+🌙 Moon Dev's Client Metrics
+Per-endpoint latency, payload size, decode time, status codes, retries and cache hits
+
+Built with love by Moon Dev 🚀
+
+Off by default - a client without metrics only pays one `if` per call.
+Endpoints are labelled by path with wallet addresses replaced by {address}
+and the query string dropped, so labels stay bounded.
+
+Usage:
+    from api import MoonDevAPI
+    from data_layer import JsonlSink, Metrics
+
+    api = MoonDevAPI(metrics=Metrics(sinks=[JsonlSink("moondev_requests.jsonl")]))
+    api.get_liquidations("1h")
+
+    api.metrics.snapshot()          # dict per endpoint
+    api.metrics.prometheus_text()   # Prometheus text exposition format
+"""
+
+import re
+import json
+import time
+import bisect
+import threading
+
+# ============================================
+# 🎯 METRICS CONFIGURATION - Moon Dev
+# ============================================
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+
+ADDRESS_PATTERN = re.compile(r"0x[0-9a-fA-F]{6,}")
+
+
+def endpoint_label(endpoint):
+    """'/api/fills/0xabc...?limit=5' -> '/api/fills/{address}'"""
+    return ADDRESS_PATTERN.sub("{address}", endpoint.split("?", 1)[0])
+
+
+class _Histogram:
+    """Cumulative-bucket histogram (Prometheus style)"""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (None if empty)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS + (float("inf"),), self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(b) for b in LATENCY_BUCKETS] + ["+Inf"], self.counts)),
+        }
+
+
+class _EndpointStats:
+    __slots__ = ("statuses", "latency", "bytes", "decode", "retries", "cache_hits")
+
+    def __init__(self):
+        self.statuses = {}
+        self.latency = _Histogram()
+        self.bytes = 0
+        self.decode = _Histogram()
+        self.retries = 0
+        self.cache_hits = {}
+
+
+class JsonlSink:
+    """Append every metrics event as one JSON line to `path`"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", buffering=1)
+
+    def __call__(self, event):
+        line = json.dumps(event, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class Metrics:
+    """
+    🌙 Moon Dev's Client Metrics
+
+    Aggregates request events per endpoint and forwards each raw event to
+    the sinks (any callable taking an event dict, e.g. JsonlSink).
+
+    Event types:
+        {"event": "request", "endpoint", "status", "seconds", "bytes", "retries", "ts"}
+        {"event": "decode", "endpoint", "seconds", "ts"}
+        {"event": "cache_hit", "endpoint", "kind", "ts"}   # kind: cache / not_modified
+
+    Args:
+        sinks: Callables that receive every event (default: none)
+    """
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks or [])
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def _stats(self, label):
+        stats = self._endpoints.get(label)
+        if stats is None:
+            stats = self._endpoints[label] = _EndpointStats()
+        return stats
+
+    def _emit(self, event):
+        for sink in self.sinks:
+            sink(event)
+
+    # ==================== RECORDING ====================
+    def observe_request(self, endpoint, status, seconds, nbytes=0, retries=0):
+        """One GET call: final status (or exception name), wall time incl. retries, body size"""
+        label = endpoint_label(endpoint)
+        with self._lock:
+            stats = self._stats(label)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.latency.observe(seconds)
+            stats.bytes += nbytes
+            stats.retries += retries
+        if self.sinks:
+            self._emit({"event": "request", "endpoint": label, "status": status, "seconds": seconds,
+                        "bytes": nbytes, "retries": retries, "ts": time.time()})
+
+    def observe_decode(self, endpoint, seconds):
+        """Time spent turning a body into the response format"""
+        label = endpoint_label(endpoint)
+        with self._lock:
+            self._stats(label).decode.observe(seconds)
+        if self.sinks:
+            self._emit({"event": "decode", "endpoint": label, "seconds": seconds, "ts": time.time()})
+
+    def cache_hit(self, endpoint, kind="cache"):
+        """A call answered without downloading a body"""
+        label = endpoint_label(endpoint)
+        with self._lock:
+            hits = self._stats(label).cache_hits
+            hits[kind] = hits.get(kind, 0) + 1
+        if self.sinks:
+            self._emit({"event": "cache_hit", "endpoint": label, "kind": kind, "ts": time.time()})
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    # ==================== EXPORT ====================
+    def snapshot(self):
+        """Current totals as a plain dict keyed by endpoint label"""
+        with self._lock:
+            return {
+                label: {
+                    "requests": stats.latency.count,
+                    "statuses": dict(stats.statuses),
+                    "latency": stats.latency.to_dict(),
+                    "bytes": stats.bytes,
+                    "decode": stats.decode.to_dict(),
+                    "retries": stats.retries,
+                    "cache_hits": dict(stats.cache_hits),
+                }
+                for label, stats in self._endpoints.items()
+            }
+
+    def prometheus_text(self):
+        """Current totals in the Prometheus text exposition format"""
+        lines = [
+            "# HELP moondev_request_duration_seconds GET latency per endpoint, retries included",
+            "# TYPE moondev_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            for label, stats in endpoints:
+                lines.extend(_histogram_lines("moondev_request_duration_seconds", label, stats.latency))
+
+            lines += ["# HELP moondev_decode_duration_seconds Body decode time per endpoint",
+                      "# TYPE moondev_decode_duration_seconds histogram"]
+            for label, stats in endpoints:
+                if stats.decode.count:
+                    lines.extend(_histogram_lines("moondev_decode_duration_seconds", label, stats.decode))
+
+            lines += ["# HELP moondev_requests_total GET calls per endpoint and final status",
+                      "# TYPE moondev_requests_total counter"]
+            for label, stats in endpoints:
+                for status, n in sorted(stats.statuses.items(), key=lambda item: str(item[0])):
+                    lines.append(f'moondev_requests_total{{endpoint="{label}",status="{status}"}} {n}')
+
+            lines += ["# HELP moondev_response_bytes_total Response body bytes per endpoint",
+                      "# TYPE moondev_response_bytes_total counter"]
+            lines += [f'moondev_response_bytes_total{{endpoint="{label}"}} {stats.bytes}' for label, stats in endpoints]
+
+            lines += ["# HELP moondev_retries_total Retried attempts per endpoint",
+                      "# TYPE moondev_retries_total counter"]
+            lines += [f'moondev_retries_total{{endpoint="{label}"}} {stats.retries}' for label, stats in endpoints]
+
+            lines += ["# HELP moondev_cache_hits_total Calls served without downloading a body",
+                      "# TYPE moondev_cache_hits_total counter"]
+            for label, stats in endpoints:
+                for kind, n in sorted(stats.cache_hits.items()):
+                    lines.append(f'moondev_cache_hits_total{{endpoint="{label}",kind="{kind}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(name, label, histogram):
+    lines = []
+    cumulative = 0
+    for bound, n in zip([str(b) for b in LATENCY_BUCKETS] + ["+Inf"], histogram.counts):
+        cumulative += n
+        lines.append(f'{name}_bucket{{endpoint="{label}",le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_sum{{endpoint="{label}"}} {histogram.sum}')
+    lines.append(f'{name}_count{{endpoint="{label}"}} {histogram.count}')
+    return lines
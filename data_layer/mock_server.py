@@ -0,0 +1,914 @@
+"""
+🌙 Moon Dev's Mock Data Layer Server
+Local stand-in for api.moondev.com - replays recorded fixtures or synthesizes payloads
+
+Built with love by Moon Dev 🚀
+
+Serves every path listed in api.py. Recorded fixtures (see
+data_layer.recording) are replayed first. Any other path gets a realistic
+synthesized payload, deterministic per URL, whose size scales with
+`scale`. You can add artificial latency and a random 503 rate. ETag /
+If-None-Match work like the real API, so caches and conditional requests
+can be load-tested on a box with no internet.
+
+Usage:
+    python -m data_layer.mock_server --port 8765 --scale 2 --latency 0.02
+    python -m data_layer.mock_server --fixtures fixtures/
+
+    MOONDEV_BASE_URL=http://127.0.0.1:8765 python examples/02_positions.py
+
+    # In-process
+    from data_layer.mock_server import MockDataLayer
+
+    with MockDataLayer(scale=0.5) as server:
+        api = MoonDevAPI(api_key="test", base_url=server.base_url)
+        api.get_positions()
+"""
+
+import re
+import sys
+import json
+import math
+import time
+import zlib
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .recording import FixtureStore, fixture_key
+
+# ============================================
+# 🎯 MOCK SERVER CONFIGURATION - Moon Dev
+# ============================================
+DEFAULT_PORT = 8765
+BODY_CACHE_SIZE = 2048    # Synthesized bodies kept in memory (per URL)
+
+BASE_PRICES = {
+    "BTC": 94000.0, "ETH": 3200.0, "SOL": 140.0, "HYPE": 25.0, "XRP": 2.1, "DOGE": 0.14,
+    "LTC": 85.0, "ADA": 0.45, "DOT": 4.2, "LINK": 14.0, "AVAX": 22.0, "BNB": 610.0,
+    "AAVE": 180.0, "UNI": 7.5, "CRV": 0.6, "LDO": 1.1, "PENDLE": 3.2, "JUP": 0.55,
+    "ONDO": 0.9, "ENA": 0.35, "ARB": 0.4, "OP": 0.8, "SUI": 2.8, "SEI": 0.25,
+    "APT": 6.0, "NEAR": 2.5, "TON": 3.0, "TIA": 2.4, "WIF": 0.8, "FARTCOIN": 0.7,
+    "PUMP": 0.004, "POPCAT": 0.3, "PENGU": 0.02, "TRUMP": 9.0,
+}
+CANDLE_SYMBOLS = sorted(BASE_PRICES) + [f"ALT{i}" for i in range(80 - len(BASE_PRICES))]
+POSITION_SYMBOLS = CANDLE_SYMBOLS + [f"PERP{i}" for i in range(148 - len(CANDLE_SYMBOLS))]
+PRICE_SYMBOLS = POSITION_SYMBOLS + [f"MISC{i}" for i in range(224 - len(POSITION_SYMBOLS))]
+FLOW_COINS = ["BTC", "ETH", "HYPE", "SOL", "XRP"]
+
+HIP3_DEXES = {
+    "xyz": {"TSLA": 420.0, "NVDA": 180.0, "AAPL": 230.0, "META": 700.0, "MSFT": 500.0,
+            "GOOGL": 190.0, "AMZN": 220.0, "COIN": 300.0, "MSTR": 350.0, "GOLD": 2650.0,
+            "SILVER": 31.0, "CL": 72.0, "XYZ100": 21000.0, "EUR": 1.08, "JPY": 0.0066},
+    "flx": {"XMR": 180.0, "GOLD": 2650.0, "SILVER": 31.0, "OIL": 72.0},
+    "hyna": {"BTC": 94000.0, "ETH": 3200.0, "HYPE": 25.0, "SOL": 140.0, "FARTCOIN": 0.7},
+    "km": {"US500": 5900.0, "USTECH": 21000.0, "SMALL2000": 2300.0},
+}
+HIP3_CATEGORIES = {"GOLD": "commodities", "SILVER": "commodities", "CL": "commodities", "OIL": "commodities",
+                   "XYZ100": "indices", "US500": "indices", "USTECH": "indices", "SMALL2000": "indices",
+                   "EUR": "fx", "JPY": "fx"}
+
+EXCHANGES = ["hyperliquid", "binance", "bybit", "okx"]
+TIMEFRAME_MS = {"5m": 300_000, "10m": 600_000, "15m": 900_000, "1h": 3_600_000, "4h": 14_400_000,
+                "12h": 43_200_000, "24h": 86_400_000, "2d": 172_800_000, "7d": 604_800_000,
+                "14d": 1_209_600_000, "30d": 2_592_000_000}
+INTERVAL_MS = {"1m": 60_000, "5m": 300_000, "15m": 900_000, "1h": 3_600_000, "4h": 14_400_000, "1d": 86_400_000}
+HLP_STRATEGIES = ["HLP Strategy A", "HLP Strategy B", "HLP Liquidator 1", "HLP Liquidator 2",
+                  "HLP Liquidator 3", "HLP Liquidator 4", "HLP Strategy X"]
+EVENT_TYPES = ["deposit", "withdrawal", "transfer", "vault_deposit", "liquidation", "large_trade"]
+FILL_DIRS = ["Open Long", "Close Long", "Open Short", "Close Short"]
+
+
+def _base_price(coin):
+    coin = coin.split(":")[-1].upper()
+    for tickers in HIP3_DEXES.values():
+        if coin in tickers:
+            return tickers[coin]
+    return BASE_PRICES.get(coin) or 0.5 + zlib.crc32(coin.encode()) % 5000 / 100
+
+
+def _price_at(coin, t):
+    """Deterministic price path: the same (coin, time) always gives the same price"""
+    phase = zlib.crc32(coin.encode()) % 1000
+    wave = 0.03 * math.sin(t / 3_600_000 / 7 + phase) + 0.01 * math.sin(t / 300_000 + phase)
+    noise = (zlib.crc32(f"{coin}{t}".encode()) % 2001 - 1000) / 1_000_000
+    return _base_price(coin) * (1 + wave + noise)
+
+
+def _round(value):
+    return float(f"{value:.6g}")
+
+
+class _Synth:
+    """Payload helpers bound to one request: seeded RNG, scale and a fixed 'now'"""
+
+    def __init__(self, seed, scale, now):
+        self.rng = random.Random(seed)
+        self.scale = scale
+        self.now = now
+
+    def n(self, base):
+        """Record count for a payload that has `base` records at scale 1"""
+        return max(1, int(base * self.scale))
+
+    def address(self):
+        return "0x%040x" % self.rng.getrandbits(160)
+
+    def coin(self, coins=None):
+        return self.rng.choice(coins or CANDLE_SYMBOLS)
+
+    def usd(self, low, high):
+        """Log-uniform dollar value - lots of small ones, a few whales"""
+        return round(math.exp(self.rng.uniform(math.log(low), math.log(high))), 2)
+
+    def when(self, window_ms):
+        return self.now - self.rng.randrange(window_ms)
+
+    def position(self, coin, side):
+        entry = _base_price(coin) * self.rng.uniform(0.9, 1.1)
+        leverage = self.rng.choice([2, 3, 5, 10, 20, 25, 40])
+        distance = round(self.rng.uniform(0.3, 30.0), 2)
+        liq = entry * (1 - distance / 100) if side == "long" else entry * (1 + distance / 100)
+        value = self.usd(200_000, 50_000_000)
+        return {
+            "address": self.address(), "coin": coin, "side": side, "value": value, "size": _round(value / entry),
+            "leverage": leverage, "entry_price": _round(entry), "liq_price": _round(liq),
+            "distance_pct": distance, "pnl": round(value * self.rng.uniform(-0.2, 0.3), 2),
+        }
+
+    def positions_block(self, coins, per_side):
+        longs = sorted((self.position(self.coin(coins), "long") for _ in range(per_side)),
+                       key=lambda p: p["distance_pct"])
+        shorts = sorted((self.position(self.coin(coins), "short") for _ in range(per_side)),
+                        key=lambda p: p["distance_pct"])
+        return {
+            "longs": longs, "shorts": shorts,
+            "total_positions": len(longs) + len(shorts), "total_longs": len(longs), "total_shorts": len(shorts),
+            "total_long_value": round(sum(p["value"] for p in longs), 2),
+            "total_short_value": round(sum(p["value"] for p in shorts), 2),
+        }
+
+    def liquidation(self, exchange, window_ms, coins=None):
+        coin = self.coin(coins)
+        t = self.when(window_ms)
+        value = self.usd(1_000, 5_000_000)
+        price = _price_at(coin, t)
+        return {
+            "exchange": exchange, "symbol": coin if exchange == "hyperliquid" else f"{coin}USDT", "coin": coin,
+            "side": self.rng.choice(["long", "short"]), "price": _round(price), "size": _round(value / price),
+            "value": value, "value_usd": value, "address": self.address() if exchange == "hyperliquid" else None,
+            "timestamp": t, "time": t,
+        }
+
+    def fill(self, coin, t, tid, hl_format=False):
+        direction = self.rng.choice(FILL_DIRS)
+        side = "B" if direction in ("Open Long", "Close Short") else "A"
+        price = _price_at(coin, t)
+        size = _round(self.usd(100, 500_000) / price)
+        closing = direction.startswith("Close")
+        fill = {
+            "coin": coin, "px": f"{price:.6g}", "sz": f"{size}", "side": side, "time": t,
+            "startPosition": f"{_round(size * self.rng.uniform(0, 3))}", "dir": direction,
+            "closedPnl": f"{price * size * self.rng.uniform(-0.05, 0.06):.2f}" if closing else "0.0",
+            "hash": "0x%064x" % self.rng.getrandbits(256), "oid": tid * 3, "crossed": self.rng.random() < 0.6,
+            "fee": f"{price * size * 0.00035:.4f}", "tid": tid, "feeToken": "USDC",
+        }
+        if not hl_format:
+            fill["side"] = "B" if side == "B" else "S"
+        return fill
+
+
+def _liquidation_stats(liquidations):
+    stats = {"total_count": 0, "total_value_usd": 0.0, "total_volume": 0.0, "long_count": 0, "short_count": 0,
+             "long_value_usd": 0.0, "short_value_usd": 0.0, "long_volume": 0.0, "short_volume": 0.0,
+             "by_exchange": {}, "by_coin": {}}
+    for liq in liquidations:
+        side, value = liq["side"], liq["value_usd"]
+        stats["total_count"] += 1
+        stats["total_value_usd"] += value
+        stats[f"{side}_count"] += 1
+        stats[f"{side}_value_usd"] += value
+        exchange = stats["by_exchange"].setdefault(liq["exchange"], {"count": 0, "volume": 0.0})
+        exchange["count"] += 1
+        exchange["volume"] += value
+        coin = stats["by_coin"].setdefault(liq["coin"], {"count": 0, "volume": 0.0, "long_volume": 0.0,
+                                                         "short_volume": 0.0})
+        coin["count"] += 1
+        coin["volume"] += value
+        coin[f"{side}_volume"] += value
+    stats["total_volume"] = stats["total_value_usd"]
+    stats["long_volume"], stats["short_volume"] = stats["long_value_usd"], stats["short_value_usd"]
+    stats["largest"] = sorted(liquidations, key=lambda liq: liq["value_usd"], reverse=True)[:10]
+    return stats
+
+
+def _window(query, key, default):
+    return TIMEFRAME_MS.get(query.get(key, default), TIMEFRAME_MS[default])
+
+
+def _int(query, key, default):
+    try:
+        return int(query.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# ==================== PAYLOAD SYNTHESIZERS ====================
+# Each takes (synth, path match, query dict) and returns a JSON-able object (or str for text)
+
+def _health(s, m, q):
+    return {"status": "ok", "timestamp": s.now, "uptime_seconds": 86400}
+
+
+def _liquidations(s, m, q):
+    source, timeframe = m.group(1) or "", m.group(2)
+    window = TIMEFRAME_MS.get(timeframe, TIMEFRAME_MS["1h"])
+    exchanges = {"": ["hyperliquid"], "hip3_": ["hyperliquid"], "all_": EXCHANGES,
+                 "binance_": ["binance"], "bybit_": ["bybit"], "okx_": ["okx"]}[source]
+    coins = [f"{dex}:{t}" for dex, tickers in HIP3_DEXES.items() for t in tickers] if source == "hip3_" else None
+    count = s.n(min(2000, 40 * max(1, window // TIMEFRAME_MS["1h"]) ** 0.5))
+    liquidations = sorted((s.liquidation(s.rng.choice(exchanges), window, coins) for _ in range(count)),
+                          key=lambda liq: liq["timestamp"], reverse=True)
+    if source == "hip3_":
+        for liq in liquidations:
+            liq["category"] = HIP3_CATEGORIES.get(liq["coin"].split(":")[1], "stocks")
+    stats = _liquidation_stats(liquidations)
+    del stats["largest"]
+    return {"timeframe": timeframe, "count": len(liquidations), "stats": stats, "liquidations": liquidations,
+            "updated_at": s.now}
+
+
+def _liquidation_stats_payload(s, m, q):
+    source = m.group(1) or ""
+    exchanges = EXCHANGES if source == "all_" else ["hyperliquid"]
+    coins = [f"{dex}:{t}" for dex, tickers in HIP3_DEXES.items() for t in tickers] if source == "hip3_" else None
+    windows = {}
+    for timeframe in ("10m", "1h", "4h", "12h", "24h", "7d"):
+        window = TIMEFRAME_MS[timeframe]
+        count = s.n(min(1000, 40 * max(1, window // TIMEFRAME_MS["1h"]) ** 0.5))
+        windows[timeframe] = _liquidation_stats([s.liquidation(s.rng.choice(exchanges), window, coins)
+                                                 for _ in range(count)])
+    overall = dict(windows["24h"])
+    overall.pop("largest")
+    if source == "hip3_":
+        overall["by_category"] = {c: {"count": s.rng.randrange(100), "volume": s.usd(1e4, 1e7)}
+                                  for c in ("stocks", "commodities", "indices", "fx")}
+        overall["by_symbol"] = overall["by_coin"]
+        overall["top_symbols"] = sorted(overall["by_coin"], key=lambda c: overall["by_coin"][c]["volume"],
+                                        reverse=True)[:10]
+    return {**overall, "windows": windows, "by_side": {"long": overall["long_volume"], "short": overall["short_volume"]},
+            "updated_at": s.now}
+
+
+def _positions(s, m, q):
+    return {**s.positions_block(POSITION_SYMBOLS, s.n(50)), "min_position_value": 200000, "updated_at": s.now}
+
+
+def _all_positions(s, m, q):
+    symbols = {}
+    for coin in POSITION_SYMBOLS:
+        block = s.positions_block([coin], s.n(25))
+        block["total_value"] = round(block["total_long_value"] + block["total_short_value"], 2)
+        symbols[coin] = block
+    return {"symbols": symbols, "count": len(symbols), "updated_at": s.now}
+
+
+def _whales(s, m, q):
+    trades = []
+    for _ in range(s.n(200)):
+        coin, t = s.coin(), s.when(TIMEFRAME_MS["24h"])
+        value = s.usd(25_000, 10_000_000)
+        trades.append({"coin": coin, "side": s.rng.choice(["buy", "sell"]), "price": _round(_price_at(coin, t)),
+                       "value_usd": value, "address": s.address(), "timestamp": t})
+    return {"trades": sorted(trades, key=lambda t: t["timestamp"], reverse=True), "count": len(trades)}
+
+
+def _whale_addresses(s, m, q):
+    return "\n".join(s.address() for _ in range(s.n(500))) + "\n"
+
+
+def _buyers(s, m, q):
+    buyers = [{"address": s.address(), "coin": s.coin(FLOW_COINS), "value_usd": s.usd(5_000, 2_000_000),
+               "timestamp": s.when(TIMEFRAME_MS["24h"])} for _ in range(s.n(200))]
+    return {"buyers": buyers, "count": len(buyers), "updated_at": s.now}
+
+
+def _depositors(s, m, q):
+    depositors = [{"address": s.address(), "total_deposited": s.usd(1_000, 5_000_000),
+                   "deposit_count": s.rng.randrange(1, 40), "last_deposit": s.when(TIMEFRAME_MS["30d"])}
+                  for _ in range(s.n(500))]
+    return {"depositors": depositors, "count": len(depositors), "updated_at": s.now}
+
+
+def _events(s, m, q):
+    events = [{"type": s.rng.choice(EVENT_TYPES), "address": s.address(), "value_usd": s.usd(1_000, 5_000_000),
+               "tx_hash": "0x%064x" % s.rng.getrandbits(256), "timestamp": s.when(TIMEFRAME_MS["1h"])}
+              for _ in range(s.n(300))]
+    by_type = {}
+    for event in events:
+        by_type[event["type"]] = by_type.get(event["type"], 0) + 1
+    return {"events": sorted(events, key=lambda e: e["timestamp"], reverse=True),
+            "stats": {"total_events": len(events), "events_by_type": by_type}}
+
+
+def _contracts(s, m, q):
+    contracts = [{"address": s.address(), "name": f"Contract {i}", "type": s.rng.choice(["token", "vault", "bridge"]),
+                  "tvl_usd": s.usd(1_000, 100_000_000), "first_seen": s.when(TIMEFRAME_MS["30d"])}
+                 for i in range(s.n(150))]
+    return {"contracts": contracts, "count": len(contracts),
+            "high_value_count": sum(1 for c in contracts if c["tvl_usd"] > 1_000_000)}
+
+
+def _tick_stats(s, m, q):
+    return {"symbols": CANDLE_SYMBOLS, "symbol_count": len(CANDLE_SYMBOLS),
+            "collector_stats": {"ticks_collected": s.rng.randrange(10**8, 10**9), "uptime_seconds": 86400},
+            "updated_at": s.now}
+
+
+def _tick_latest(s, m, q):
+    return {coin: _round(_price_at(coin, s.now)) for coin in CANDLE_SYMBOLS}
+
+
+def _ticks(s, m, q):
+    symbol = m.group(1).upper()
+    end = _int(q, "endTime", s.now)
+    start = _int(q, "startTime", end - _window(q, "duration", "1h"))
+    limit = _int(q, "limit", 10000)
+    step = max(500, int(2000 / s.scale))  # One tick every 2 s at scale 1
+    first = start - start % step + step
+    times = range(max(first, end - limit * step), end + 1, step)
+    ticks = [{"t": t, "p": _round(_price_at(symbol, t))} for t in times]
+    return {"symbol": symbol, "duration": q.get("duration", "1h"), "tick_count": len(ticks),
+            "latest_price": ticks[-1]["p"] if ticks else None, "ticks": ticks}
+
+
+def _trade(s, coin, window):
+    t = s.when(window)
+    price = _price_at(coin, t)
+    value = s.usd(100, 2_000_000)
+    return {"coin": coin, "side": s.rng.choice(["buy", "sell"]), "price": _round(price), "size": _round(value / price),
+            "value_usd": value, "timestamp": t}
+
+
+def _trades(s, m, q):
+    return sorted((_trade(s, s.coin(FLOW_COINS), TIMEFRAME_MS["10m"]) for _ in range(s.n(500))),
+                  key=lambda t: t["timestamp"], reverse=True)
+
+
+def _large_trades(s, m, q):
+    trades = [_trade(s, s.coin(FLOW_COINS), TIMEFRAME_MS["24h"]) for _ in range(s.n(200))]
+    for trade in trades:
+        trade["value_usd"] = s.usd(100_000, 20_000_000)
+    return sorted(trades, key=lambda t: t["timestamp"], reverse=True)
+
+
+def _imbalance_block(s):
+    buy, sell = s.usd(1e5, 1e8), s.usd(1e5, 1e8)
+    return {"buy_volume": buy, "sell_volume": sell, "net_flow": round(buy - sell, 2),
+            "imbalance": round((buy - sell) / (buy + sell), 4), "trade_count": s.rng.randrange(100, 100_000)}
+
+
+def _orderflow(s, m, q):
+    return {"timeframes": {tf: _imbalance_block(s) for tf in ("5m", "15m", "1h", "4h", "24h")},
+            "by_coin": {coin: {tf: _imbalance_block(s) for tf in ("5m", "1h", "24h")} for coin in FLOW_COINS},
+            "updated_at": s.now}
+
+
+def _orderflow_stats(s, m, q):
+    return {"uptime_seconds": s.rng.randrange(3600, 10**7), "trades_processed": s.rng.randrange(10**6, 10**9),
+            "trades_per_second": round(s.rng.uniform(5, 200), 2), "coins": FLOW_COINS}
+
+
+def _imbalance(s, m, q):
+    return {"timeframe": m.group(1), **_imbalance_block(s),
+            "by_coin": {coin: _imbalance_block(s) for coin in FLOW_COINS}, "updated_at": s.now}
+
+
+def _trader(s, rank):
+    return {"rank": rank, "address": s.address(), "pnl": round(s.rng.uniform(-5e6, 2e7), 2),
+            "win_rate": round(s.rng.uniform(0.2, 0.8), 3), "volume": s.usd(1e5, 1e9),
+            "trades": s.rng.randrange(10, 20_000)}
+
+
+def _smart_money_rankings(s, m, q):
+    return {"smart_money": [_trader(s, i + 1) for i in range(s.n(100))],
+            "dumb_money": [_trader(s, i + 1) for i in range(s.n(100))], "updated_at": s.now}
+
+
+def _smart_money_leaderboard(s, m, q):
+    return {"leaderboard": [_trader(s, i + 1) for i in range(s.n(50))], "updated_at": s.now}
+
+
+def _smart_money_signals(s, m, q):
+    signals = [{"coin": s.coin(FLOW_COINS), "signal": s.rng.choice(["bullish", "bearish", "neutral"]),
+                "smart_net_flow": round(s.rng.uniform(-5e6, 5e6), 2), "confidence": round(s.rng.random(), 2),
+                "timestamp": s.when(TIMEFRAME_MS.get(m.group(1), TIMEFRAME_MS["1h"]))} for _ in range(s.n(50))]
+    return {"timeframe": m.group(1), "signals": signals, "updated_at": s.now}
+
+
+def _hip3_symbols(s):
+    symbols = []
+    for dex, tickers in HIP3_DEXES.items():
+        for ticker in tickers:
+            category = "crypto" if dex == "hyna" else HIP3_CATEGORIES.get(ticker, "stocks")
+            symbols.append({"symbol": f"{dex}:{ticker}", "dex": dex, "ticker": ticker, "category": category,
+                            "price": _round(_price_at(f"{dex}:{ticker}", s.now))})
+    return symbols
+
+
+def _hip3_meta(s, m, q):
+    symbols = _hip3_symbols(s)
+    dexes, categories = {}, {}
+    for symbol in symbols:
+        dexes.setdefault(symbol["dex"], []).append(symbol)
+        categories[symbol["category"]] = categories.get(symbol["category"], 0) + 1
+    return {"count": len(symbols), "dexes": dexes, "symbols": symbols, "categories": categories}
+
+
+def _hip3_tick_stats(s, m, q):
+    symbols = [symbol["symbol"] for symbol in _hip3_symbols(s)]
+    return {"total_symbols": len(symbols), "symbols": symbols, "total_ticks": s.rng.randrange(10**7, 10**8),
+            "by_dex": {dex: len(tickers) for dex, tickers in HIP3_DEXES.items()},
+            "last_update": s.now}
+
+
+def _hip3_ticks(s, m, q):
+    symbol = f"{m.group(1)}:{m.group(2).upper()}"
+    step = max(1000, int(5000 / s.scale))
+    end = s.now - s.now % step
+    ticks = [{"t": t, "p": _round(_price_at(symbol, t))} for t in range(end - 3600 * 1000, end + 1, step)]
+    return {"symbol": symbol, "tick_count": len(ticks), "ticks": ticks}
+
+
+def _user_positions(s, m, q):
+    positions = [s.position(s.coin(), s.rng.choice(["long", "short"])) for _ in range(s.rng.randrange(1, 12))]
+    return {"address": m.group(1), "positions": positions,
+            "account_value": round(sum(p["value"] for p in positions) / 5, 2), "timestamp": s.now}
+
+
+def _wallet_fills(s, address, hl_format):
+    """Every fill of a wallet, newest first - stable across calls"""
+    s.rng.seed(address)
+    count = s.n(s.rng.choice([50, 300, 2000, 8000]))
+    start = s.now - TIMEFRAME_MS["30d"]
+    times = sorted(s.rng.randrange(start, s.now) for _ in range(count))
+    base_tid = s.rng.randrange(10**11, 2 * 10**11)
+    coins = [s.coin() for _ in range(s.rng.randrange(1, 8))]
+    fills = [s.fill(s.rng.choice(coins), t, base_tid + i, hl_format) for i, t in enumerate(times)]
+    fills.reverse()
+    return fills
+
+
+def _user_fills(s, m, q):
+    fills = _wallet_fills(s, m.group(1).lower(), hl_format=False)
+    limit = _int(q, "limit", 100)
+    page = fills if limit == -1 else fills[:limit]
+    return {"fills": page, "total": len(fills), "limit": limit, "address": m.group(1)}
+
+
+def _fills(s, m, q):
+    return _wallet_fills(s, m.group(1).lower(), hl_format=True)[:max(0, _int(q, "limit", 100))]
+
+
+def _position_snapshots(s, m, q):
+    symbol = m.group(1).upper()
+    hours, limit = _int(q, "hours", 24), _int(q, "limit", 1000)
+    side = q.get("side")
+    snapshots = []
+    for _ in range(min(limit, s.n(1000))):
+        position = s.position(symbol, side or s.rng.choice(["long", "short"]))
+        snapshots.append({"timestamp": s.when(hours * TIMEFRAME_MS["1h"]), "address": position["address"],
+                          "side": position["side"], "position_value": position["value"],
+                          "entry_price": position["entry_price"], "liquidation_price": position["liq_price"],
+                          "distance_pct": min(15.0, position["distance_pct"]), "leverage": position["leverage"]})
+    snapshots.sort(key=lambda snap: snap["timestamp"], reverse=True)
+    return {"symbol": symbol, "hours": hours, "count": len(snapshots), "snapshots": snapshots}
+
+
+def _position_snapshot_stats(s, m, q):
+    by_symbol = {coin: {"snapshots": s.rng.randrange(100, 50_000), "unique_users": s.rng.randrange(10, 2000),
+                        "avg_distance_pct": round(s.rng.uniform(2, 12), 2)} for coin in FLOW_COINS}
+    closest = [s.position(s.coin(FLOW_COINS), s.rng.choice(["long", "short"])) for _ in range(10)]
+    return {"overall": {"total_snapshots": sum(b["snapshots"] for b in by_symbol.values()),
+                        "unique_users": sum(b["unique_users"] for b in by_symbol.values()),
+                        "avg_distance_pct": round(s.rng.uniform(2, 12), 2)},
+            "by_symbol": by_symbol, "top_10_closest": sorted(closest, key=lambda p: p["distance_pct"]),
+            "scan_metadata": {"last_scan": s.now, "interval_seconds": 60}}
+
+
+def _prices(s, m, q):
+    return {"timestamp": s.now, "count": len(PRICE_SYMBOLS),
+            "prices": {coin: f"{_price_at(coin, s.now):.6g}" for coin in PRICE_SYMBOLS},
+            "funding_rates": {coin: f"{s.rng.uniform(-0.0005, 0.0005):.7f}" for coin in PRICE_SYMBOLS},
+            "open_interest": {coin: f"{s.usd(1e5, 5e9):.2f}" for coin in PRICE_SYMBOLS}}
+
+
+def _book(s, coin, depth):
+    mid = _price_at(coin, s.now)
+    tick = mid * 0.0001
+    bids = [{"px": f"{mid - tick * (i + 0.5):.6g}", "sz": f"{s.rng.uniform(0.01, 50):.4f}", "n": s.rng.randrange(1, 30)}
+            for i in range(depth)]
+    asks = [{"px": f"{mid + tick * (i + 0.5):.6g}", "sz": f"{s.rng.uniform(0.01, 50):.4f}", "n": s.rng.randrange(1, 30)}
+            for i in range(depth)]
+    best_bid, best_ask = float(bids[0]["px"]), float(asks[0]["px"])
+    return {"coin": coin, "timestamp": s.now, "levels": [bids, asks], "best_bid": best_bid, "best_ask": best_ask,
+            "best_bid_size": float(bids[0]["sz"]), "best_ask_size": float(asks[0]["sz"]),
+            "mid_price": _round((best_bid + best_ask) / 2), "spread": _round(best_ask - best_bid),
+            "spread_bps": round((best_ask - best_bid) / mid * 10_000, 3), "bid_depth": depth, "ask_depth": depth}
+
+
+def _price(s, m, q):
+    book = _book(s, m.group(1).upper(), 1)
+    del book["levels"], book["bid_depth"], book["ask_depth"]
+    return book
+
+
+def _orderbook(s, m, q):
+    return _book(s, m.group(1).upper(), s.n(20))
+
+
+def _account(s, m, q):
+    positions = []
+    for _ in range(s.rng.randrange(0, 10)):
+        coin = s.coin()
+        entry = _price_at(coin, s.now) * s.rng.uniform(0.9, 1.1)
+        size = _round(s.usd(1_000, 5_000_000) / entry) * s.rng.choice([1, -1])
+        positions.append({"type": "oneWay", "position": {
+            "coin": coin, "szi": f"{size}", "entryPx": f"{entry:.6g}", "positionValue": f"{abs(size) * entry:.2f}",
+            "unrealizedPnl": f"{abs(size) * entry * s.rng.uniform(-0.1, 0.1):.2f}",
+            "leverage": {"type": "cross", "value": s.rng.choice([3, 5, 10, 20])},
+            "liquidationPx": f"{entry * (0.8 if size > 0 else 1.2):.6g}"}})
+    total = sum(float(p["position"]["positionValue"]) for p in positions)
+    value = total / 4 + s.usd(100, 1_000_000)
+    summary = {"accountValue": f"{value:.2f}", "totalNtlPos": f"{total:.2f}", "totalRawUsd": f"{value:.2f}",
+               "totalMarginUsed": f"{total / 10:.2f}"}
+    return {"address": m.group(1), "timestamp": s.now, "marginSummary": summary, "crossMarginSummary": summary,
+            "assetPositions": positions, "withdrawable": f"{max(0.0, value - total / 10):.2f}",
+            "account_value": round(value, 2)}
+
+
+def _candle_symbols(s, m, q):
+    return {"symbols": CANDLE_SYMBOLS, "count": len(CANDLE_SYMBOLS), "volume_threshold": 750000,
+            "intervals": list(INTERVAL_MS), "symbol_details": {c: {"price": _round(_price_at(c, s.now))}
+                                                              for c in CANDLE_SYMBOLS}}
+
+
+def _candles(s, m, q):
+    coin, interval = m.group(1).upper(), q.get("interval", "5m")
+    step = INTERVAL_MS.get(interval, INTERVAL_MS["5m"])
+    end = min(_int(q, "endTime", s.now), s.now)
+    start = _int(q, "startTime", end - 500 * step)
+    first = start - start % step + (step if start % step else 0)
+    opens = range(max(first, end - end % step - 4999 * step), end + 1, step)
+    candles = []
+    for t in opens:
+        prices = [_price_at(coin, t + k * step // 4) for k in range(4)]
+        candles.append({"t": t, "T": t + step - 1, "s": coin, "i": interval, "o": f"{prices[0]:.6g}",
+                        "h": f"{max(prices):.6g}", "l": f"{min(prices):.6g}", "c": f"{prices[-1]:.6g}",
+                        "v": f"{zlib.crc32(f'{coin}{t}'.encode()) % 100000 / 10:.1f}",
+                        "n": zlib.crc32(f"{t}{coin}".encode()) % 500})
+    return candles
+
+
+def _hlp_positions(s, m, q):
+    combined = []
+    for coin in CANDLE_SYMBOLS[:s.n(40)]:
+        long_size, short_size = s.rng.uniform(0, 1000), s.rng.uniform(0, 1000)
+        net = long_size - short_size
+        combined.append({"coin": coin, "net_size": _round(net), "net_value": round(net * _price_at(coin, s.now), 2),
+                         "long_strategies": s.rng.sample(HLP_STRATEGIES, 2),
+                         "short_strategies": s.rng.sample(HLP_STRATEGIES, 1),
+                         "total_long": _round(long_size), "total_short": _round(short_size)})
+    net_exposure = sum(p["net_value"] for p in combined)
+    payload = {"summary": {"total_account_value": 210_000_000 + s.rng.randrange(-5_000_000, 5_000_000),
+                           "total_positions": len(combined), "net_exposure": round(net_exposure, 2)},
+               "combined_positions": combined, "updated_at": s.now}
+    if q.get("include_strategies") != "false":
+        payload["strategies"] = [{"name": name, "address": s.address(), "account_value": s.usd(1e6, 1e8),
+                                  "positions": s.rng.randrange(0, 40)} for name in HLP_STRATEGIES]
+    return payload
+
+
+def _hlp_trades(s, m, q):
+    limit = _int(q, "limit", 100)
+    trades = [{**s.fill(s.coin(), s.when(TIMEFRAME_MS["24h"]), s.rng.randrange(10**11, 10**12)),
+               "strategy": s.rng.choice(HLP_STRATEGIES)} for _ in range(min(limit, s.n(5000)))]
+    return {"trades": sorted(trades, key=lambda t: t["time"], reverse=True), "total": s.n(250_000),
+            "strategies": HLP_STRATEGIES}
+
+
+def _hlp_trade_stats(s, m, q):
+    return {"total_trades": s.n(250_000), "total_volume": s.usd(1e9, 1e10), "total_fees": s.usd(1e5, 1e7),
+            "date_range": {"first": s.now - TIMEFRAME_MS["30d"], "last": s.now},
+            "by_strategy": {name: s.usd(1e6, 1e9) for name in HLP_STRATEGIES},
+            "by_coin": {coin: s.usd(1e5, 1e9) for coin in CANDLE_SYMBOLS[:20]}}
+
+
+def _hlp_history(s, m, q):
+    hours = _int(q, "hours", 24)
+    step = max(10_000, int(60_000 / s.scale))
+    end = s.now - s.now % step
+    snapshots = [{"timestamp": t, "total_account_value": round(210e6 + 2e6 * math.sin(t / 7e6), 2),
+                  "net_exposure_delta": round(5e6 * math.sin(t / 1e7 + 1), 2), "total_positions": 40 + t // step % 7}
+                 for t in range(end - hours * TIMEFRAME_MS["1h"], end + 1, step)]
+    return {"snapshots": snapshots, "interval": f"{step // 1000}s", "count": len(snapshots)}
+
+
+def _hlp_deltas(s, m, q):
+    hours = _int(q, "hours", 24)
+    step = max(10_000, int(60_000 / s.scale))
+    end = s.now - s.now % step
+    deltas = []
+    for t in range(end - hours * TIMEFRAME_MS["1h"], end + 1, step):
+        long_exposure = round(60e6 + 5e6 * math.sin(t / 9e6), 2)
+        short_exposure = round(58e6 + 5e6 * math.cos(t / 8e6), 2)
+        deltas.append({"timestamp": t, "net_delta": round(long_exposure - short_exposure, 2),
+                       "long_exposure": long_exposure, "short_exposure": short_exposure})
+    return {"deltas": deltas, "current": deltas[-1]["net_delta"],
+            "change_24h": round(deltas[-1]["net_delta"] - deltas[0]["net_delta"], 2)}
+
+
+def _hlp_sentiment(s, m, q):
+    z_score = round(s.rng.uniform(-3, 3), 2)
+    signal = ("Retail heavily SHORT" if z_score > 2 else "Retail heavily LONG" if z_score < -2
+              else "Retail leaning SHORT" if z_score > 1 else "Retail leaning LONG" if z_score < -1 else "Neutral")
+    return {"net_delta": round(s.rng.uniform(-2e7, 2e7), 2), "z_score": z_score, "signal": signal,
+            "percentile": round(s.rng.uniform(0, 100), 1), "timestamp": s.now}
+
+
+def _hlp_liquidators(s, m, q):
+    return {"events": [{"liquidator": s.rng.choice(HLP_STRATEGIES[2:6]), "activated_at": s.when(TIMEFRAME_MS["7d"]),
+                        "value_usd": s.usd(1e4, 1e7)} for _ in range(s.n(50))],
+            "liquidators": _hlp_liquidator_status(s, m, q)["liquidators"]}
+
+
+def _hlp_liquidator_status(s, m, q):
+    return {"liquidators": [{"name": name, "address": s.address(), "status": s.rng.choice(["active", "idle"]),
+                             "pnl_24h": round(s.rng.uniform(-1e5, 5e5), 2)} for name in HLP_STRATEGIES[2:6]],
+            "timestamp": s.now}
+
+
+def _hlp_market_maker(s, m, q):
+    return {"coins": {coin: {"position": _round(s.rng.uniform(-500, 500)), "orders": s.rng.randrange(10, 400),
+                             "fills_1h": s.rng.randrange(0, 2000)} for coin in ("BTC", "ETH", "SOL")},
+            "timestamp": s.now}
+
+
+def _hlp_timing(s, m, q):
+    return {"by_hour": {str(h): round(s.rng.uniform(-1e5, 3e5), 2) for h in range(24)},
+            "by_session": {name: round(s.rng.uniform(-1e6, 3e6), 2) for name in ("asia", "europe", "us")}}
+
+
+def _hlp_correlation(s, m, q):
+    return {"correlations": {coin: round(s.rng.uniform(-1, 1), 3) for coin in CANDLE_SYMBOLS[:20]},
+            "window_hours": 24}
+
+
+def _hlp_delta(s, m, q):
+    long_exposure, short_exposure = s.usd(4e7, 8e7), s.usd(4e7, 8e7)
+    return {"net_delta": round(long_exposure - short_exposure, 2), "long_exposure": long_exposure,
+            "short_exposure": short_exposure, "position_count": s.rng.randrange(40, 200), "timestamp": s.now}
+
+
+def _hlp_flips(s, m, q):
+    flips = []
+    for _ in range(s.n(60)):
+        from_direction = s.rng.choice(["long", "short"])
+        t = s.when(TIMEFRAME_MS["30d"])
+        flips.append({"datetime": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t / 1000)),
+                      "from_direction": from_direction,
+                      "to_direction": "short" if from_direction == "long" else "long",
+                      "from_delta": round(s.rng.uniform(1e5, 1e7), 2) * (1 if from_direction == "long" else -1),
+                      "to_delta": round(s.rng.uniform(1e5, 1e7), 2) * (-1 if from_direction == "long" else 1),
+                      "hold_duration_hours": round(s.rng.uniform(0.5, 72), 1),
+                      "btc_price": round(_price_at("BTC", t)), "eth_price": round(_price_at("ETH", t))})
+    return sorted(flips, key=lambda flip: flip["datetime"], reverse=True)
+
+
+def _hlp_flip_stats(s, m, q):
+    return {"total_flips": s.n(60), "avg_hold_duration_hours": round(s.rng.uniform(2, 24), 1),
+            "long_to_short_count": s.n(30), "short_to_long_count": s.n(30),
+            "current_direction": s.rng.choice(["long", "short"]), "current_hold_hours": round(s.rng.uniform(0, 48), 1)}
+
+
+_ADDRESS = r"(0x[0-9a-fA-F]+)"
+ROUTES = [(re.compile(f"^{pattern}$"), handler) for pattern, handler in [
+    (r"/health", _health),
+    (r"/api/(|all_|binance_|bybit_|okx_|hip3_)liquidations/stats\.json", _liquidation_stats_payload),
+    (r"/api/(|all_|binance_|bybit_|okx_|hip3_)liquidations/(\w+)\.json", _liquidations),
+    (r"/api/positions\.json", _positions),
+    (r"/api/positions/all\.json", _all_positions),
+    (r"/api/whales\.json", _whales),
+    (r"/api/whale_addresses\.txt", _whale_addresses),
+    (r"/api/buyers\.json", _buyers),
+    (r"/api/depositors\.json", _depositors),
+    (r"/api/events\.json", _events),
+    (r"/api/contracts\.json", _contracts),
+    (r"/api/ticks/stats\.json", _tick_stats),
+    (r"/api/ticks/latest\.json", _tick_latest),
+    (r"/api/ticks/([\w:]+?)(?:_\w+\.json)?", _ticks),
+    (r"/api/trades\.json", _trades),
+    (r"/api/large_trades\.json", _large_trades),
+    (r"/api/orderflow\.json", _orderflow),
+    (r"/api/orderflow/stats\.json", _orderflow_stats),
+    (r"/api/imbalance/(\w+)\.json", _imbalance),
+    (r"/api/smart_money/rankings\.json", _smart_money_rankings),
+    (r"/api/smart_money/leaderboard\.json", _smart_money_leaderboard),
+    (r"/api/smart_money/signals_(\w+)\.json", _smart_money_signals),
+    (r"/api/hip3/meta", _hip3_meta),
+    (r"/api/hip3_ticks/stats\.json", _hip3_tick_stats),
+    (r"/api/hip3_ticks/(\w+?)_(\w+)\.json", _hip3_ticks),
+    (rf"/api/user/{_ADDRESS}/positions", _user_positions),
+    (rf"/api/user/{_ADDRESS}/fills", _user_fills),
+    (r"/api/position_snapshots/stats", _position_snapshot_stats),
+    (r"/api/position_snapshots/symbol/(\w+)", _position_snapshots),
+    (r"/api/prices", _prices),
+    (r"/api/price/(\w+)", _price),
+    (r"/api/orderbook/(\w+)", _orderbook),
+    (rf"/api/account/{_ADDRESS}", _account),
+    (rf"/api/fills/{_ADDRESS}", _fills),
+    (r"/api/candles/symbols", _candle_symbols),
+    (r"/api/candles/(\w+)", _candles),
+    (r"/api/hlp/positions", _hlp_positions),
+    (r"/api/hlp/positions/history", _hlp_history),
+    (r"/api/hlp/trades", _hlp_trades),
+    (r"/api/hlp/trades/stats", _hlp_trade_stats),
+    (r"/api/hlp/liquidators", _hlp_liquidators),
+    (r"/api/hlp/liquidators/status", _hlp_liquidator_status),
+    (r"/api/hlp/deltas", _hlp_deltas),
+    (r"/api/hlp/sentiment", _hlp_sentiment),
+    (r"/api/hlp/market-maker", _hlp_market_maker),
+    (r"/api/hlp/timing", _hlp_timing),
+    (r"/api/hlp/correlation", _hlp_correlation),
+    (r"/api/hlp/delta", _hlp_delta),
+    (r"/api/hlp/flips", _hlp_flips),
+    (r"/api/hlp/flip-stats", _hlp_flip_stats),
+]]
+
+
+# ==================== SERVER ====================
+class MockDataLayer:
+    """
+    🌙 Moon Dev's Mock Data Layer Server
+
+    Args:
+        fixtures: Fixture directory recorded with data_layer.recording (optional).
+                  Recorded URLs are replayed, everything else is synthesized.
+        scale: Payload size multiplier (1.0 ~ production sizes)
+        latency: Seconds of artificial latency added to every response
+        error_rate: Fraction of /api requests answered with 503 (exercises retries)
+        api_key: Require this X-API-Key on /api paths (default: accept anything)
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+    """
+
+    def __init__(self, fixtures=None, scale=1.0, latency=0.0, error_rate=0.0, api_key=None,
+                 host="127.0.0.1", port=0):
+        self.fixtures = FixtureStore(fixtures) if fixtures else None
+        self.scale = scale
+        self.latency = latency
+        self.error_rate = error_rate
+        self.api_key = api_key
+        self.started_at = int(time.time() * 1000)
+        self.requests = 0
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve from a background thread; returns base_url"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="moondev-mock", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def respond(self, target):
+        """(status, content_type, body) for a request target like '/api/x?limit=5'"""
+        key = fixture_key(target)
+        if self.fixtures is not None:
+            recorded = self.fixtures.lookup(key)
+            if recorded is not None:
+                return recorded
+
+        with self._lock:
+            cached = self._bodies.get(key)
+        if cached is not None:
+            return cached
+
+        parts = urlsplit(key)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        for pattern, handler in ROUTES:
+            match = pattern.match(parts.path)
+            if match:
+                break
+        else:
+            return 404, "application/json", b'{"error": "Not found"}'
+
+        synth = _Synth(zlib.crc32(key.encode()), self.scale, self.started_at)
+        payload = handler(synth, match, query)
+        if isinstance(payload, str):
+            response = 200, "text/plain", payload.encode()
+        else:
+            response = 200, "application/json", json.dumps(payload, separators=(",", ":")).encode()
+
+        with self._lock:
+            if len(self._bodies) >= BODY_CACHE_SIZE:
+                self._bodies.clear()
+            self._bodies[key] = response
+        return response
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+        disable_nagle_algorithm = True
+        wbufsize = -1                   # Headers and body leave in one write
+
+        def do_GET(self):
+            with server._lock:
+                server.requests += 1
+            if server.latency:
+                time.sleep(server.latency)
+
+            is_api = self.path.startswith("/api/")
+            if is_api and server.api_key:
+                query = parse_qs(urlsplit(self.path).query)
+                supplied = self.headers.get("X-API-Key") or query.get("api_key", [None])[0]
+                if supplied != server.api_key:
+                    return self._send(401, "application/json", b'{"error": "Invalid API key"}')
+            if is_api and server.error_rate and random.random() < server.error_rate:
+                return self._send(503, "application/json", b'{"error": "Service unavailable"}',
+                                  {"Retry-After": "0"})
+
+            status, content_type, body = server.respond(self.path)
+            etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+            if status == 200 and self.headers.get("If-None-Match") == etag:
+                return self._send(304, content_type, b"", {"ETag": etag})
+            self._send(status, content_type, body, {"ETag": etag} if status == 200 else None)
+
+        def _send(self, status, content_type, body, headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="🌙 Moon Dev's mock Data Layer server")
+    parser.add_argument("--fixtures", help="Fixture directory to replay (see data_layer.recording)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Payload size multiplier (default: 1.0)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--api-key", help="Require this API key (default: accept any)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    server = MockDataLayer(fixtures=args.fixtures, scale=args.scale, latency=args.latency,
+                           error_rate=args.error_rate, api_key=args.api_key, host=args.host, port=args.port)
+    replaying = f", replaying {len(server.fixtures)} fixtures" if server.fixtures else ""
+    print(f"🌙 Moon Dev mock Data Layer on {server.base_url} (scale {args.scale}{replaying})")
+    print(f"   MOONDEV_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
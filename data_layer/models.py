@@ -0,0 +1,206 @@
+"""
+🌙 Moon Dev's Typed Response Models
+Compact __slots__ records with prices and sizes parsed to floats once
+
+Built with love by Moon Dev 🚀
+
+The API sends most numbers as strings ('px': '45000.0'), so every consumer
+ends up calling float() per field per loop. In the "typed" response format
+the client converts them exactly once at the boundary:
+
+    from api import MoonDevAPI
+
+    api = MoonDevAPI(response_format="typed")
+    for fill in api.get_fills("0x..."):
+        print(fill.coin, fill.px * fill.sz, fill.closed_pnl)
+
+    book = api.as_format("typed").get_orderbook("BTC")
+    print(book.bids[0].px, book.spread_bps)
+"""
+
+
+def _float(value, default=0.0):
+    """float() that tolerates missing values"""
+    return float(value) if value is not None else default
+
+
+class Record:
+    """Base for the compact records - no per-instance __dict__"""
+
+    __slots__ = ()
+
+    def to_dict(self):
+        """Plain dict of the record's fields"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Fill(Record):
+    """One trade fill (get_fills / get_user_fills)"""
+
+    __slots__ = ("coin", "side", "px", "sz", "time", "dir", "closed_pnl", "fee",
+                 "start_position", "crossed", "tid", "oid", "hash")
+
+    @classmethod
+    def from_dict(cls, d):
+        fill = cls.__new__(cls)
+        fill.coin = d.get('coin')
+        fill.side = d.get('side')
+        fill.px = _float(d.get('px'))
+        fill.sz = _float(d.get('sz'))
+        fill.time = d.get('time')
+        fill.dir = d.get('dir')
+        fill.closed_pnl = _float(d.get('closedPnl'))
+        fill.fee = _float(d.get('fee'))
+        fill.start_position = _float(d.get('startPosition'))
+        fill.crossed = d.get('crossed')
+        fill.tid = d.get('tid')
+        fill.oid = d.get('oid')
+        fill.hash = d.get('hash')
+        return fill
+
+    @property
+    def is_buy(self):
+        return self.side == 'B'
+
+    @property
+    def notional(self):
+        return self.px * self.sz
+
+
+class Candle(Record):
+    """One OHLCV candle (get_candles)"""
+
+    __slots__ = ("time", "close_time", "coin", "interval", "open", "high", "low", "close",
+                 "volume", "trades")
+
+    @classmethod
+    def from_dict(cls, d):
+        candle = cls.__new__(cls)
+        candle.time = d.get('t')
+        candle.close_time = d.get('T')
+        candle.coin = d.get('s')
+        candle.interval = d.get('i')
+        candle.open = _float(d.get('o'))
+        candle.high = _float(d.get('h'))
+        candle.low = _float(d.get('l'))
+        candle.close = _float(d.get('c'))
+        candle.volume = _float(d.get('v'))
+        candle.trades = d.get('n', 0)
+        return candle
+
+
+class Tick(Record):
+    """One price tick (get_ticks)"""
+
+    __slots__ = ("time", "price")
+
+    @classmethod
+    def from_dict(cls, d):
+        tick = cls.__new__(cls)
+        tick.time = d.get('t')
+        tick.price = _float(d.get('p'))
+        return tick
+
+
+class BookLevel(Record):
+    """One L2 orderbook level"""
+
+    __slots__ = ("px", "sz", "n")
+
+    @classmethod
+    def from_dict(cls, d):
+        level = cls.__new__(cls)
+        level.px = _float(d.get('px'))
+        level.sz = _float(d.get('sz'))
+        level.n = d.get('n', 0)
+        return level
+
+
+class OrderBook(Record):
+    """Full L2 orderbook (get_orderbook) - bids high->low, asks low->high"""
+
+    __slots__ = ("coin", "timestamp", "bids", "asks", "best_bid", "best_ask", "mid_price",
+                 "spread", "spread_bps")
+
+    @classmethod
+    def from_dict(cls, d):
+        levels = d.get('levels') or [[], []]
+        book = cls.__new__(cls)
+        book.coin = d.get('coin')
+        book.timestamp = d.get('timestamp')
+        book.bids = [BookLevel.from_dict(level) for level in levels[0]]
+        book.asks = [BookLevel.from_dict(level) for level in levels[1]]
+        book.best_bid = _float(d.get('best_bid'))
+        book.best_ask = _float(d.get('best_ask'))
+        book.mid_price = _float(d.get('mid_price'))
+        book.spread = _float(d.get('spread'))
+        book.spread_bps = _float(d.get('spread_bps'))
+        return book
+
+
+class Position(Record):
+    """One large position near liquidation (get_positions)"""
+
+    __slots__ = ("address", "coin", "side", "value", "size", "leverage", "entry_price", "liq_price",
+                 "distance_pct", "pnl")
+
+    @classmethod
+    def from_dict(cls, d):
+        position = cls.__new__(cls)
+        position.address = d.get('address')
+        position.coin = d.get('coin')
+        position.side = d.get('side')
+        position.value = _float(d.get('value'))
+        position.size = _float(d.get('size'), None)
+        position.leverage = _float(d.get('leverage'))
+        position.entry_price = _float(d.get('entry_price'))
+        position.liq_price = _float(d.get('liq_price'))
+        position.distance_pct = _float(d.get('distance_pct'), None)
+        position.pnl = _float(d.get('pnl'))
+        return position
+
+
+# ==================== ENDPOINT PARSERS ====================
+# Used by the client when response_format="typed". List endpoints become
+# lists of records, envelope endpoints keep their metadata dict with the
+# record list swapped in.
+
+def parse_fills(data):
+    """get_fills -> [Fill, ...]"""
+    return [Fill.from_dict(fill) for fill in data]
+
+
+def parse_user_fills(data):
+    """get_user_fills -> {..., 'fills': [Fill, ...]}"""
+    return {**data, 'fills': parse_fills(data.get('fills', []))}
+
+
+def parse_candles(data):
+    """get_candles -> [Candle, ...]"""
+    return [Candle.from_dict(candle) for candle in data]
+
+
+def parse_ticks(data):
+    """get_ticks -> {..., 'ticks': [Tick, ...]}"""
+    return {**data, 'ticks': [Tick.from_dict(tick) for tick in data.get('ticks', [])]}
+
+
+def parse_orderbook(data):
+    """get_orderbook -> OrderBook"""
+    return OrderBook.from_dict(data)
+
+
+def parse_positions(data):
+    """get_positions -> {..., 'longs': [Position, ...], 'shorts': [Position, ...]}"""
+    return {
+        **data,
+        'longs': [Position.from_dict(p) for p in data.get('longs', [])],
+        'shorts': [Position.from_dict(p) for p in data.get('shorts', [])],
+    }
@@ -0,0 +1,236 @@
+"""
+🌙 Moon Dev's Position Diff
+Turn repeated position snapshots into compact change events
+
+Built with love by Moon Dev 🚀
+
+get_positions() refreshes every second, but a dashboard or alert only cares
+about what changed. PositionDiff remembers the previous snapshot keyed by
+(address, coin, side) and reports:
+
+    opened                  - a position appeared
+    closed                  - a position disappeared
+    resized                 - size moved by at least `min_resize` (1%), when the payload has sizes
+    closer_to_liquidation   - distance_pct dropped by at least `min_liq_move` (0.5 points)
+
+Size and liquidation moves are measured from the value at the last event,
+so slow drifts still fire once they add up, and an unchanged position costs
+a single comparison. Works with get_positions(), get_all_positions() and
+get_hlp_positions() payloads, as dicts or "typed" records. Resizes compare
+position size only. USD value moves with price, so a row without a size
+never reports a resize.
+
+Usage:
+    from data_layer import PositionDiff, Poller
+
+    diff = PositionDiff()
+
+    def on_positions(update):
+        for event in diff.update(update.data):
+            print(event.kind, event.coin, event.side, event.address, event.size, event.distance_pct)
+
+    poller.subscribe("positions", callback=on_positions)
+"""
+
+from collections import namedtuple
+
+# ============================================
+# 🎯 POSITION DIFF CONFIGURATION - Moon Dev
+# ============================================
+MIN_RESIZE = 0.01      # Relative size change worth an event
+MIN_LIQ_MOVE = 0.5     # Percentage points closer to liquidation worth an event
+HLP_ADDRESS = "HLP"    # Address used for HLP's combined (all-strategy) positions
+
+OPENED = "opened"
+CLOSED = "closed"
+RESIZED = "resized"
+CLOSER_TO_LIQUIDATION = "closer_to_liquidation"
+
+# ============================================
+
+
+class PositionEvent(namedtuple("PositionEvent", ["kind", "address", "coin", "side", "size", "previous_size",
+                                                 "distance_pct", "previous_distance_pct", "position"])):
+    """One change to one (address, coin, side) position - `position` is the raw entry"""
+
+    __slots__ = ()
+
+    @property
+    def key(self):
+        return self.address, self.coin, self.side
+
+
+class _Tracked:
+    """What PositionDiff remembers about one position"""
+
+    __slots__ = ("size", "distance", "ref_size", "ref_distance", "position")
+
+    def __init__(self, size, distance, position):
+        self.size = size
+        self.distance = distance
+        self.ref_size = size          # Size at the last event
+        self.ref_distance = distance  # Closest-since-last-event reference for liquidation moves
+        self.position = position
+
+
+def _field(position, name):
+    """Field of a raw dict or a typed record"""
+    if isinstance(position, dict):
+        return position.get(name)
+    return getattr(position, name, None)
+
+
+def _number(value):
+    return float(value) if value is not None else None
+
+
+# ==================== SNAPSHOT READERS ====================
+# Each yields (address, coin, side, size, distance_pct, position)
+
+def _side_rows(block, coin=None):
+    """longs/shorts lists of get_positions() or one get_all_positions() symbol"""
+    for side, entries in (("long", block.get("longs")), ("short", block.get("shorts"))):
+        for position in entries or ():
+            size = _number(_field(position, "size"))
+            yield (_field(position, "address"), _field(position, "coin") or coin, side,
+                   abs(size) if size is not None else None, _number(_field(position, "distance_pct")), position)
+
+
+def _hlp_rows(snapshot):
+    """Per-strategy positions of get_hlp_positions(), else its combined net positions"""
+    strategies = snapshot.get("strategies")
+    if isinstance(strategies, dict):
+        strategies = strategies.items()
+    elif isinstance(strategies, list):
+        strategies = [(s.get("name"), s) for s in strategies if isinstance(s, dict)]
+    else:
+        strategies = ()
+
+    found = False
+    for name, strategy in strategies:
+        positions = strategy.get("positions") if isinstance(strategy, dict) else None
+        if not isinstance(positions, list):
+            continue  # Summary only (a position count, not the positions)
+        found = True
+        address = strategy.get("address") or name
+        for position in positions:
+            size = float(position.get("size") or 0)
+            if size:
+                yield (address, position.get("coin"), "long" if size > 0 else "short", abs(size),
+                       _number(position.get("distance_pct")), position)
+    if found:
+        return
+
+    for position in snapshot.get("combined_positions") or ():
+        size = float(position.get("net_size") or 0)
+        if size:
+            yield HLP_ADDRESS, position.get("coin"), "long" if size > 0 else "short", abs(size), None, position
+
+
+def position_rows(snapshot):
+    """(address, coin, side, size, distance_pct, position) for every position in a snapshot"""
+    if "longs" in snapshot or "shorts" in snapshot:
+        return _side_rows(snapshot)
+    if isinstance(snapshot.get("symbols"), dict):
+        return (row for coin, block in snapshot["symbols"].items() for row in _side_rows(block, coin))
+    if "combined_positions" in snapshot or "strategies" in snapshot:
+        return _hlp_rows(snapshot)
+    raise ValueError("Unrecognized positions snapshot (expected get_positions, get_all_positions "
+                     "or get_hlp_positions data)")
+
+
+class PositionDiff:
+    """
+    🌙 Moon Dev's Position Diff
+
+    Feed it every snapshot of one endpoint with update() and act on the
+    events it returns. The first snapshot only sets the baseline, unless
+    emit_initial=True reports every position in it as opened. Passing the
+    same snapshot object again (a cache hit or a 304) returns no events
+    without looking at it.
+
+    Args:
+        min_resize: Relative size change that counts as resized (default: 1%)
+        min_liq_move: Percentage points closer to liquidation that count (default: 0.5)
+        emit_initial: Report the first snapshot's positions as opened (default: False)
+    """
+
+    def __init__(self, min_resize=MIN_RESIZE, min_liq_move=MIN_LIQ_MOVE, emit_initial=False):
+        self.min_resize = min_resize
+        self.min_liq_move = min_liq_move
+        self.emit_initial = emit_initial
+        self._state = {}  # (address, coin, side) -> _Tracked
+        self._snapshot = None
+        self.snapshots = 0
+        self.counts = {OPENED: 0, CLOSED: 0, RESIZED: 0, CLOSER_TO_LIQUIDATION: 0}
+
+    def __len__(self):
+        return len(self._state)
+
+    def positions(self):
+        """{(address, coin, side): latest raw position} as of the last snapshot"""
+        return {key: tracked.position for key, tracked in self._state.items()}
+
+    def reset(self):
+        """Forget the baseline - the next snapshot starts over"""
+        self._state = {}
+        self._snapshot = None
+        self.snapshots = 0
+
+    def update(self, snapshot):
+        """Diff a new snapshot against the previous one and return [PositionEvent, ...]"""
+        if snapshot is self._snapshot:
+            return []
+        initial = self.snapshots == 0
+        emit = self.emit_initial or not initial
+        self._snapshot = snapshot
+        self.snapshots += 1
+
+        previous, current, events = self._state, {}, []
+        opened = 0
+        min_resize, min_liq_move = self.min_resize, self.min_liq_move
+
+        for address, coin, side, size, distance, position in position_rows(snapshot):
+            key = (address, coin, side)
+            tracked = previous.get(key)
+            if tracked is None:
+                current[key] = _Tracked(size, distance, position)
+                opened += 1
+                if emit:
+                    events.append(PositionEvent(OPENED, address, coin, side, size, None, distance, None, position))
+                continue
+
+            current[key] = tracked
+            tracked.position = position
+            if size == tracked.size and distance == tracked.distance:
+                continue  # Unchanged - the common case
+            last_distance = tracked.distance
+            tracked.size, tracked.distance = size, distance
+
+            ref_size = tracked.ref_size
+            if size is None or ref_size is None:
+                tracked.ref_size = size  # No size to compare - never guess from USD value
+            elif abs(size - ref_size) >= min_resize * max(ref_size, size):
+                events.append(PositionEvent(RESIZED, address, coin, side, size, ref_size, distance,
+                                            last_distance, position))
+                tracked.ref_size = size
+
+            ref_distance = tracked.ref_distance
+            if distance is None or ref_distance is None or distance > ref_distance:
+                tracked.ref_distance = distance  # Moved away (or unknown) - measure from here
+            elif ref_distance - distance >= min_liq_move:
+                events.append(PositionEvent(CLOSER_TO_LIQUIDATION, address, coin, side, size, tracked.ref_size,
+                                            distance, ref_distance, position))
+                tracked.ref_distance = distance
+
+        if len(current) - opened < len(previous):  # Some previous positions weren't seen
+            for key in previous.keys() - current.keys():
+                tracked = previous[key]
+                closed_size = None if tracked.size is None else 0.0
+                events.append(PositionEvent(CLOSED, *key, closed_size, tracked.size, None, tracked.distance,
+                                            tracked.position))
+        self._state = current
+
+        for event in events:
+            self.counts[event.kind] += 1
+        return events
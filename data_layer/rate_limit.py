@@ -0,0 +1,146 @@
+"""
+🌙 Moon Dev's Rate Limiter
+Token bucket that keeps every client under the 3,600 requests/min quota
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from data_layer.rate_limit import RateLimiter
+
+    limiter = RateLimiter(headroom=0.1)         # 3,240 req/min, smoothed
+    limiter.acquire()                           # blocks until a token is free
+    print(f"{limiter.tokens:.1f} tokens left")
+
+    # Share one budget between several processes (dashboards, collectors...)
+    limiter = RateLimiter(state_file="/tmp/moondev_rate_limit")
+"""
+
+import os
+import time
+import struct
+import asyncio
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows - shared state file not supported
+    fcntl = None
+
+# ============================================
+# 🎯 RATE LIMIT CONFIGURATION - Moon Dev
+# ============================================
+
+RATE_LIMIT_PER_MINUTE = 3600  # Documented Moon Dev API quota
+DEFAULT_HEADROOM = 0.1        # Stay 10% under the quota
+
+# Shared state file layout: token level + last update (unix seconds)
+_STATE_FORMAT = "dd"
+_STATE_SIZE = struct.calcsize(_STATE_FORMAT)
+
+# ============================================
+
+
+class RateLimiter:
+    """
+    🌙 Moon Dev's Token Bucket Rate Limiter
+
+    Tokens refill continuously at (quota * (1 - headroom)) per minute and the
+    bucket holds at most `burst` tokens, so bursts get smoothed to the quota
+    instead of tripping HTTP 429s. Callers reserve tokens under a lock and
+    then sleep outside of it, which keeps the limiter thread-safe and fair.
+
+    Args:
+        requests_per_minute: Quota to respect (default: 3,600)
+        headroom: Fraction of the quota to leave unused (default: 0.1)
+        burst: Bucket size in tokens (default: one second of quota)
+        state_file: Optional path to share the bucket across processes
+    """
+
+    def __init__(self, requests_per_minute=RATE_LIMIT_PER_MINUTE, headroom=DEFAULT_HEADROOM,
+                 burst=None, state_file=None):
+        if not 0 <= headroom < 1:
+            raise ValueError("headroom must be in [0, 1)")
+        if state_file is not None and fcntl is None:
+            raise ValueError("Shared rate limit state_file needs fcntl (Unix only)")
+
+        self.rate = requests_per_minute * (1 - headroom) / 60.0
+        self.capacity = float(burst) if burst is not None else max(1.0, self.rate)
+        self.state_file = state_file
+
+        self._lock = threading.Lock()
+        self._fd = None
+        self._fd_pid = None
+
+        # Process-local state uses the monotonic clock, shared state needs wall time
+        self._clock = time.monotonic if state_file is None else time.time
+        self._tokens = self.capacity
+        self._updated = self._clock()
+
+    @contextmanager
+    def _state(self):
+        """Lock the bucket and yield its [tokens, updated] state for editing"""
+        with self._lock:
+            if self.state_file is None:
+                state = [self._tokens, self._updated]
+                yield state
+                self._tokens, self._updated = state
+                return
+
+            fd = self._state_fd()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                raw = os.pread(fd, _STATE_SIZE, 0)
+                if len(raw) == _STATE_SIZE:
+                    state = list(struct.unpack(_STATE_FORMAT, raw))
+                else:
+                    state = [self.capacity, self._clock()]
+                yield state
+                os.pwrite(fd, struct.pack(_STATE_FORMAT, *state), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _state_fd(self):
+        """Open the shared state file (reopened after fork so flock stays per-process)"""
+        if self._fd is None or self._fd_pid != os.getpid():
+            self._fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o644)
+            self._fd_pid = os.getpid()
+        return self._fd
+
+    def _level(self, state, now):
+        """Token level after refilling since the last update"""
+        return min(self.capacity, state[0] + (now - state[1]) * self.rate)
+
+    def _reserve(self, tokens):
+        """Take tokens (going negative if needed) and return how long to wait"""
+        with self._state() as state:
+            now = self._clock()
+            level = self._level(state, now) - tokens
+            state[0], state[1] = level, now
+        return max(0.0, -level / self.rate)
+
+    @property
+    def tokens(self):
+        """Current token level (negative = callers already queued for tokens)"""
+        with self._state() as state:
+            return self._level(state, self._clock())
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` are available. Returns seconds spent waiting."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens=1):
+        """Asyncio version of acquire() - sleeps without blocking the loop"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def close(self):
+        """Close the shared state file (if any)"""
+        if self._fd is not None and self._fd_pid == os.getpid():
+            os.close(self._fd)
+        self._fd = None
@@ -0,0 +1,119 @@
+"""
+🌙 Moon Dev's Response Recorder
+Capture real API responses into a fixture directory for offline replay
+
+Built with love by Moon Dev 🚀
+
+Mounts a requests transport adapter on the client's session. Every
+successful GET is written to the fixture directory together with a
+manifest.json index, which data_layer.mock_server replays later.
+API keys are never written: the key travels in a header, and any api_key
+query parameter is dropped from the fixture key.
+
+Usage:
+    from api import MoonDevAPI
+    from data_layer.recording import record_responses
+
+    api = MoonDevAPI()
+    record_responses(api, "fixtures/")
+    api.get_all_positions()        # saved to fixtures/
+    api.get_user_fills("0x...", -1)
+
+    # Later, offline:
+    #   python -m data_layer.mock_server --fixtures fixtures/
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests.adapters import HTTPAdapter
+
+MANIFEST = "manifest.json"
+
+
+def fixture_key(url):
+    """'https://api.moondev.com/api/x?limit=5&api_key=K' -> '/api/x?limit=5'"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "api_key"]
+    return parts.path + ("?" + urlencode(query) if query else "")
+
+
+def _fixture_filename(key, content_type):
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", key.strip("/"))[:100] or "root"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:8]
+    extension = ".txt" if content_type.startswith("text/plain") else ".json"
+    return f"{slug}_{digest}{extension}"
+
+
+class FixtureStore:
+    """
+    Fixture directory: one body file per recorded URL plus manifest.json
+    mapping fixture keys to {"file", "status", "content_type"}.
+
+    Args:
+        directory: Fixture directory (created if missing)
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.manifest = {}
+        manifest_path = os.path.join(directory, MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self.manifest = json.load(f)
+
+    def __len__(self):
+        return len(self.manifest)
+
+    def save(self, key, body, status=200, content_type="application/json"):
+        """Write one response body and update the manifest"""
+        filename = _fixture_filename(key, content_type)
+        with open(os.path.join(self.directory, filename), "wb") as f:
+            f.write(body)
+        with self._lock:
+            self.manifest[key] = {"file": filename, "status": status, "content_type": content_type}
+            tmp_path = os.path.join(self.directory, MANIFEST + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, os.path.join(self.directory, MANIFEST))
+
+    def lookup(self, key):
+        """(status, content_type, body) for a fixture key - exact match first, then path only"""
+        entry = self.manifest.get(key) or self.manifest.get(key.split("?", 1)[0])
+        if entry is None:
+            return None
+        with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+            return entry["status"], entry["content_type"], f.read()
+
+
+class RecordingAdapter(HTTPAdapter):
+    """requests transport adapter that saves every 200 response to a FixtureStore"""
+
+    def __init__(self, store, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if request.method == "GET" and response.status_code == 200:
+            content_type = response.headers.get("Content-Type", "application/json").split(";")[0]
+            self.store.save(fixture_key(request.url), response.content, 200, content_type)
+        return response
+
+
+def record_responses(api, directory):
+    """
+    Record every GET a MoonDevAPI makes to its base_url into `directory`.
+
+    Returns:
+        The FixtureStore being written to
+    """
+    store = FixtureStore(directory)
+    api.session.mount(api.base_url, RecordingAdapter(store))
+    return store
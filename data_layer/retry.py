@@ -0,0 +1,180 @@
+"""
+🌙 Moon Dev's Retry Policy
+Retry transient failures with jittered exponential backoff
+
+Built with love by Moon Dev 🚀
+
+One 502 or connection reset shouldn't kill a whole dashboard refresh.
+GETs that fail with 429/5xx or a network error are retried after
+min(max_backoff, backoff * 2^attempt) seconds, randomized with full jitter.
+A Retry-After header is used as the minimum wait. The call as a whole never
+runs longer than `deadline` seconds.
+
+Usage:
+    from api import MoonDevAPI
+    from data_layer import RetryPolicy
+
+    api = MoonDevAPI(retry=RetryPolicy(max_attempts=5, deadline=20))
+    ...
+    print(api.retry.stats())   # {'calls': 120, 'retries': 3, ...}
+"""
+
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+
+# ============================================
+# 🎯 RETRY CONFIGURATION - Moon Dev
+# ============================================
+MAX_ATTEMPTS = 4          # First try + 3 retries
+BACKOFF = 0.5             # Seconds before the first retry (doubles each time)
+MAX_BACKOFF = 10.0        # Cap for a single wait
+CONNECT_TIMEOUT = 5       # Seconds to establish a connection
+READ_TIMEOUT = 30         # Seconds to wait for response data
+DEADLINE = 60             # Seconds for one call, retries included
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_after_seconds(value):
+    """Parse a Retry-After header (seconds or an HTTP date) into seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    🌙 Moon Dev's Retry Policy
+
+    Args:
+        max_attempts: Total attempts per call (1 disables retries)
+        backoff: Base wait before the first retry in seconds
+        max_backoff: Longest single wait in seconds
+        connect_timeout: Connect timeout per attempt in seconds
+        read_timeout: Read timeout per attempt in seconds
+        deadline: Total seconds per call including retries and waits
+        statuses: HTTP status codes that are retried
+        jitter: Randomize waits (full jitter) so clients don't retry in lockstep
+    """
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, backoff=BACKOFF, max_backoff=MAX_BACKOFF,
+                 connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT, deadline=DEADLINE,
+                 statuses=RETRY_STATUSES, jitter=True):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.deadline = deadline
+        self.statuses = frozenset(statuses)
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._retries = 0
+        self._retried_calls = 0
+        self._gave_up = 0
+        self._reasons = {}
+
+    def timeouts(self, started):
+        """(connect, read) timeouts for the next attempt, clipped to the deadline"""
+        remaining = max(0.001, self.deadline - (time.monotonic() - started))
+        return min(self.connect_timeout, remaining), min(self.read_timeout, remaining)
+
+    def _delay(self, attempt, started, reason, retry_after=None):
+        """Seconds to wait before retrying, or None to give up"""
+        with self._lock:
+            if attempt + 1 >= self.max_attempts:
+                self._gave_up += 1
+                return None
+
+            delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+            if self.jitter:
+                delay = random.uniform(0, delay)
+            wait = _retry_after_seconds(retry_after)
+            if wait is not None:
+                delay = max(delay, wait)
+
+            if time.monotonic() - started + delay >= self.deadline:
+                self._gave_up += 1
+                return None
+
+            self._retries += 1
+            if attempt == 0:
+                self._retried_calls += 1
+            self._reasons[reason] = self._reasons.get(reason, 0) + 1
+            return delay
+
+    def _count_call(self):
+        with self._lock:
+            self._calls += 1
+
+    def call(self, send, errors):
+        """
+        Run send() until it succeeds or retries run out.
+
+        Args:
+            send: send(started) -> (status, headers, result) for one attempt
+            errors: Exception types that count as transient network errors
+
+        Returns:
+            The last (status, headers, result); the caller raises on bad statuses
+        """
+        self._count_call()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                status, headers, result = send(started)
+            except errors as e:
+                delay = self._delay(attempt, started, type(e).__name__)
+                if delay is None:
+                    raise
+            else:
+                if status not in self.statuses:
+                    return status, headers, result
+                delay = self._delay(attempt, started, status, headers.get('Retry-After'))
+                if delay is None:
+                    return status, headers, result
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, send, errors):
+        """Async version of call() - send(started) is a coroutine function"""
+        self._count_call()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                status, headers, result = await send(started)
+            except errors as e:
+                delay = self._delay(attempt, started, type(e).__name__)
+                if delay is None:
+                    raise
+            else:
+                if status not in self.statuses:
+                    return status, headers, result
+                delay = self._delay(attempt, started, status, headers.get('Retry-After'))
+                if delay is None:
+                    return status, headers, result
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def stats(self):
+        """Retry counters: calls, retries, retried_calls, gave_up and retries by reason"""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "retries": self._retries,
+                "retried_calls": self._retried_calls,
+                "gave_up": self._gave_up,
+                "reasons": dict(self._reasons),
+            }
@@ -0,0 +1,109 @@
+"""
+🌙 Moon Dev's Single-Flight Request Coalescing
+Concurrent callers asking for the same URL share one in-flight request
+
+Built with love by Moon Dev 🚀
+
+Usage:
+    from data_layer.single_flight import SingleFlight
+
+    flight = SingleFlight()
+    data = flight.do(key, fetch)                 # threads
+    data = await flight.do_async(key, fetch)     # asyncio (fetch is async)
+    print(f"{flight.coalesced} requests saved")
+"""
+
+import asyncio
+import threading
+
+
+class _Call:
+    """One in-flight threaded call that followers wait on"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _AsyncCall:
+    """One in-flight asyncio fetch and how many callers still await it"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    🌙 Moon Dev's Single-Flight Group
+
+    The first caller for a key runs the fetch, everyone arriving while it is
+    still in flight waits and gets the same result (or the same exception).
+    Nothing is remembered once the call finishes - that's the cache's job.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._futures = {}
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        """Run fn() once per key across threads and share its result"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key, fn):
+        """Await fn() once per key on this event loop and share its result"""
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        call = self._futures.get(flight_key)
+        if call is None:
+            # The fetch runs as its own task, so cancelling the caller that
+            # started it doesn't cancel it for everyone else
+            call = self._futures[flight_key] = _AsyncCall(loop.create_task(fn()))
+            call.task.add_done_callback(lambda _: self._forget(flight_key, call))
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                # Every caller gave up - stop the fetch and let the next one start fresh
+                self._forget(flight_key, call)
+                call.task.cancel()
+
+    def _forget(self, flight_key, call):
+        if self._futures.get(flight_key) is call:
+            del self._futures[flight_key]
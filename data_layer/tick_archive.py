@@ -0,0 +1,342 @@
+"""
+🌙 Moon Dev's Tick Archive
+Local append-only tick history that outlives the 60-day server retention
+
+Built with love by Moon Dev 🚀
+
+The API only serves rolling windows (10m ... 7d). The archive polls those
+windows for every tracked symbol (HIP3 {dex}:{ticker} included), keeps only
+ticks it hasn't seen yet and appends them as compact binary columns
+partitioned by symbol/day. Query it with the same signature as get_ticks().
+
+Usage:
+    from api import MoonDevAPI
+    from data_layer import TickArchive
+
+    api = MoonDevAPI()
+    archive = TickArchive("~/.moondev/ticks")
+    archive.start_sync(api)                      # Background sync every 30 min
+
+    ticks = archive.get_ticks("BTC", start_time=start_ms, end_time=end_ms, as_frame=True)
+    gold = archive.get_ticks("xyz:GOLD", duration="7d")
+"""
+
+import os
+import time
+import struct
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .columnar import to_frame
+
+# ============================================
+# 🎯 TICK ARCHIVE CONFIGURATION - Moon Dev
+# ============================================
+SYNC_INTERVAL = 1800      # Seconds between background syncs
+SYNC_DURATION = "1h"      # Window fetched per symbol (must be longer than SYNC_INTERVAL)
+SYNC_LIMIT = 100000       # Max ticks per symbol per sync
+DAY_MS = 86_400_000
+
+DURATION_MS = {
+    "10m": 600_000,
+    "1h": 3_600_000,
+    "4h": 14_400_000,
+    "24h": 86_400_000,
+    "7d": 604_800_000,
+}
+
+# Chunk header: tick count, first timestamp (ms), price dtype ("d" or "f").
+# Followed by count-1 int32 timestamp deltas and count prices.
+CHUNK_HEADER = struct.Struct("<Iq1s")
+
+
+class TickSyncError(Exception):
+    """Raised by TickArchive.sync() after every symbol was tried, if any failed"""
+
+    def __init__(self, errors, written):
+        self.errors = errors    # symbol -> exception
+        self.written = written  # symbol -> ticks written, for the symbols that worked
+        failed = ", ".join(f"{symbol} ({error})" for symbol, error in errors.items())
+        super().__init__(f"Tick sync failed for {len(errors)} symbol(s): {failed}")
+
+
+def _empty():
+    return {"time": np.empty(0, dtype=np.int64), "price": np.empty(0, dtype=np.float64)}
+
+
+def _read_partition(path):
+    """Decode every chunk of one symbol/day file into (time, price) arrays"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    times, prices = [], []
+    offset = 0
+    while offset < len(data):
+        count, first, code = CHUNK_HEADER.unpack_from(data, offset)
+        offset += CHUNK_HEADER.size
+
+        deltas = np.frombuffer(data, dtype="<i4", count=count - 1, offset=offset)
+        offset += deltas.nbytes
+        chunk_times = np.empty(count, dtype=np.int64)
+        chunk_times[0] = first
+        chunk_times[1:] = first + np.cumsum(deltas, dtype=np.int64)
+
+        price_dtype = np.dtype("<f8" if code == b"d" else "<f4")
+        chunk_prices = np.frombuffer(data, dtype=price_dtype, count=count, offset=offset)
+        offset += chunk_prices.nbytes
+
+        times.append(chunk_times)
+        prices.append(chunk_prices.astype(np.float64))
+
+    if not times:
+        return _empty()
+    return {"time": np.concatenate(times), "price": np.concatenate(prices)}
+
+
+class TickArchive:
+    """
+    🌙 Moon Dev's Tick Archive
+
+    Layout inside `root`:
+        BTC/2026-01-07.ticks
+        xyz_GOLD/2026-01-07.ticks
+
+    Each .ticks file is a sequence of appended chunks (delta-encoded int32
+    timestamps + float prices). Ticks newer than the newest archived tick of
+    a day are appended as-is. Older ones (an overlapping or earlier window)
+    are checked against the stored (timestamp, price) pairs in that span, so
+    overlapping sync windows never duplicate data and gaps can be backfilled.
+    One process should sync into an archive at a time.
+
+    Args:
+        root: Directory holding the archive (created if missing)
+        price_dtype: "float64" (default) or "float32" to halve price storage
+    """
+
+    def __init__(self, root, price_dtype="float64"):
+        if price_dtype not in ("float64", "float32"):
+            raise ValueError("price_dtype must be 'float64' or 'float32'")
+        self.root = os.path.expanduser(root)
+        os.makedirs(self.root, exist_ok=True)
+        self.price_dtype = np.dtype(price_dtype).newbyteorder("<")
+        self._price_code = b"d" if price_dtype == "float64" else b"f"
+        self._last_time = {}  # (symbol dir, day) -> newest archived tick time
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_error = None  # TickSyncError (or other exception) from the latest background sync
+        self.stats = {"syncs": 0, "ticks_written": 0, "ticks_skipped": 0, "errors": 0}
+
+    # ==================== PARTITIONS ====================
+    def _symbol_dir(self, symbol):
+        """BTC -> BTC, xyz:gold -> xyz_GOLD"""
+        if ":" in symbol:
+            dex, ticker = symbol.split(":", 1)
+            return f"{dex.lower()}_{ticker.upper()}"
+        return symbol.upper()
+
+    def _partition_path(self, symbol_dir, day):
+        day_str = datetime.fromtimestamp(day * DAY_MS / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+        return os.path.join(self.root, symbol_dir, f"{day_str}.ticks")
+
+    def _newest(self, symbol_dir, day):
+        key = (symbol_dir, day)
+        if key not in self._last_time:
+            path = self._partition_path(symbol_dir, day)
+            times = _read_partition(path)["time"] if os.path.exists(path) else None
+            self._last_time[key] = int(times.max()) if times is not None and len(times) else None
+        return self._last_time[key]
+
+    def _unseen(self, symbol_dir, day, times, prices, newest):
+        """Mask of sorted ticks not already stored - only ticks at or before `newest` are looked up"""
+        keep = np.ones(len(times), dtype=bool)
+        overlap = times <= newest
+        stored = _read_partition(self._partition_path(symbol_dir, day))
+        in_span = stored["time"] >= times[0]
+        seen = set(zip(stored["time"][in_span].tolist(), stored["price"][in_span].tolist()))
+
+        # Compare prices as they'd be stored (float32 archives round them)
+        stored_prices = prices[overlap].astype(self.price_dtype).astype(np.float64)
+        flags = []
+        for pair in zip(times[overlap].tolist(), stored_prices.tolist()):
+            flags.append(pair not in seen)
+            seen.add(pair)  # Duplicates inside the batch too
+        keep[overlap] = flags
+        return keep
+
+    # ==================== WRITE ====================
+    def append(self, symbol, times, prices):
+        """
+        Archive ticks for a symbol, skipping any already stored.
+
+        Args:
+            symbol: "BTC" or HIP3 "dex:TICKER"
+            times: Tick timestamps in Unix ms
+            prices: Tick prices
+
+        Returns:
+            Number of ticks written
+        """
+        times = np.asarray(times, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        order = np.argsort(times, kind="stable")
+        times, prices = times[order], prices[order]
+
+        symbol_dir = self._symbol_dir(symbol)
+        os.makedirs(os.path.join(self.root, symbol_dir), exist_ok=True)
+        days = times // DAY_MS
+        written = 0
+
+        with self._lock:
+            for day in np.unique(days).tolist():
+                in_day = days == day
+                day_times, day_prices = times[in_day], prices[in_day]
+                newest = self._newest(symbol_dir, day)
+                if newest is not None and day_times[0] <= newest:
+                    keep = self._unseen(symbol_dir, day, day_times, day_prices, newest)
+                    day_times, day_prices = day_times[keep], day_prices[keep]
+                if not len(day_times):
+                    continue
+
+                deltas = np.diff(day_times).astype("<i4")
+                with open(self._partition_path(symbol_dir, day), "ab") as f:
+                    f.write(CHUNK_HEADER.pack(len(day_times), int(day_times[0]), self._price_code))
+                    f.write(deltas.tobytes())
+                    f.write(day_prices.astype(self.price_dtype).tobytes())
+
+                self._last_time[(symbol_dir, day)] = max(int(day_times[-1]), newest or 0)
+                written += len(day_times)
+
+        self.stats["ticks_written"] += written
+        self.stats["ticks_skipped"] += len(times) - written
+        return written
+
+    # ==================== SYNC ====================
+    def symbols(self, api):
+        """All tracked symbols: the 80 candle/tick symbols plus HIP3 dex:ticker symbols"""
+        crypto = api.get_candle_symbols().get("symbols", [])
+        hip3 = [s for s in api.get_hip3_tick_stats().get("symbols", []) if isinstance(s, str) and ":" in s]
+        return list(crypto) + hip3
+
+    def sync(self, api, symbols=None, duration=SYNC_DURATION, limit=SYNC_LIMIT):
+        """
+        Pull the latest window for each symbol and archive the new ticks.
+
+        Args:
+            api: MoonDevAPI instance
+            symbols: Symbols to sync (default: every tracked symbol)
+            duration: Window to fetch per symbol - must cover the time since the last sync
+            limit: Max ticks per symbol
+
+        Returns:
+            dict of symbol -> ticks written
+
+        Raises:
+            TickSyncError: after trying every symbol, if any of them failed
+        """
+        symbols = symbols or self.symbols(api)
+        written, errors = {}, {}
+        for symbol in symbols:
+            try:
+                if ":" in symbol:
+                    dex, ticker = symbol.split(":", 1)
+                    ticks = api.get_hip3_ticks(dex, ticker, as_arrays=True)
+                else:
+                    ticks = api.get_ticks(symbol, duration, limit=limit, as_arrays=True)
+                written[symbol] = self.append(symbol, ticks["time"], ticks["price"])
+            except Exception as e:
+                self.stats["errors"] += 1
+                errors[symbol] = e
+        self.stats["syncs"] += 1
+        if errors:
+            raise TickSyncError(errors, written)
+        return written
+
+    def start_sync(self, api, interval=SYNC_INTERVAL, symbols=None, duration=SYNC_DURATION):
+        """Run sync() every `interval` seconds on a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return self._thread
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    self.sync(api, symbols, duration)
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = e
+                    print(f"⚠️ {e}")
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=loop, name="moondev-tick-sync", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop_sync(self, timeout=None):
+        """Stop the background sync thread"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ==================== QUERY ====================
+    def read(self, symbol, start_time, end_time):
+        """Archived ticks with start_time <= t <= end_time as time/price arrays"""
+        symbol_dir = self._symbol_dir(symbol)
+        parts = []
+        for day in range(start_time // DAY_MS, end_time // DAY_MS + 1):
+            path = self._partition_path(symbol_dir, day)
+            if os.path.exists(path):
+                parts.append(_read_partition(path))
+        if not parts:
+            return _empty()
+
+        times = np.concatenate([p["time"] for p in parts])
+        prices = np.concatenate([p["price"] for p in parts])
+        keep = (times >= start_time) & (times <= end_time)
+        times, prices = times[keep], prices[keep]
+        order = np.argsort(times, kind="stable")  # Backfilled chunks land after newer ones
+        return {"time": times[order], "price": prices[order]}
+
+    def get_ticks(self, symbol="BTC", duration="1h", limit=10000, start_time=None, end_time=None,
+                  as_frame=False, as_arrays=False):
+        """
+        Archived ticks with the same signature and shape as MoonDevAPI.get_ticks().
+
+        Args:
+            symbol: "BTC" or HIP3 "dex:TICKER"
+            duration: Window ending at end_time - 10m, 1h, 4h, 24h, 7d (ignored with start_time)
+            limit: Max ticks to return (most recent kept)
+            start_time: Start time in Unix ms (optional, overrides duration)
+            end_time: End time in Unix ms (default: now)
+            as_frame: Return a pandas DataFrame instead
+            as_arrays: Return a dict of NumPy arrays instead
+
+        Returns:
+            dict with symbol, duration, tick_count, latest_price and ticks [{t, p}, ...]
+        """
+        end_time = int(time.time() * 1000) if end_time is None else end_time
+        if start_time is None:
+            if duration not in DURATION_MS:
+                raise ValueError(f"Unknown duration {duration!r} (use {', '.join(DURATION_MS)})")
+            start_time = end_time - DURATION_MS[duration]
+
+        ticks = self.read(symbol, start_time, end_time)
+        if limit and limit > 0:
+            ticks = {name: values[-limit:] for name, values in ticks.items()}
+
+        if as_frame:
+            return to_frame(ticks)
+        if as_arrays:
+            return ticks
+
+        rows = [{"t": t, "p": p} for t, p in zip(ticks["time"].tolist(), ticks["price"].tolist())]
+        return {
+            "symbol": symbol,
+            "duration": duration,
+            "tick_count": len(rows),
+            "latest_price": rows[-1]["p"] if rows else None,
+            "ticks": rows,
+        }
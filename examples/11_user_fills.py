@@ -15,11 +15,11 @@ Data Source: Moon Dev's local Hyperliquid node (blazing fast!)
 import sys
 import os
 from datetime import datetime
-from collections import defaultdict
 
 # Add parent directory to path to import api.py
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from api import MoonDevAPI
+from data_layer import fill_columns, fill_stats
 
 from rich.console import Console
 from rich.table import Table
@@ -101,69 +101,8 @@ def format_timestamp(ts):
 
 # ==================== STATS CALCULATION ====================
 def calculate_fill_stats(fills):
-    """Calculate comprehensive stats from fills data"""
-    stats = {
-        'total_fills': len(fills),
-        'total_volume': 0,
-        'total_pnl': 0,
-        'total_fees': 0,
-        'winning_trades': 0,
-        'losing_trades': 0,
-        'buys': 0,
-        'sells': 0,
-        'buy_volume': 0,
-        'sell_volume': 0,
-        'coins': defaultdict(lambda: {'count': 0, 'volume': 0, 'pnl': 0}),
-        'directions': defaultdict(int),
-        'largest_win': 0,
-        'largest_loss': 0,
-        'first_fill': None,
-        'last_fill': None,
-    }
-
-    for fill in fills:
-        px = float(fill.get('px', 0))
-        sz = float(fill.get('sz', 0))
-        volume = px * sz
-        pnl = float(fill.get('closedPnl', 0))
-        fee = float(fill.get('fee', 0))
-        coin = fill.get('coin', 'UNKNOWN')
-        side = fill.get('side', '?')
-        direction = fill.get('dir', 'Unknown')
-        ts = fill.get('time', 0)
-
-        stats['total_volume'] += volume
-        stats['total_pnl'] += pnl
-        stats['total_fees'] += fee
-
-        if pnl > 0:
-            stats['winning_trades'] += 1
-            if pnl > stats['largest_win']:
-                stats['largest_win'] = pnl
-        elif pnl < 0:
-            stats['losing_trades'] += 1
-            if pnl < stats['largest_loss']:
-                stats['largest_loss'] = pnl
-
-        if side == 'B':
-            stats['buys'] += 1
-            stats['buy_volume'] += volume
-        else:
-            stats['sells'] += 1
-            stats['sell_volume'] += volume
-
-        stats['coins'][coin]['count'] += 1
-        stats['coins'][coin]['volume'] += volume
-        stats['coins'][coin]['pnl'] += pnl
-
-        stats['directions'][direction] += 1
-
-        if stats['first_fill'] is None or (ts and ts < stats['first_fill']):
-            stats['first_fill'] = ts
-        if stats['last_fill'] is None or (ts and ts > stats['last_fill']):
-            stats['last_fill'] = ts
-
-    return stats
+    """Calculate comprehensive stats from fills data (vectorized, fine for 30k+ fills)"""
+    return fill_stats(fill_columns(fills))
 
 
 # ==================== DISPLAY FUNCTIONS ====================
@@ -408,7 +347,7 @@ def display_recent_fills(fills, limit=25):
     console.print(table)
 
 
-def display_win_streak_analysis(fills):
+def display_win_streak_analysis(stats):
     """Analyze and display win/loss streaks"""
     console.print(Panel(
         "📊 [bold white]WIN/LOSS STREAK ANALYSIS[/bold white]  [dim cyan]GET https://api.moondev.com/api/user/{address}/fills[/dim cyan]",
@@ -416,35 +355,16 @@ def display_win_streak_analysis(fills):
         padding=(0, 1)
     ))
 
-    current_streak = 0
-    max_win_streak = 0
-    max_loss_streak = 0
-    current_type = None
-
-    for fill in fills:
-        pnl = float(fill.get('closedPnl', 0))
-        if pnl == 0:
-            continue
-
-        if pnl > 0:
-            if current_type == 'win':
-                current_streak += 1
-            else:
-                current_streak = 1
-                current_type = 'win'
-            max_win_streak = max(max_win_streak, current_streak)
-        else:
-            if current_type == 'loss':
-                current_streak += 1
-            else:
-                current_streak = 1
-                current_type = 'loss'
-            max_loss_streak = max(max_loss_streak, current_streak)
+    max_win_streak = stats['max_win_streak']
+    max_loss_streak = stats['max_loss_streak']
+    current_streak = stats['current_streak']
+    current_type = stats['current_type']
 
     lines = [
         f"[bold green]Max Winning Streak:[/bold green] [green]{max_win_streak}[/green] trades in a row",
         f"[bold red]Max Losing Streak:[/bold red] [red]{max_loss_streak}[/red] trades in a row",
         f"[bold cyan]Current Streak:[/bold cyan] [{'green' if current_type == 'win' else 'red'}]{current_streak} {'wins' if current_type == 'win' else 'losses'}[/{'green' if current_type == 'win' else 'red'}]",
+        f"[bold cyan]Max Drawdown:[/bold cyan] [red]{format_usd(stats['max_drawdown'])}[/red] [dim](realized PnL net of fees)[/dim]",
     ]
 
     console.print("\n".join(lines))
@@ -532,7 +452,7 @@ def main():
     display_direction_breakdown(stats)
     console.print()
 
-    display_win_streak_analysis(fills)
+    display_win_streak_analysis(stats)
     console.print()
 
     display_recent_fills(fills, limit=30)
@@ -0,0 +1,78 @@
+"""
+🌙 Moon Dev's SingleFlight tests
+Run with: python -m pytest tests/
+"""
+
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_layer.single_flight import SingleFlight
+
+
+def test_cancelled_leader_does_not_fail_followers():
+    async def scenario():
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "data"
+
+        leader = asyncio.create_task(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        assert await follower == "data"
+        assert leader.cancelled()
+        assert len(calls) == 1 and flight.coalesced == 1
+
+    asyncio.run(scenario())
+
+
+def test_fetch_cancelled_once_every_caller_gives_up():
+    async def scenario():
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flight.do_async("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert not flight._futures
+
+    asyncio.run(scenario())
+
+
+def test_errors_are_shared():
+    async def scenario():
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.do_async("key", fetch) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_cancelled_leader_does_not_fail_followers()
+    test_fetch_cancelled_once_every_caller_gives_up()
+    test_errors_are_shared()
+    print("✅ SingleFlight tests passed")